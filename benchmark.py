@@ -0,0 +1,355 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from google_forms import __version__, create_google_apps_script
+
+
+# each line starts like one of the line kinds but never completes it, which is
+# where backtracking patterns blow up
+_pathological_lines = {
+    'unclosed paragraph (spaces)': lambda n: '```' + ' ' * n + 'x',
+    'unclosed paragraph (text)': lambda n: '```' + 'a ' * (n // 2),
+    'unclosed short text': lambda n: '`' + ' ' * n,
+    'unclosed confirmation message': lambda n: '_' + ' ' * n,
+    'navigation brackets': lambda n: '### Question\n* ' + 'a [' * (n // 3),
+    'checkbox brackets': lambda n: '[ ' + '[ ' * (n // 2),
+    'scale digits': lambda n: 'a ' + '1' * n + ' --',
+    'scale separators': lambda n: 'a 1' + ' --- 1' * (n // 6),
+}
+
+
+def _time_conversion(markdown_file: str, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        create_google_apps_script(markdown_file)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def _run_pathological(args: argparse.Namespace) -> int:
+    # converts adversarial lines of growing length and checks that the time per
+    # character stays roughly constant, i.e. that conversion time grows linearly
+    lengths = [args.min_length * 2 ** i for i in range(args.steps)]
+    failed = False
+
+    print(f'{"line":<32}' + ''.join(f'{n:>12}' for n in lengths) + f'{"ratio":>8}')
+    for name, make_line in _pathological_lines.items():
+        times = [_time_conversion(make_line(n), args.repeat) for n in lengths]
+        # time per character of the longest line relative to the shortest one
+        ratio = (times[-1] / lengths[-1]) / (times[0] / lengths[0])
+        status = 'ok' if ratio <= args.max_ratio else 'FAIL'
+        failed |= status == 'FAIL'
+        print(f'{name:<32}' + ''.join(f'{t * 1e3:>10.3f}ms' for t in times) + f'{ratio:>8.2f} {status}')
+
+    return 1 if failed else 0
+
+
+@dataclass
+class SyntheticForm:
+    sections: int = 10
+    items_per_section: int = 20
+    choices: int = 5
+    grid_rows: int = 0
+    grid_columns: int = 0
+    # number of choices of each list that navigate to another section
+    navigation_choices: int = 0
+
+    def markdown(self) -> str:
+        # the items of each section cycle through all item kinds. when there are
+        # grid rows and columns every other item is a grid instead
+        lines = ['# Synthetic form', '', '_Thanks!_', '', 'Form description', '']
+        lines.extend(f'- Section {s}' for s in range(self.sections))
+
+        for s in range(self.sections):
+            lines.extend(['', f'## Section {s}', '', f'Description of section {s}'])
+
+            for i in range(self.items_per_section):
+                title = f'Question {s}.{i}'
+                lines.extend(['', f'### **{title}**' if i % 3 == 0 else f'### {title}', '',
+                              f'Description of {title}', ''])
+
+                if self.grid_rows > 0 and self.grid_columns > 0 and i % 2 == 1:
+                    lines.append('#### [] Rows' if i % 4 == 1 else '#### Rows')
+                    lines.extend(f'- Row {r}' for r in range(self.grid_rows))
+                    lines.append('#### [] Columns' if i % 4 == 1 else '#### Columns')
+                    lines.extend(f'- Column {c}' for c in range(self.grid_columns))
+                    continue
+
+                kind = i % 9
+                if kind < 3:
+                    prefix = ('* ', '- ', '- [ ] ')[kind]
+                    for c in range(self.choices):
+                        if c < self.navigation_choices:
+                            lines.append(f'{prefix}Option {c} [Section {(s + c + 1) % self.sections}]')
+                        else:
+                            lines.append(f'{prefix}Option {c}')
+
+                else:
+                    lines.append(('`Short answer`', '```Long answer```', 'Lowest 1 --- 5 Highest', 'dd/mm/yyyy',
+                                  'hh:mm', 'dd/mm/yyyy hh:mm')[kind - 3])
+
+        return '\n'.join(lines)
+
+
+_synthetic_forms = {
+    'small': SyntheticForm(sections=2, items_per_section=10),
+    'medium': SyntheticForm(sections=10, items_per_section=50),
+    'large': SyntheticForm(sections=40, items_per_section=50),
+    'many choices': SyntheticForm(sections=10, items_per_section=50, choices=50),
+    'grids': SyntheticForm(sections=10, items_per_section=50, grid_rows=10, grid_columns=10),
+    'navigation': SyntheticForm(sections=20, items_per_section=50, choices=10, navigation_choices=10),
+}
+
+
+def _measure_synthetic(name: str, form: SyntheticForm, repeat: int) -> dict:
+    markdown_file = form.markdown()
+    lines = markdown_file.count('\n') + 1
+    elapsed = _time_conversion(markdown_file, repeat)
+
+    # tracing allocations slows everything down, so memory is measured apart
+    tracemalloc.start()
+    script = create_google_apps_script(markdown_file)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'name': name,
+        'form': asdict(form),
+        'lines': lines,
+        'input_bytes': len(markdown_file.encode()),
+        'output_bytes': len(script.encode()),
+        'seconds': elapsed,
+        'lines_per_second': lines / elapsed,
+        'peak_memory_bytes': peak_memory,
+    }
+
+
+def _run_synthetic(args: argparse.Namespace) -> int:
+    # measures throughput and peak memory of conversions of synthetic forms, and
+    # compares them with the results of a previous run if one is given
+    if args.form is not None:
+        forms = {'custom': SyntheticForm(*args.form)}
+    else:
+        forms = _synthetic_forms
+
+    previous = {}
+    if args.compare is not None:
+        previous = {r['name']: r for r in json.loads(Path(args.compare).read_text())['results']}
+
+    results = []
+    regressions = 0
+
+    print(f'{"form":<14}{"lines":>9}{"lines/s":>12}{"peak memory":>14}{"vs previous":>20}')
+    for name, form in forms.items():
+        result = _measure_synthetic(name, form, args.repeat)
+        results.append(result)
+
+        change = ''
+        if name in previous:
+            ratio = result['lines_per_second'] / previous[name]['lines_per_second']
+            change = f'{ratio - 1:+.1%}'
+            if ratio < 1 - args.tolerance:
+                change += ' SLOWER'
+                regressions += 1
+
+        print(f'{name:<14}{result["lines"]:>9}{result["lines_per_second"]:>12,.0f}'
+              f'{result["peak_memory_bytes"] / 2**20:>12.1f}MB{change:>20}')
+
+    if args.output is not None:
+        Path(args.output).write_text(json.dumps({
+            'version': __version__,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': time.time(),
+            'results': results,
+        }, indent=2))
+
+    return 1 if regressions > 0 else 0
+
+
+# milliseconds importing google_forms or main may take, checked by the test suite
+# too, since most of the cold start of a single conversion is spent importing
+_startup_budget_ms = 100.0
+
+
+def _import_times(module: str) -> dict[str, tuple[int, int]]:
+    # self and cumulative microseconds spent importing module and every module it
+    # imports, as reported by python -X importtime in a fresh interpreter. bytecode
+    # is always cached, otherwise every run would time compiling the sources
+    env = {name: value for name, value in os.environ.items() if name != 'PYTHONDONTWRITEBYTECODE'}
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, check=True, cwd=Path(__file__).parent, env=env)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+
+        self_time, cumulative_time, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_time), int(cumulative_time))
+
+    return times
+
+
+def _time_cli(markdown_file: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, 'main.py', '-'], input=markdown_file, capture_output=True, text=True,
+                   check=True, cwd=Path(__file__).parent)
+    return time.perf_counter() - start
+
+
+def _run_startup(args: argparse.Namespace) -> int:
+    # measures how long importing each module takes in a fresh interpreter, which
+    # is most of the cold start of short lived processes converting one file, and
+    # fails if any of them takes longer than the budget. the modules that take the
+    # longest to import on their own are listed, as candidates to import lazily
+    failed = False
+
+    print(f'{"module":<24}{"import":>12}{"budget":>12}')
+    for module in args.modules:
+        runs = [_import_times(module) for _ in range(args.repeat)]
+        best = {name: min(run[name] for run in runs if name in run) for name in runs[0]}
+        elapsed = best[module][1] / 1e3
+        status = 'ok' if elapsed <= args.max_ms else 'FAIL'
+        failed |= status == 'FAIL'
+        print(f'{module:<24}{elapsed:>10.1f}ms{args.max_ms:>10.1f}ms {status}')
+
+        slowest = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:args.slowest]
+        for name, (self_time, _) in slowest:
+            print(f'  {name:<22}{self_time / 1e3:>10.1f}ms')
+
+    # the whole command line conversion of a small form, interpreter start included
+    markdown_file = _synthetic_forms['small'].markdown()
+    elapsed = min(_time_cli(markdown_file) for _ in range(args.repeat))
+    print(f'{"main.py (small form)":<24}{elapsed * 1e3:>10.1f}ms')
+
+    return 1 if failed else 0
+
+
+def _post(url: str, markdown_file: str, timeout: float) -> tuple[int, float]:
+    request = urllib.request.Request(url, markdown_file.encode(), {'Content-Type': 'text/markdown'})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            status = response.status
+
+    except urllib.error.HTTPError as e:
+        status = e.code
+
+    except (urllib.error.URLError, TimeoutError):
+        # no answer at all
+        status = 0
+
+    return status, time.perf_counter() - start
+
+
+def _run_load(args: argparse.Namespace) -> int:
+    # sends conversions to a running server from many clients at once, reporting the
+    # answers and the latency percentiles. unique documents are never in the cache
+    form = SyntheticForm(*args.form)
+    markdown_file = form.markdown()
+    if args.unique:
+        documents = [markdown_file.replace('# Synthetic form', f'# Synthetic form {i}', 1)
+                     for i in range(args.requests)]
+    else:
+        documents = [markdown_file] * args.requests
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.concurrency) as executor:
+        results = list(executor.map(lambda document: _post(args.url, document, args.timeout), documents))
+
+    elapsed = time.perf_counter() - start
+
+    statuses = Counter(status for status, _ in results)
+    latencies = sorted(latency for _, latency in results)
+    percentiles = statistics.quantiles(latencies, n=100, method='inclusive') if len(latencies) > 1 else latencies * 99
+
+    print(f'{args.requests} requests from {args.concurrency} clients in {elapsed:.2f}s '
+          f'({args.requests / elapsed:.1f} requests/s)')
+    print('status: ' + ', '.join(f'{status if status != 0 else "no answer"}: {count}'
+                                 for status, count in sorted(statuses.items())))
+    print(f'latency: p50 {percentiles[49] * 1e3:.1f}ms, p90 {percentiles[89] * 1e3:.1f}ms, '
+          f'p99 {percentiles[98] * 1e3:.1f}ms, max {latencies[-1] * 1e3:.1f}ms')
+
+    # a server under too much load should reject requests, not fail or drop them
+    return 1 if any(status == 0 or (status >= 500 and status != 503) for status in statuses) else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    pathological_parser = subparsers.add_parser('pathological',
+                                                help='check that adversarial lines are converted in linear time')
+    pathological_parser.add_argument('--min_length', type=int, default=1_000,
+                                     help='length of the shortest line')
+    pathological_parser.add_argument('--steps', type=int, default=6,
+                                     help='number of lengths, doubling each time')
+    pathological_parser.add_argument('--repeat', type=int, default=5,
+                                     help='repetitions per length, the best time is kept')
+    pathological_parser.add_argument('--max_ratio', type=float, default=4.0,
+                                     help='maximum growth of the time per character between the shortest and '
+                                          'longest lines')
+    pathological_parser.set_defaults(run=_run_pathological)
+
+    synthetic_parser = subparsers.add_parser('synthetic',
+                                             help='measure throughput and peak memory on synthetic forms')
+    synthetic_parser.add_argument('--form', type=int, nargs=6,
+                                  metavar=('SECTIONS', 'ITEMS', 'CHOICES', 'ROWS', 'COLUMNS', 'NAVIGATION'),
+                                  help='benchmark only a form with these sizes, instead of the predefined ones')
+    synthetic_parser.add_argument('--repeat', type=int, default=10,
+                                  help='repetitions per form, the best time is kept')
+    synthetic_parser.add_argument('-o', '--output', type=str,
+                                  help='json file where the results are saved')
+    synthetic_parser.add_argument('--compare', type=str,
+                                  help='json file with the results of a previous run to compare with')
+    synthetic_parser.add_argument('--tolerance', type=float, default=0.2,
+                                  help='slowdown relative to the previous run that is reported as a regression')
+    synthetic_parser.set_defaults(run=_run_synthetic)
+
+    startup_parser = subparsers.add_parser('startup',
+                                           help='check that importing the converter stays within a time budget')
+    startup_parser.add_argument('--modules', type=str, nargs='+', default=['google_forms', 'main'],
+                                help='modules whose import is timed')
+    startup_parser.add_argument('--max_ms', type=float, default=_startup_budget_ms,
+                                help='maximum milliseconds importing each module may take')
+    startup_parser.add_argument('--repeat', type=int, default=10,
+                                help='repetitions per module, the best time is kept')
+    startup_parser.add_argument('--slowest', type=int, default=5,
+                                help='number of slowest imports listed for each module')
+    startup_parser.set_defaults(run=_run_startup)
+
+    load_parser = subparsers.add_parser('load',
+                                        help='measure the latency of a running server under concurrent load')
+    load_parser.add_argument('--url', type=str, default='http://localhost:5000/api/convert',
+                             help='conversion endpoint of the server')
+    load_parser.add_argument('-c', '--concurrency', type=int, default=16,
+                             help='number of clients sending requests at the same time')
+    load_parser.add_argument('-n', '--requests', type=int, default=200,
+                             help='total number of requests')
+    load_parser.add_argument('--form', type=int, nargs=6, default=[10, 50, 5, 0, 0, 0],
+                             metavar=('SECTIONS', 'ITEMS', 'CHOICES', 'ROWS', 'COLUMNS', 'NAVIGATION'),
+                             help='sizes of the synthetic form sent')
+    load_parser.add_argument('--unique', action='store_true',
+                             help='send a different document in every request, so none is found in the cache')
+    load_parser.add_argument('--timeout', type=float, default=60.0,
+                             help='seconds to wait for each answer')
+    load_parser.set_defaults(run=_run_load)
+
+    args = parser.parse_args()
+    sys.exit(args.run(args))
@@ -0,0 +1,89 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from google_forms import __version__
+
+
+def content_key(markdown_file: str, *options: Any) -> str:
+    # the converter version is part of the key, so cached scripts are never reused
+    # after the generated code changes
+    digest = hashlib.sha256(__version__.encode())
+    for option in options:
+        digest.update(b'\0' + repr(option).encode())
+
+    digest.update(b'\0' + markdown_file.encode())
+    return digest.hexdigest()
+
+
+class LRUCache:
+    # least recently used cache, limited both by the number of entries and by the
+    # sum of the sizes of the values, as given by size_of. safe to use from threads
+    def __init__(self, max_entries: int = 128, max_bytes: int = 32 * 2**20,
+                 size_of: Callable[[Any], int] = len):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size_of = size_of
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size = self._size_of(value)
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+
+            # values that alone exceed the limit would only evict everything else
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (value, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def get_or_create(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        # create runs outside the lock, so two threads missing the same key at the
+        # same time may both create the value
+        value = self.get(key)
+        if value is None:
+            value = create()
+            self.put(key, value)
+
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def info(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
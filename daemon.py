@@ -0,0 +1,234 @@
+import json
+import logging
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+
+from cache import LRUCache, content_key
+from google_forms import ConversionStats, create_google_apps_script
+from incremental import IncrementalConverter
+from validate import validate_markdown
+
+
+_logger = logging.getLogger(__name__)
+
+# where the daemon listens when no socket is given, shared with daemon_client.py
+DEFAULT_SOCKET = str(Path(tempfile.gettempdir()) / 'markdown-to-google-forms.sock')
+
+# longer request lines are answered with an error and their connection is closed
+MAX_REQUEST_BYTES = 16 * 2**20
+
+
+class _InvalidRequest(Exception):
+    pass
+
+
+def _options(request: dict) -> tuple[bool, bool, int | None]:
+    compact = request.get('compact', False)
+    share_choices = request.get('share_choices', False)
+    chunk_size = request.get('chunk_size')
+    if not isinstance(compact, bool) or not isinstance(share_choices, bool):
+        raise _InvalidRequest('compact and share_choices must be booleans')
+
+    if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 1):
+        raise _InvalidRequest('chunk_size must be a positive integer')
+
+    return compact, share_choices, chunk_size
+
+
+def diagnostics(markdown_file: str, include_dir: Path | None = None) -> list[dict]:
+    # problems that make the script of the markdown fail or misbehave when it runs,
+    # with their line, column and severity, see validate_markdown
+    return [asdict(diagnostic) for diagnostic in validate_markdown(markdown_file, include_dir)]
+
+
+class ConversionDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    # keeps the converter imported and its caches warm between conversions, for
+    # editors converting a form whenever it is saved. clients send one json request
+    # per line and get one json reply per line, with the id of the request:
+    #
+    #   {"id": 1, "method": "convert", "markdown": "...", "compact": false, "share_choices": false, "chunk_size": null}
+    #   {"id": 1, "script": "...", "ms": 0.4}
+    #   {"id": 2, "method": "diagnostics", "markdown": "..."}
+    #   {"id": 2, "diagnostics": [{"line": 3, "column": 1, "message": "...", "severity": "error"}], "ms": 0.1}
+    #   {"id": 3, "method": "stats"}
+    #   {"id": 3, "stats": {...}, "ms": 0.0}
+    #
+    # convert and diagnostics requests may give the "path" of the markdown file,
+    # which enables the files it includes, relative to it
+    #
+    # requests that fail are answered with {"id": ..., "error": "..."}. the requests
+    # of a connection run concurrently, so replies may come in a different order
+    daemon_threads = True
+    # connections to a full backlog of a unix socket fail right away, instead of waiting
+    request_queue_size = 128
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, workers: int = 4):
+        _remove_stale_socket(socket_path)
+        super().__init__(socket_path, _DaemonHandler)
+        os.chmod(socket_path, 0o600)
+        self.socket_path = socket_path
+        self.executor = ThreadPoolExecutor(workers)
+        # documents edited a little since their last conversion only regenerate the
+        # sections that changed. the sections of every converter are kept in the same
+        # cache, since sections including files are never cached
+        self.cache = LRUCache(max_entries=256, max_bytes=64 * 2**20)
+        self.section_cache = LRUCache(max_entries=4096, max_bytes=64 * 2**20, size_of=lambda value: len(value[0]))
+        self.converters = {}
+        self.stats = ConversionStats()
+        self.requests = 0
+        self.stats_lock = threading.Lock()
+
+        # the first conversion compiles the regular expressions and fills the caches
+        # of the interpreter, which would otherwise slow down the first request
+        create_google_apps_script(Path(__file__).with_name('sample.md').read_text())
+
+    def convert(self, markdown_file: str, compact: bool = False, share_choices: bool = False,
+                chunk_size: int | None = None, include_dir: Path | None = None) -> str:
+        def create() -> str:
+            stats = ConversionStats()
+            if chunk_size is not None:
+                # chunked scripts are not converted incrementally
+                script = create_google_apps_script(markdown_file, chunk_size=chunk_size, share_choices=share_choices,
+                                                   compact=compact, stats=stats, include_dir=include_dir)
+            else:
+                key = (share_choices, compact, include_dir)
+                with self.stats_lock:
+                    if key not in self.converters:
+                        self.converters[key] = IncrementalConverter(self.section_cache, share_choices, compact,
+                                                                    include_dir)
+
+                script = self.converters[key].convert(markdown_file, stats)
+
+            with self.stats_lock:
+                self.stats.update(stats)
+
+            return script
+
+        if include_dir is not None and '<!--' in markdown_file:
+            # the included files may have changed since the script was cached
+            return create()
+
+        return self.cache.get_or_create(content_key(markdown_file, compact, share_choices, chunk_size), create)
+
+    def answer(self, request: dict) -> dict:
+        method = request.get('method')
+        if method == 'stats':
+            with self.stats_lock:
+                return {'stats': {'requests': self.requests, 'conversions': self.stats.conversions,
+                                  'lines': self.stats.lines, 'cache': self.cache.info()}}
+
+        markdown_file = request.get('markdown')
+        if not isinstance(markdown_file, str):
+            raise _InvalidRequest('markdown must be a string')
+
+        path = request.get('path')
+        if path is not None and not isinstance(path, str):
+            raise _InvalidRequest('path must be a string')
+
+        include_dir = None if path is None else Path(path).parent
+        if method == 'convert':
+            return {'script': self.convert(markdown_file, *_options(request), include_dir)}
+
+        if method == 'diagnostics':
+            return {'diagnostics': diagnostics(markdown_file, include_dir)}
+
+        raise _InvalidRequest(f'unknown method {method!r}, expected convert, diagnostics or stats')
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+        Path(self.socket_path).unlink(missing_ok=True)
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    # a socket left behind by a daemon that did not stop cleanly is removed, but
+    # not one another daemon is still listening on
+    if not os.path.exists(socket_path):
+        return
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(socket_path)
+            return
+
+    raise OSError(f'A daemon is already listening on {socket_path}')
+
+
+class _DaemonHandler(socketserver.StreamRequestHandler):
+    def setup(self) -> None:
+        super().setup()
+        self.write_lock = threading.Lock()
+
+    def _reply(self, reply: dict) -> None:
+        data = json.dumps(reply, ensure_ascii=False).encode() + b'\n'
+        with self.write_lock:
+            try:
+                self.wfile.write(data)
+                self.wfile.flush()
+
+            except OSError:
+                # the client went away, its other replies are dropped too
+                pass
+
+    def _run(self, request: dict) -> None:
+        start = time.perf_counter()
+        try:
+            reply = self.server.answer(request)
+
+        except _InvalidRequest as e:
+            reply = {'error': str(e)}
+
+        except Exception as e:
+            reply = {'error': f'{type(e).__name__}: {e}'}
+            _logger.debug('Error answering %s', request.get('method'), exc_info=e)
+
+        self._reply({'id': request.get('id'), **reply, 'ms': (time.perf_counter() - start) * 1e3})
+
+    def handle(self) -> None:
+        futures = []
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+            if len(line) == 0:
+                break
+
+            if len(line) > MAX_REQUEST_BYTES:
+                self._reply({'id': None, 'error': f'requests can have at most {MAX_REQUEST_BYTES} bytes'})
+                break
+
+            if len(line.strip()) == 0:
+                continue
+
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError('requests must be json objects')
+
+            except ValueError as e:
+                self._reply({'id': None, 'error': f'invalid request: {e}'})
+                continue
+
+            with self.server.stats_lock:
+                self.server.requests += 1
+
+            futures = [future for future in futures if not future.done()]
+            futures.append(self.server.executor.submit(self._run, request))
+
+        # the connection is closed only after answering everything it asked for
+        for future in futures:
+            future.result()
+
+
+def serve(socket_path: str = DEFAULT_SOCKET, workers: int = 4) -> None:
+    with ConversionDaemon(socket_path, workers) as daemon:
+        print(f'Converting markdown sent to {socket_path}', flush=True)
+        daemon.serve_forever()
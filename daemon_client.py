@@ -0,0 +1,91 @@
+import argparse
+import itertools
+import json
+import socket
+import sys
+from pathlib import Path
+
+from daemon import DEFAULT_SOCKET
+
+
+class DaemonClient:
+    # connection to a daemon started with main.py --serve. requests are sent one at
+    # a time, so replies come back in order
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, timeout: float | None = 60.0):
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect(socket_path)
+        self._file = self._socket.makefile('rwb')
+        self._ids = itertools.count(1)
+
+    def request(self, method: str, **fields) -> dict:
+        request_id = next(self._ids)
+        self._file.write(json.dumps({'id': request_id, 'method': method, **fields}).encode() + b'\n')
+        self._file.flush()
+
+        line = self._file.readline()
+        if len(line) == 0:
+            raise ConnectionError('The daemon closed the connection')
+
+        reply = json.loads(line)
+        if 'error' in reply:
+            raise RuntimeError(reply['error'])
+
+        return reply
+
+    def convert(self, markdown_file: str, compact: bool = False, share_choices: bool = False,
+                chunk_size: int | None = None, path: str | None = None) -> str:
+        # path of the markdown file, which enables the files it includes
+        return self.request('convert', markdown=markdown_file, compact=compact, share_choices=share_choices,
+                            chunk_size=chunk_size, path=path)['script']
+
+    def diagnostics(self, markdown_file: str, path: str | None = None) -> list[dict]:
+        return self.request('diagnostics', markdown=markdown_file, path=path)['diagnostics']
+
+    def close(self) -> None:
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self) -> 'DaemonClient':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Convert markdown with a daemon started with main.py --serve')
+    parser.add_argument('markdown_file', type=str, nargs='?', default='-',
+                        help='path to markdown file, or - to read from stdin')
+    parser.add_argument('--socket', type=str, default=DEFAULT_SOCKET,
+                        help='unix socket the daemon listens on')
+    parser.add_argument('-c', '--chunk_size', type=int,
+                        help='create the form in chunks of this many items')
+    parser.add_argument('-s', '--share_choices', action='store_true',
+                        help='define identical choice, row and column lists once and share them between items')
+    parser.add_argument('--compact', action='store_true',
+                        help='generate the script without indentation, blank lines or long variable names')
+    parser.add_argument('--diagnostics', action='store_true',
+                        help='print the problems found in the markdown instead of converting it')
+    parser.add_argument('--stats', action='store_true',
+                        help='print the stats of the daemon instead of converting anything')
+    args = parser.parse_args()
+
+    with DaemonClient(args.socket) as client:
+        if args.stats:
+            json.dump(client.request('stats')['stats'], sys.stdout, indent=2)
+            print()
+            sys.exit(0)
+
+        markdown_file = sys.stdin.read() if args.markdown_file == '-' else Path(args.markdown_file).read_text()
+        # the daemon may run in another directory
+        path = str(Path(args.markdown_file if args.markdown_file != '-' else 'stdin.md').resolve())
+        if args.diagnostics:
+            problems = client.diagnostics(markdown_file, path)
+            for problem in problems:
+                print(f'{args.markdown_file}:{problem["line"]}:{problem["column"]}: {problem["severity"]}: '
+                      f'{problem["message"]}')
+
+            sys.exit(1 if any(problem['severity'] == 'error' for problem in problems) else 0)
+
+        print(client.convert(markdown_file, args.compact, args.share_choices, args.chunk_size, path))
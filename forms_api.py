@@ -0,0 +1,400 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from google_forms import Form, Item, ItemKind, Section, form_items, iter_lines, parse_markdown
+
+
+_logger = logging.getLogger(__name__)
+
+# https://developers.google.com/forms/api/reference/rest
+FORMS_API_ENDPOINT = 'https://forms.googleapis.com/v1'
+
+# requests sent in each call to forms.batchUpdate. forms with more items are
+# created in a few calls, one after the other
+DEFAULT_BATCH_SIZE = 500
+
+# the question of each kind of item, as in the Question resource of the api. lists
+# and checkboxes are radio buttons, like the items the scripts create, so both
+# backends create the same form
+# https://developers.google.com/forms/api/reference/rest/v1/forms#question
+_questions = {
+    ItemKind.SHORT_TEXT: lambda item: {'textQuestion': {'paragraph': False}},
+    ItemKind.PARAGRAPH_TEXT: lambda item: {'textQuestion': {'paragraph': True}},
+    ItemKind.MULTIPLE_CHOICE: lambda item: {'choiceQuestion': {'type': 'RADIO'}},
+    ItemKind.CHECKBOX: lambda item: {'choiceQuestion': {'type': 'RADIO'}},
+    ItemKind.LIST: lambda item: {'choiceQuestion': {'type': 'RADIO'}},
+    ItemKind.SCALE: lambda item: {'scaleQuestion': {'low': item.min_value, 'high': item.max_value,
+                                                    'lowLabel': item.min_label, 'highLabel': item.max_label}},
+    ItemKind.DATE: lambda item: {'dateQuestion': {'includeTime': False, 'includeYear': True}},
+    ItemKind.TIME: lambda item: {'timeQuestion': {'duration': False}},
+    ItemKind.DATE_TIME: lambda item: {'dateQuestion': {'includeTime': True, 'includeYear': True}},
+    ItemKind.DURATION: lambda item: {'timeQuestion': {'duration': True}},
+}
+
+# the type of the columns of each kind of grid
+# https://developers.google.com/forms/api/reference/rest/v1/forms#grid
+_grid_types = {
+    ItemKind.GRID: 'RADIO',
+    ItemKind.CHECKBOX_GRID: 'CHECKBOX',
+}
+
+
+def _page_break_id(index: int, title: str) -> str:
+    # ids of new items may be chosen by whoever creates them. choosing the ones of
+    # the page breaks lets choices navigate to them in the same batch
+    return hashlib.sha256(f'{index}:{title}'.encode()).hexdigest()[:8]
+
+
+def create_item(item: Item, index: int, page_break_ids: dict[str, str]) -> dict:
+    # https://developers.google.com/forms/api/reference/rest/v1/forms/request#createitemrequest
+    body = {'title': item.title}
+    if len(item.description) > 0:
+        body['description'] = item.description
+
+    if item.kind == ItemKind.TITLE_AND_DESCRIPTION:
+        body['textItem'] = {}
+
+    elif item.kind in _grid_types:
+        body['questionGroupItem'] = {
+            'questions': [{'required': item.required, 'rowQuestion': {'title': row}} for row in item.rows],
+            'grid': {'columns': {'type': _grid_types[item.kind],
+                                 'options': [{'value': column} for column in item.columns]}},
+        }
+
+    else:
+        question = _questions[item.kind](item)
+        if 'choiceQuestion' in question:
+            options = []
+            for choice in item.choices:
+                option = {'value': choice.value}
+                if choice.section is not None:
+                    if choice.section not in page_break_ids:
+                        raise ValueError(f'Choice "{choice.value}" navigates to section "{choice.section}", which '
+                                         f'is not in the list of sections of the form')
+
+                    option['goToSectionId'] = page_break_ids[choice.section]
+
+                options.append(option)
+
+            question['choiceQuestion']['options'] = options
+
+        body['questionItem'] = {'question': {'required': item.required, **question}}
+
+    return {'createItem': {'item': body, 'location': {'index': index}}}
+
+
+def form_requests(form: Form) -> list[dict]:
+    # the requests of a forms.batchUpdate turning an empty form into the one
+    # described by form. page breaks are created first, in their order in the form,
+    # so every choice can navigate to them. then every other item is inserted at
+    # its final index, which always lands it between the right page breaks, since
+    # all the items before it are already there
+    if form.title is None:
+        raise ValueError('The markdown has no main title, so there is no form to create')
+
+    requests = []
+    if len(form.description) > 0:
+        # https://developers.google.com/forms/api/reference/rest/v1/forms/request#updateforminforequest
+        requests.append({'updateFormInfo': {'info': {'description': form.description}, 'updateMask': 'description'}})
+
+    if len(form.confirmation_message) > 0:
+        _logger.warning('The Forms API can not set the confirmation message, set it by hand after creating the form')
+
+    items = form_items(form)
+    page_break_ids = {}
+    # page breaks with the same title are all created, but only the last is kept in page_break_ids
+    page_breaks = 0
+    for i, item in enumerate(items):
+        if isinstance(item, Section):
+            item_id = _page_break_id(i, item.title)
+            body = {'itemId': item_id, 'title': item.title, 'pageBreakItem': {}}
+            if len(item.description) > 0:
+                body['description'] = item.description
+
+            requests.append({'createItem': {'item': body, 'location': {'index': page_breaks}}})
+            page_breaks += 1
+            # choices navigate to the last page break with that title, like sections["title"]
+            page_break_ids[item.title] = item_id
+
+    for i, item in enumerate(items):
+        if isinstance(item, Item):
+            requests.append(create_item(item, i, page_break_ids))
+
+    return requests
+
+
+def create_form_body(form: Form) -> dict:
+    # only the title can be given when creating a form, everything else is added
+    # by forms.batchUpdate
+    # https://developers.google.com/forms/api/reference/rest/v1/forms/create
+    return {'info': {'title': form.title, 'documentTitle': form.title}}
+
+
+def batch_update_bodies(requests: list[dict], batch_size: int = DEFAULT_BATCH_SIZE) -> list[dict]:
+    # https://developers.google.com/forms/api/reference/rest/v1/forms/batchUpdate
+    return [{'includeFormInResponse': False, 'requests': requests[i:i + batch_size]}
+            for i in range(0, len(requests), batch_size)]
+
+
+def _call(url: str, body: dict, token: str, timeout: float) -> dict:
+    request = urllib.request.Request(url, json.dumps(body).encode(), {'Authorization': f'Bearer {token}',
+                                                                      'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read())
+
+    except urllib.error.HTTPError as e:
+        raise RuntimeError(f'{url} answered {e.code}: {e.read().decode(errors="replace")}') from e
+
+
+def create_form(form: Form, token: str, endpoint: str = FORMS_API_ENDPOINT, batch_size: int = DEFAULT_BATCH_SIZE,
+                timeout: float = 60.0) -> dict:
+    # creates the form with the Forms API, authorized by an OAuth access token with
+    # the forms.body scope, in 1 + len(items) / batch_size calls instead of the
+    # many calls of a script. returns the created form, with its formId and
+    # responderUri. a failed batch leaves the form created up to the batch before
+    requests = form_requests(form)
+    created = _call(f'{endpoint}/forms', create_form_body(form), token, timeout)
+    for body in batch_update_bodies(requests, batch_size):
+        _call(f'{endpoint}/forms/{created["formId"]}:batchUpdate', body, token, timeout)
+
+    return created
+
+
+class _InvalidRequest(Exception):
+    pass
+
+
+def _check(condition: bool, message: str) -> None:
+    if not condition:
+        raise _InvalidRequest(message)
+
+
+def _check_options(options: list, path: str) -> None:
+    _check(isinstance(options, list) and len(options) > 0, f'{path}: at least one option is required')
+    values = [option.get('value') for option in options]
+    _check(all(isinstance(value, str) and len(value) > 0 for value in values), f'{path}: options need a value')
+    _check(len(set(values)) == len(values), f'{path}: duplicate option values')
+
+
+def _check_item(item: dict, path: str, page_break_ids: set[str]) -> None:
+    kinds = [key for key in ('questionItem', 'questionGroupItem', 'pageBreakItem', 'textItem') if key in item]
+    _check(len(kinds) == 1, f'{path}: exactly one kind of item is required, got {kinds}')
+    _check(isinstance(item.get('title', ''), str), f'{path}.title: must be a string')
+
+    if 'questionItem' in item:
+        question = item['questionItem'].get('question', {})
+        kinds = [key for key in ('choiceQuestion', 'textQuestion', 'scaleQuestion', 'dateQuestion', 'timeQuestion')
+                 if key in question]
+        _check(len(kinds) == 1, f'{path}.questionItem.question: exactly one kind of question is required')
+
+        if 'choiceQuestion' in question:
+            choice_question = question['choiceQuestion']
+            _check(choice_question.get('type') in ('RADIO', 'CHECKBOX', 'DROP_DOWN'),
+                   f'{path}: invalid choice type {choice_question.get("type")}')
+            _check_options(choice_question.get('options'), f'{path}.options')
+            for option in choice_question['options']:
+                if 'goToSectionId' in option:
+                    _check(choice_question['type'] != 'CHECKBOX', f'{path}: checkboxes can not navigate')
+                    _check(option['goToSectionId'] in page_break_ids,
+                           f'{path}: no page break with id {option["goToSectionId"]}')
+
+        elif 'scaleQuestion' in question:
+            scale = question['scaleQuestion']
+            _check(scale.get('low') in (0, 1), f'{path}: the low end of a scale must be 0 or 1')
+            _check(isinstance(scale.get('high'), int) and 2 <= scale['high'] <= 10,
+                   f'{path}: the high end of a scale must be between 2 and 10')
+
+    elif 'questionGroupItem' in item:
+        group = item['questionGroupItem']
+        _check(len(group.get('questions', [])) > 0, f'{path}: a grid needs at least one row')
+        _check(all('rowQuestion' in question for question in group['questions']), f'{path}: rows need a title')
+        columns = group.get('grid', {}).get('columns', {})
+        _check(columns.get('type') in ('RADIO', 'CHECKBOX'), f'{path}: invalid column type {columns.get("type")}')
+        _check_options(columns.get('options'), f'{path}.columns')
+
+
+class _StubFormsAPI(ThreadingHTTPServer):
+    # local stand-in for forms.create, forms.get and forms.batchUpdate, which
+    # validates the requests it gets and keeps the forms in memory. requests are
+    # validated against the documented constraints of the api, not all of them
+    def __init__(self, address: tuple[str, int]):
+        super().__init__(address, _StubHandler)
+        self.forms = {}
+
+    def create(self, body: dict) -> dict:
+        info = body.get('info', {})
+        _check(isinstance(info.get('title'), str), 'info.title: required')
+        _check(set(info) <= {'title', 'documentTitle'}, 'info: only the title can be set when creating a form')
+        _check(set(body) == {'info'}, 'only info can be set when creating a form')
+
+        form_id = f'stub{len(self.forms)}'
+        self.forms[form_id] = {'formId': form_id, 'info': dict(info), 'items': [],
+                               'responderUri': f'http://{self.server_address[0]}:{self.server_port}/{form_id}'}
+        return self.forms[form_id]
+
+    def batch_update(self, form_id: str, body: dict) -> dict:
+        # the requests are applied to a copy, so an invalid batch changes nothing
+        form = json.loads(json.dumps(self.forms[form_id]))
+        requests = body.get('requests')
+        _check(isinstance(requests, list) and len(requests) > 0, 'requests: at least one request is required')
+
+        replies = []
+        for i, request in enumerate(requests):
+            path = f'requests[{i}]'
+            _check(isinstance(request, dict) and len(request) == 1, f'{path}: exactly one kind of request is required')
+
+            if 'updateFormInfo' in request:
+                update = request['updateFormInfo']
+                fields = update.get('updateMask', '').split(',')
+                _check(set(fields) <= {'title', 'description'} and fields != [''], f'{path}: invalid updateMask')
+                for name in fields:
+                    form['info'][name] = update.get('info', {}).get(name, '')
+
+                replies.append({})
+
+            elif 'createItem' in request:
+                item = request['createItem'].get('item', {})
+                index = request['createItem'].get('location', {}).get('index')
+                items = form['items']
+                _check(isinstance(index, int) and 0 <= index <= len(items),
+                       f'{path}.location.index: must be between 0 and {len(items)}')
+
+                ids = {existing['itemId'] for existing in items}
+                page_break_ids = {existing['itemId'] for existing in items if 'pageBreakItem' in existing}
+                _check_item(item, f'{path}.item', page_break_ids)
+
+                item = dict(item)
+                if 'itemId' in item:
+                    _check(item['itemId'] not in ids, f'{path}.item.itemId: {item["itemId"]} is already used')
+                else:
+                    item['itemId'] = f'{len(ids) + 1:08x}'
+                    while item['itemId'] in ids:
+                        item['itemId'] = f'{int(item["itemId"], 16) + 1:08x}'
+
+                items.insert(index, item)
+                replies.append({'createItem': {'itemId': item['itemId']}})
+
+            else:
+                raise _InvalidRequest(f'{path}: unsupported request {next(iter(request))}')
+
+        self.forms[form_id] = form
+        return {'replies': replies}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def _answer(self, status: int, body: dict) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _error(self, status: int, message: str) -> None:
+        # errors look like the ones of google apis
+        statuses = {400: 'INVALID_ARGUMENT', 401: 'UNAUTHENTICATED', 404: 'NOT_FOUND'}
+        self._answer(status, {'error': {'code': status, 'message': message, 'status': statuses[status]}})
+
+    def _form_id(self) -> str | None:
+        form_id = self.path.removeprefix('/v1/forms/').removesuffix(':batchUpdate')
+        return form_id if form_id in self.server.forms else None
+
+    def do_GET(self):
+        if not self.headers.get('Authorization', '').startswith('Bearer '):
+            self._error(401, 'Request is missing an OAuth access token')
+
+        elif self._form_id() is None:
+            self._error(404, f'Not found: {self.path}')
+
+        else:
+            self._answer(200, self.server.forms[self._form_id()])
+
+    def do_POST(self):
+        if not self.headers.get('Authorization', '').startswith('Bearer '):
+            self._error(401, 'Request is missing an OAuth access token')
+            return
+
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+            if self.path == '/v1/forms':
+                self._answer(200, self.server.create(body))
+
+            elif self.path.endswith(':batchUpdate') and self._form_id() is not None:
+                self._answer(200, self.server.batch_update(self._form_id(), body))
+
+            else:
+                self._error(404, f'Not found: {self.path}')
+
+        except (json.JSONDecodeError, AttributeError, TypeError) as e:
+            self._error(400, f'Invalid JSON payload: {e}')
+
+        except _InvalidRequest as e:
+            self._error(400, str(e))
+
+    def log_message(self, format: str, *args) -> None:
+        _logger.info(format, *args)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Create forms with the Google Forms API instead of Apps Script')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    requests_parser = subparsers.add_parser('requests',
+                                            help='print the bodies of the requests creating the form, as json')
+    requests_parser.add_argument('markdown_file', type=str, help='path to markdown file, or - to read from stdin')
+    requests_parser.add_argument('--batch_size', type=int, default=DEFAULT_BATCH_SIZE,
+                                 help='requests sent in each call to forms.batchUpdate')
+
+    create_parser = subparsers.add_parser('create', help='create the form and print its id and links')
+    create_parser.add_argument('markdown_file', type=str, help='path to markdown file, or - to read from stdin')
+    create_parser.add_argument('--token', type=str, default=os.environ.get('GOOGLE_OAUTH_TOKEN'),
+                               help='OAuth access token with the forms.body scope, defaults to the '
+                                    'GOOGLE_OAUTH_TOKEN environment variable')
+    create_parser.add_argument('--endpoint', type=str, default=FORMS_API_ENDPOINT,
+                               help='base url of the api, for example the one of the stub server')
+    create_parser.add_argument('--batch_size', type=int, default=DEFAULT_BATCH_SIZE,
+                               help='requests sent in each call to forms.batchUpdate')
+    create_parser.add_argument('--timeout', type=float, default=60.0,
+                               help='seconds to wait for each answer')
+
+    stub_parser = subparsers.add_parser('stub', help='serve a local stand-in of the api that validates requests')
+    stub_parser.add_argument('--port', type=int, default=8085, help='port the stub server listens on')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == 'stub':
+        server = _StubFormsAPI(('localhost', args.port))
+        print(f'Serving the Forms API stub at http://localhost:{args.port}/v1')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            sys.exit(0)
+
+    markdown_file = sys.stdin.read() if args.markdown_file == '-' else Path(args.markdown_file).read_text()
+    include_dir = Path.cwd() if args.markdown_file == '-' else Path(args.markdown_file).parent
+    form = parse_markdown(iter_lines(markdown_file), include_dir)
+
+    if args.command == 'requests':
+        bodies = {'create': create_form_body(form), 'batchUpdate': batch_update_bodies(form_requests(form),
+                                                                                       args.batch_size)}
+        json.dump(bodies, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+
+    else:
+        if args.token is None:
+            parser.error('an OAuth access token is needed, give --token or set GOOGLE_OAUTH_TOKEN')
+
+        created = create_form(form, args.token, args.endpoint, args.batch_size, args.timeout)
+        print(f'Created form {created["formId"]}')
+        print(f'  edit: https://docs.google.com/forms/d/{created["formId"]}/edit')
+        print(f'  respond: {created["responderUri"]}')
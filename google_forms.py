@@ -1,51 +1,202 @@
+import hashlib
 import logging
+import os
 import re
-from typing import Any
+import textwrap
+import time
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass, field, replace
+from enum import StrEnum
+from io import TextIOBase
 
 
+__version__ = '0.1.0'
+
 _logger = logging.getLogger(__name__)
 
-_main_title_regex = re.compile(r'^#[\s]*(.*)$')
-_confirmation_message_regex = re.compile(r'^_(.*)_$')
-_section_regex = re.compile(r'^##[\s]*(.*)$')
-_title_regex = re.compile(r'^###[\s]*(.*)$')
-_combobox_regex = re.compile(r'^-[\s]*(.*)$')
-_radio_button_regex = re.compile(r'^\*[\s]*(.*)$')
-_checkbox_regex = re.compile(r'^([-*][\s]*)?\[[\s]*\] (.*)$')
-_navigation_regex = re.compile(r'^(.*) \[(.*)\]$')
-_paragraph_regex = re.compile(r'^[\s]*```(.|\s)*```[\s]*$')
-_short_text_regex = re.compile(r'^`(.*)`$')
-_required_regex = re.compile(r'^\*\*(.*)\*\*$')
-_scale_regex = re.compile(r'^(.*) (\d)+ --- (\d)+ (.*)$')
-_date_regex = re.compile(r'^dd|[\d]{2}/mm|[\d]{2}/yyyy|[\d]{4}$')
-_time_regex = re.compile(r'^hh|[\d]{2}:mm|[\d]{2}$')
-_date_time_regex = re.compile(r'^dd|[\d]{2}/mm|[\d]{2}/yyyy|[\d]{4} hh|[\d]{2}:mm|[\d]{2}$')
-_duration_regex = re.compile(r'^hh|[\d]{2}:mm|[\d]{2}:ss|[\d]{2}$')
-_column_row_radio_button_grid_regex = re.compile(r'^####[\s]*(.*)$')
-_column_row_checkbox_grid_regex = re.compile(r'^####[\s]*\[[\s]*\] (.*)$')
-
-
-def begin_create_form():
-    _logger.debug('Creating form')
+# every line is classified by a single alternation of the patterns below, so the
+# order here is the precedence order: the first kind whose pattern matches wins.
+# lines are stripped before being classified, and all patterns must run in
+# linear time on the length of the line, since lines come straight from users
+_line_patterns = (
+    ('column_row_checkbox_grid', r'^####[\s]*\[[\s]*\] (.*)$'),
+    ('column_row_radio_button_grid', r'^####[\s]*(.*)$'),
+    ('title', r'^###[\s]*(.*)$'),
+    ('section', r'^##[\s]*(.*)$'),
+    ('main_title', r'^#[\s]*(.*)$'),
+    ('confirmation_message', r'^_(.*)_$'),
+    ('paragraph', r'^```[\s\S]*```$'),
+    ('short_text', r'^`(.*)`$'),
+    ('checkbox', r'^([-*][\s]*)?\[[\s]*\] (.*)$'),
+    ('radio_button', r'^\*[\s]*(.*)$'),
+    ('combobox', r'^-[\s]*(.*)$'),
+    ('scale', r'^(.*) (\d+) --- (\d+) (.*)$'),
+    ('date_time', r'^dd|[\d]{2}/mm|[\d]{2}/yyyy|[\d]{4} hh|[\d]{2}:mm|[\d]{2}$'),
+    ('date', r'^dd|[\d]{2}/mm|[\d]{2}/yyyy|[\d]{4}$'),
+    ('duration', r'^hh|[\d]{2}:mm|[\d]{2}:ss|[\d]{2}$'),
+    ('time', r'^hh|[\d]{2}:mm|[\d]{2}$'),
+)
+# compiled on first use, since compiling it takes a good part of the import time,
+# which matters for short lived processes converting a single file
+_line_regex = None
+_line_groups_count = None
+
+
+def _compile_line_regex() -> None:
+    global _line_regex, _line_groups_count
+    line_regex = re.compile('|'.join(f'(?P<{kind}>{pattern})' for kind, pattern in _line_patterns))
+    # the groups of each pattern are the ones between its named group and the next
+    indices = [line_regex.groupindex[kind] for kind, _ in _line_patterns] + [line_regex.groups + 1]
+    _line_groups_count = {kind: indices[i + 1] - indices[i] - 1 for i, (kind, _) in enumerate(_line_patterns)}
+    _line_regex = line_regex
+
+
+class ItemKind(StrEnum):
+    TITLE_AND_DESCRIPTION = 'title_and_description'
+    SHORT_TEXT = 'short_text'
+    PARAGRAPH_TEXT = 'paragraph_text'
+    MULTIPLE_CHOICE = 'multiple_choice'
+    CHECKBOX = 'checkbox'
+    LIST = 'list'
+    SCALE = 'scale'
+    DATE = 'date'
+    TIME = 'time'
+    DATE_TIME = 'date_time'
+    DURATION = 'duration'
+    GRID = 'grid'
+    CHECKBOX_GRID = 'checkbox_grid'
+
+
+# intermediate representation of a form, produced by parse_markdown and consumed
+# by the code generators. nodes are listed in the order the script creates them
+
+
+@dataclass(slots=True)
+class Choice:
+    value: str
+    # title of the section to go to when this choice is selected
+    section: str | None = None
+
+
+@dataclass(slots=True)
+class Item:
+    kind: ItemKind
+    title: str = ''
+    description: str = ''
+    required: bool = False
+    choices: list[Choice] = field(default_factory=list)
+    rows: list[str] = field(default_factory=list)
+    columns: list[str] = field(default_factory=list)
+    min_value: int = 0
+    max_value: int = 0
+    min_label: str = ''
+    max_label: str = ''
+
+
+@dataclass(slots=True)
+class PageBreak:
+    # sections must be created before any item can navigate to them, so their
+    # page breaks are created at the beginning of the form
+    title: str
+
+
+@dataclass(slots=True)
+class Section:
+    # sets the title and description of a section created by a PageBreak
+    title: str
+    description: str = ''
+    # whether its page break must be moved to the current end of the form
+    move_to_end: bool = False
+
+
+@dataclass(slots=True)
+class Form:
+    # title is None when the markdown has no main title, and the form is not created
+    title: str | None = None
+    description: str = ''
+    confirmation_message: str = ''
+    nodes: list[PageBreak | Section | Item] = field(default_factory=list)
+
+
+Node = Form | PageBreak | Section | Item
+
+
+class _CodeEmitter:
+    # collects the fragments of the generated script and joins them only once at
+    # the end, or writes them straight to a file-like sink if one is given
+    def __init__(self, sink: TextIOBase | None = None):
+        self._fragments = []
+        self._sink = sink
+
+    def emit(self, fragment: str) -> None:
+        if self._sink is None:
+            self._fragments.append(fragment)
+        else:
+            self._sink.write(fragment)
+
+    def getvalue(self) -> str | None:
+        if self._sink is None:
+            return ''.join(self._fragments)
+
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class Style:
+    # layout and variable names of the generated code. compact code has no
+    # indentation or blank lines, one statement per line and short names
+    compact: bool = False
+    form: str = 'form'
+    item: str = 'item'
+    section: str = 'section'
+    sections: str = 'sections'
+    equals: str = ' = '
+
+
+# styles of the scripts generated by default and with compact
+normal_style = Style()
+compact_style = Style(compact=True, form='f', item='i', section='s', sections='S', equals='=')
+
+
+def begin_create_form(compact: bool = False):
+    if compact:
+        return 'function createForm(){\n'
+
     return 'function createForm() {\n'
 
 
-def end_create_form():
-    _logger.debug('Form created')
+def end_create_form(compact: bool = False):
     return '}'
 
 
+def _trace(event: str, **fields) -> None:
+    # structured debug event, formatted only if a handler emits it. callers check
+    # _logger.isEnabledFor(logging.DEBUG) first, so that not even the fields are
+    # built when debug logging is disabled
+    _logger.debug('%s: %s', event, fields, extra={'event': event, 'fields': fields})
+
+
 def _concatenate_lines(lines: list[str] | tuple[str], identation_level: int = 1, identation: str = 2 * ' '):
     return '\n'.join([f'{identation * identation_level}{line}' for line in lines])
 
 
-def _create_form(**kwargs) -> str:
+def join_lines(lines: list[str], style: Style, blank_line: bool = True) -> str:
+    # lines are statements, or calls of a chain when they do not end with ;
+    if not style.compact:
+        return ('\n' if blank_line else '') + _concatenate_lines(lines)
+
+    return ''.join(f'{line.strip()}\n' if line.endswith((';', ';\n')) else line.strip() for line in lines)
+
+
+def _create_form(form: Form, style: Style = normal_style) -> str:
     # https://developers.google.com/apps-script/reference/forms/form
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
-    confirmation_message = kwargs.get('confirmation_message', '')
+    title = form.title
+    description = form.description
+    confirmation_message = form.confirmation_message
 
-    lines = [f'var form = FormApp.create("{title}")']
+    lines = [f'var {style.form}{style.equals}FormApp.create("{title}")']
 
     if len(description) > 0:
         lines.append(f'  .setDescription("{description}")')
@@ -55,34 +206,29 @@ def _create_form(**kwargs) -> str:
 
     lines[-1] += ';\n'
 
-    lines.append('var sections = {};\n')
+    lines.append(f'var {style.sections}{style.equals}{{}};\n')
 
-    return _concatenate_lines(lines)
+    return join_lines(lines, style, blank_line=False)
 
 
-def _create_section(**kwargs) -> str:
+def _create_section(page_break: PageBreak, style: Style = normal_style) -> str:
     # https://developers.google.com/apps-script/reference/forms/form#addpagebreakitem
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
+    title = page_break.title
 
-    lines = ['var section = form.addPageBreakItem()',
+    lines = [f'var {style.section}{style.equals}{style.form}.addPageBreakItem()',
              f'  .setTitle("{title}");\n',
-             f'sections["{title}"] = section;\n']
+             f'{style.sections}["{title}"]{style.equals}{style.section};\n']
 
-    if len(description) > 0:
-        lines.append(f'  .setHelpText("{description}")')
+    return join_lines(lines, style)
 
-    _logger.debug(f'Creating section: {title} - {description}')
 
-    return '\n' + _concatenate_lines(lines)
-
-
-def edit_section(**kwargs) -> str:
+def edit_section(section: Section, compact: bool = False) -> str:
     # https://developers.google.com/apps-script/reference/forms/form#addpagebreakitem
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
+    style = compact_style if compact else normal_style
+    title = section.title
+    description = section.description
 
-    lines = [f'sections["{title}"]',
+    lines = [f'{style.sections}["{title}"]',
              f'  .setTitle("{title}")']
 
     if len(description) > 0:
@@ -90,635 +236,1183 @@ def edit_section(**kwargs) -> str:
 
     lines[-1] += ';\n'
 
-    _logger.debug(f'Editing section: {title} - {description}')
+    return join_lines(lines, style)
+
+
+_create_choices_function = '''function createChoices(item, choices, sections) {
+  // creates the choices of lists where some of them navigate to a section
+  return choices.map(function (choice) {
+    return choice[1] === null ? item.createChoice(choice[0]) : item.createChoice(choice[0], sections[choice[1]]);
+  });
+}
+'''
+
+
+class SharedArrays:
+    # choice, row and column lists defined once as constants after createForm and
+    # referenced by every item using them, so repeated lists (like the options of
+    # likert scales) are written and built only once. the names come from the
+    # contents, so a list always gets the same name no matter where it is used
+    def __init__(self):
+        # name -> definition, in the order they were first used
+        self.definitions = {}
+
+    def _define(self, prefix: str, literal: str) -> str:
+        # 64 bits of the digest, so even forms with millions of lists are unlikely to
+        # have two with the same name. if they do, the script would give one of them
+        # the values of the other, so it is an error instead
+        name = f'{prefix}_{hashlib.sha256(literal.encode()).hexdigest()[:16].upper()}'
+        self._add(name, f'const {name} = {literal};')
+        return name
+
+    def _add(self, name: str, definition: str) -> None:
+        if self.definitions.setdefault(name, definition) != definition:
+            raise ValueError(f'Two different lists are both named {name}')
+
+    def values(self, values: list[str]) -> str:
+        return self._define('VALUES', f'{values}')
+
+    def navigation(self, choices: list[Choice]) -> str:
+        # pairs of option and section, or null for options that do not navigate
+        pairs = []
+        for choice in choices:
+            section = 'null' if choice.section is None else f'"{choice.section}"'
+            pairs.append(f'["{choice.value}", {section}]')
 
-    return '\n' + _concatenate_lines(lines)
+        self.definitions['createChoices'] = _create_choices_function
+        return self._define('NAVIGATION', f'[{", ".join(pairs)}]')
 
+    def update(self, definitions: dict[str, str]) -> None:
+        for name, definition in definitions.items():
+            self._add(name, definition)
 
-def _create_title_and_description_item(**kwargs) -> str:
-    # https://developers.google.com/apps-script/reference/forms/form#addsectionheaderitem
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
+    def code(self) -> str:
+        if len(self.definitions) == 0:
+            return ''
 
-    lines = ['form.addSectionHeaderItem()',
-             f'  .setTitle("{title}")']
+        return '\n\n' + '\n'.join(self.definitions.values())
 
-    if len(description) > 0:
-        lines.append(f'  .setHelpText("{description}")')
 
-    lines[-1] += ';\n'
+def _choice_values(values: list[str], shared: SharedArrays | None) -> str:
+    if shared is None:
+        return f'{values}'
 
-    _logger.debug(f'Creating title and description item: {title} - {description}')
+    return shared.values(values)
 
-    return '\n' + _concatenate_lines(lines)
 
+def create_choice(choice: Choice, style: Style = normal_style) -> str:
+    # choices of lists where some of them navigate to a section
+    if choice.section is None:
+        return f'{style.item}.createChoice("{choice.value}")'
 
-def _create_short_text_item(**kwargs) -> str:
-    # https://developers.google.com/apps-script/reference/forms/form#addtextitem
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
-    required = kwargs.get('required', False)
+    return f'{style.item}.createChoice("{choice.value}", {style.sections}["{choice.section}"])'
 
-    lines = ['form.addTextItem()',
-             f'  .setTitle("{title}")']
 
-    if required:
-        lines.append('  .setRequired(true)')
+@dataclass(frozen=True, slots=True)
+class _ItemTemplate:
+    # how the code creating a kind of item is generated: the method adding it to the
+    # form and the calls setting its contents after the title, with {fields} filled
+    # in from the item. the code of every combination of optional calls is compiled
+    # once into a single format string, see _compile_item_template
+    method: str
+    calls: tuple[str, ...] = ()
+    # lists of choices, which may navigate to sections, or rows and columns
+    choices: bool = False
+    grid: bool = False
+    can_be_required: bool = True
+    # text items set whether they are required before their help text
+    required_first: bool = False
+    # radio buttons leave a blank line between the item and its navigating choices
+    navigation_blank_line: bool = False
 
-    if len(description) > 0:
-        lines.append(f'  .setHelpText("{description}")')
 
-    lines[-1] += ';\n'
-
-    _logger.debug(f'Creating short text item: {title}{" (required)" if required else ""} - {description}')
-
-    return '\n' + _concatenate_lines(lines)
-
-
-def _create_paragraph_text_item(**kwargs) -> str:
+# how the code creating each kind of item is written
+item_templates = {
+    # https://developers.google.com/apps-script/reference/forms/form#addsectionheaderitem
+    ItemKind.TITLE_AND_DESCRIPTION: _ItemTemplate('addSectionHeaderItem', can_be_required=False),
+    # https://developers.google.com/apps-script/reference/forms/form#addtextitem
+    ItemKind.SHORT_TEXT: _ItemTemplate('addTextItem', required_first=True),
     # https://developers.google.com/apps-script/reference/forms/form#addparagraphtextitem
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
-    required = kwargs.get('required', False)
-
-    lines = ['form.addParagraphTextItem()',
-             f'  .setTitle("{title}")']
-
-    if required:
-        lines.append('  .setRequired(true)')
-
-    if len(description) > 0:
-        lines.append(f'  .setHelpText("{description}")')
-
-    lines[-1] += ';\n'
-
-    _logger.debug(f'Creating paragraph text item: {title}{" (required)" if required else ""} - {description}')
-
-    return '\n' + _concatenate_lines(lines)
-
-
-def _create_multiple_choice_item(**kwargs) -> str:
+    ItemKind.PARAGRAPH_TEXT: _ItemTemplate('addParagraphTextItem', required_first=True),
     # https://developers.google.com/apps-script/reference/forms/form#addmultiplechoiceitem
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
-    required = kwargs.get('required', False)
-    choices = kwargs.get('choices', [])
-
-    if any(c.startswith('item.createChoice(') for c in choices):
-        lines = ['var item = form.addMultipleChoiceItem()',
-                 f'  .setTitle("{title}");\n']
-
-        lines.append('item.setChoices([')
-        for choice in choices:
-            lines.append(f'    {choice},')
-
-        lines[-1] = lines[-1][:-1]
-        lines.append('  ])')
-
-    else:
-        lines = ['form.addMultipleChoiceItem()',
-                 f'  .setTitle("{title}")',
-                 f'  .setChoiceValues({choices})']
-
-    if len(description) > 0:
-        lines.append(f'  .setHelpText("{description}")')
-
-    if required:
-        lines.append('  .setRequired(true)')
-
-    lines[-1] += ';\n'
-
     # TODO .showOtherOption(true);
-
-    _logger.debug(f'Creating multiple choice item: {title}{" (required)" if required else ""} - {description}\nchoices: {choices}')
-
-    return '\n' + _concatenate_lines(lines)
-
-
-def _create_checkbox_item(**kwargs) -> str:
+    ItemKind.MULTIPLE_CHOICE: _ItemTemplate('addMultipleChoiceItem', ('setChoiceValues({choices})',), choices=True,
+                                            navigation_blank_line=True),
     # https://developers.google.com/apps-script/reference/forms/form#addcheckboxitem
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
-    required = kwargs.get('required', False)
-    choices = kwargs.get('choices', [])
-
-    if any(c.startswith('item.createChoice(') for c in choices):
-        lines = ['var item = form.addMultipleChoiceItem()',
-                 f'  .setTitle("{title}");']
-
-        lines.append('item.setChoices([')
-        for choice in choices:
-            lines.append(f'    {choice},')
-
-        lines[-1] = lines[-1][:-1]
-        lines.append('  ])')
-
-    else:
-        lines = ['form.addMultipleChoiceItem()',
-                 f'  .setTitle("{title}")',
-                 f'  .setChoiceValues({choices})']
-
-    if len(description) > 0:
-        lines.append(f'  .setHelpText("{description}")')
-
-    if required:
-        lines.append('  .setRequired(true)')
-
-    lines[-1] += ';\n'
-
-    _logger.debug(f'Creating checkbox item: {title}{" (required)" if required else ""} - {description}\nchoices: {choices}')
-
-    return '\n' + _concatenate_lines(lines)
-
-
-def _create_list_item(**kwargs) -> str:
+    ItemKind.CHECKBOX: _ItemTemplate('addMultipleChoiceItem', ('setChoiceValues({choices})',), choices=True),
     # https://developers.google.com/apps-script/reference/forms/form#addlistitem
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
-    required = kwargs.get('required', False)
-    choices = kwargs.get('choices', [])
-
-    if any(c.startswith('item.createChoice(') for c in choices):
-        lines = ['var item = form.addMultipleChoiceItem()',
-                 f'  .setTitle("{title}");']
-
-        lines.append('item.setChoices([')
-        for choice in choices:
-            lines.append(f'    {choice},')
-
-        lines[-1] = lines[-1][:-1]
-        lines.append('  ])')
-
-    else:
-        lines = ['form.addMultipleChoiceItem()',
-                 f'  .setTitle("{title}")',
-                 f'  .setChoiceValues({choices})']
-
-    if len(description) > 0:
-        lines.append(f'  .setHelpText("{description}")')
-
-    if required:
-        lines.append('  .setRequired(true)')
-
-    lines[-1] += ';\n'
-
-    _logger.debug(f'Creating list item: {title}{" (required)" if required else ""} - {description}\nchoices: {choices}')
-
-    return '\n' + _concatenate_lines(lines)
-
-
-def _create_scale_item(**kwargs) -> str:
+    ItemKind.LIST: _ItemTemplate('addMultipleChoiceItem', ('setChoiceValues({choices})',), choices=True),
     # https://developers.google.com/apps-script/reference/forms/form#addscaleitem
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
-    required = kwargs.get('required', False)
-    min_label = kwargs.get('min_label', '')
-    max_label = kwargs.get('max_label', '')
-    min_value = kwargs.get('min', 0)
-    max_value = kwargs.get('max', -1)
-
-    lines = ['form.addScaleItem()',
-             f'  .setTitle("{title}")',
-             f'  .setBounds({min_value}, {max_value})',
-             f'  .setLabels("{min_label}", "{max_label}")']
-
-    if len(description) > 0:
-        lines.append(f'  .setHelpText("{description}")')
-
-    if required:
-        lines.append('  .setRequired(true)')
-
-    lines[-1] += ';\n'
-
-    _logger.debug(f'Creating scale item: {title}{" (required)" if required else ""} - {description}\nmin ({min_label}): {min_value} - max ({max_label}): {max_value}')
-
-    return '\n' + _concatenate_lines(lines)
-
-
-def _create_date_item(**kwargs) -> str:
+    ItemKind.SCALE: _ItemTemplate('addScaleItem', ('setBounds({min_value}, {max_value})',
+                                                   'setLabels("{min_label}", "{max_label}")')),
     # https://developers.google.com/apps-script/reference/forms/form#adddateitem
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
-    required = kwargs.get('required', False)
-
-    lines = ['form.addDateItem()',
-             f'  .setTitle("{title}")']
-
-    if len(description) > 0:
-        lines.append(f'  .setHelpText("{description}")')
-
-    if required:
-        lines.append('  .setRequired(true)')
-
-    lines[-1] += ';\n'
-
-    _logger.debug(f'Creating date item: {title}{" (required)" if required else ""} - {description}')
-
-    return '\n' + _concatenate_lines(lines)
-
-
-def _create_time_item(**kwargs) -> str:
+    ItemKind.DATE: _ItemTemplate('addDateItem'),
     # https://developers.google.com/apps-script/reference/forms/form#addtimeitem
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
-    required = kwargs.get('required', False)
-
-    lines = ['form.addTimeItem()',
-             f'  .setTitle("{title}")']
-
-    if len(description) > 0:
-        lines.append(f'  .setHelpText("{description}")')
-
-    if required:
-        lines.append('  .setRequired(true)')
-
-    lines[-1] += ';\n'
-
-    _logger.debug(f'Creating time item: {title}{" (required)" if required else ""} - {description}')
-
-    return '\n' + _concatenate_lines(lines)
-
-
-def _create_date_time_item(**kwargs) -> str:
+    ItemKind.TIME: _ItemTemplate('addTimeItem'),
     # https://developers.google.com/apps-script/reference/forms/form#adddatetimeitem
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
-    required = kwargs.get('required', False)
-
-    lines = ['form.addDateTimeItem()',
-             f'  .setTitle("{title}")']
-
-    if len(description) > 0:
-        lines.append(f'  .setHelpText("{description}")')
-
-    if required:
-        lines.append('  .setRequired(true)')
-
-    lines[-1] += ';\n'
-
-    _logger.debug(f'Creating date time item: {title}{" (required)" if required else ""} - {description}')
-
-    return '\n' + _concatenate_lines(lines)
-
-
-def _create_duration_item(**kwargs) -> str:
+    ItemKind.DATE_TIME: _ItemTemplate('addDateTimeItem'),
     # https://developers.google.com/apps-script/reference/forms/form#adddurationitem
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
-    required = kwargs.get('required', False)
-
-    lines = ['form.addDurationItem()',
-             f'  .setTitle("{title}")']
-
-    if len(description) > 0:
-        lines.append(f'  .setHelpText("{description}")')
-
-    if required:
-        lines.append('  .setRequired(true)')
-
-    lines[-1] += ';\n'
-
-    _logger.debug(f'Creating duration item: {title}{" (required)" if required else ""} - {description}')
-
-    return '\n' + _concatenate_lines(lines)
-
-
-def _create_grid_item(**kwargs) -> str:
+    ItemKind.DURATION: _ItemTemplate('addDurationItem'),
     # https://developers.google.com/apps-script/reference/forms/form#addgriditem
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
-    required = kwargs.get('required', False)
-    rows = kwargs.get('rows', [])
-    columns = kwargs.get('columns', [])
-
-    lines = ['form.addGridItem()',
-             f'  .setTitle("{title}")',
-             f'  .setRows({rows})',
-             f'  .setColumns({columns})']
-
-    if len(description) > 0:
-        lines.append(f'  .setHelpText("{description}")')
-
-    if required:
-        lines.append('  .setRequired(true)')
-
-    lines[-1] += ';\n'
-
-    _logger.debug(f'Creating grid item: {title}{" (required)" if required else ""} - {description}\nrows: {rows}\ncolumns: {columns}')
-
-    return '\n' + _concatenate_lines(lines)
-
-
-def _create_checkbox_grid_item(**kwargs) -> str:
+    ItemKind.GRID: _ItemTemplate('addGridItem', ('setRows({rows})', 'setColumns({columns})'), grid=True),
     # https://developers.google.com/apps-script/reference/forms/form#addcheckboxgriditem
-    title = kwargs.get('title', '')
-    description = kwargs.get('description', '')
-    required = kwargs.get('required', False)
-    rows = kwargs.get('rows', [])
-    columns = kwargs.get('columns', [])
-
-    lines = ['form.addCheckboxGridItem()',
-             f'  .setTitle("{title}")',
-             f'  .setRows({rows})',
-             f'  .setColumns({columns})']
+    ItemKind.CHECKBOX_GRID: _ItemTemplate('addCheckboxGridItem', ('setRows({rows})', 'setColumns({columns})'),
+                                          grid=True),
+}
 
-    if len(description) > 0:
-        lines.append(f'  .setHelpText("{description}")')
 
-    if required:
-        lines.append('  .setRequired(true)')
+def _compile_statement(target: str, calls: list[str], style: Style) -> str:
+    # a chain of calls on target, one per line unless the code is compact
+    if style.compact:
+        return target + ''.join(f'.{call}' for call in calls) + ';\n'
 
-    lines[-1] += ';\n'
+    return f'  {target}' + ''.join(f'\n    .{call}' for call in calls) + ';\n'
 
-    _logger.debug(f'Creating checkbox grid item: {title}{" (required)" if required else ""} - {description}\nrows: {rows}\ncolumns: {columns}')
 
-    return '\n' + _concatenate_lines(lines)
+def _compile_item_template(template: _ItemTemplate, style: Style, description: bool, required: bool,
+                           navigation: str | None) -> str:
+    # navigation is None for items without choices navigating to sections, and
+    # otherwise 'inline' or 'shared', where the choices come from a shared list
+    optional = []
+    if description:
+        optional.append('setHelpText("{description}")')
 
+    if required and template.can_be_required:
+        optional.insert(0 if template.required_first else len(optional), 'setRequired(true)')
 
-def _move_section_to_end_of_form(title: str) -> str:
-    # https://developers.google.com/apps-script/reference/forms/form#moveitemto
+    if navigation is None:
+        return ('' if style.compact else '\n') + _compile_statement(
+            f'{style.form}.{template.method}()', ['setTitle("{title}")', *template.calls, *optional], style)
 
-    lines = [f'form.moveItem(form.getItemById(sections["{title}"].getId()), form.getItems().length - 1);\n']
-    # lines = [f'form.moveItem(sections["{title}"], form.getItems().length - 1);\n']
+    # the choices are created by the item, so it must be created first
+    code = ('' if style.compact else '\n') + _compile_statement(
+        f'var {style.item}{style.equals}{style.form}.{template.method}()', ['setTitle("{title}")'], style)
+    if template.navigation_blank_line and not style.compact:
+        code += '\n'
 
-    _logger.debug(f'Moving section to end of form: {title}')
+    if navigation == 'shared':
+        target = f'{style.item}.setChoices(createChoices({style.item}, {{choices}}, {style.sections}))'
+    elif style.compact:
+        target = f'{style.item}.setChoices([{{choices}}])'
+    else:
+        target = f'{style.item}.setChoices([\n      {{choices}}\n    ])'
+
+    return code + _compile_statement(target, optional, style)
+
+
+# the fields are numbered when compiling, since formatting with positional
+# arguments is much faster than with keyword arguments
+_item_fields = ('title', 'description', 'choices', 'rows', 'columns', 'min_value', 'max_value', 'min_label',
+                'max_label')
+_positional_item_fields = {name: f'{{{i}}}' for i, name in enumerate(_item_fields)}
+_compiled_item_templates = {
+    (kind, style.compact, description, required, navigation):
+        _compile_item_template(template, style, description, required, navigation).format_map(
+            _positional_item_fields)
+    for kind, template in item_templates.items()
+    for style in (normal_style, compact_style)
+    for description in (False, True)
+    for required in (False, True)
+    for navigation in ((None, 'inline', 'shared') if template.choices else (None,))
+}
+
+
+def create_item(item: Item, style: Style = normal_style, shared: SharedArrays | None = None) -> str:
+    # code creating the item, on its own or as part of the script of a form
+    template = item_templates[item.kind]
+    navigation = None
+    choices = rows = columns = ''
+
+    if template.choices:
+        if any(c.section is not None for c in item.choices):
+            if shared is None:
+                navigation = 'inline'
+                choices = (',' if style.compact else ',\n      ').join(create_choice(c, style) for c in item.choices)
+            else:
+                navigation = 'shared'
+                choices = shared.navigation(item.choices)
 
-    return '\n' + _concatenate_lines(lines)
+        else:
+            choices = _choice_values([c.value for c in item.choices], shared)
 
+    elif template.grid:
+        rows = _choice_values(item.rows, shared)
+        columns = _choice_values(item.columns, shared)
 
-def _reset_args(args: dict[str, Any]) -> None:
-    args['title'] = ''
-    args['description'] = ''
-    args['required'] = False
-    args['choices'] = []
-    args['rows'] = []
-    args['columns'] = []
+    code = _compiled_item_templates[item.kind, style.compact, len(item.description) > 0, item.required, navigation]
+    # in the order of _item_fields
+    return code.format(item.title, item.description, choices, rows, columns, item.min_value, item.max_value,
+                       item.min_label, item.max_label)
 
 
-def create_google_apps_script(markdown_file: str) -> None:
-    current_function = None
-    grid = False
-    code = begin_create_form()
-    created_main_title = False
-    created_first_item = False
+def _move_section_to_end_of_form(title: str, from_index: int | None, to_index: int,
+                                 style: Style = normal_style) -> str:
+    # https://developers.google.com/apps-script/reference/forms/form#moveitemfromindex,-toindex
+    # the indices are known when generating the code, so the script does not need
+    # to fetch the items of the form (getItems) once per section
 
-    row = False
+    if from_index is None:
+        # the section was never created, so let the script fail as usual
+        lines = [f'{style.form}.moveItem({style.form}.getItemById({style.sections}["{title}"].getId()), '
+                 f'{style.form}.getItems().length - 1);\n']
+    else:
+        lines = [f'{style.form}.moveItem({from_index}, {to_index});\n']
+
+    return join_lines(lines, style)
+
+
+@dataclass(slots=True)
+class FormLayout:
+    # keeps track of where the items are in the form while the script is generated.
+    # every item and page break gets a new stamp when it is added or moved to the
+    # end, so the items are in the order of their stamps, and the index of a page
+    # break is its stamp minus the page breaks moved away from before it. sections
+    # are usually moved in the order of the list of sections, so every page break
+    # moved away so far is before the next one, and a count of them is enough.
+    # otherwise they are counted with a fenwick tree, so moving a section to the end
+    # takes at most logarithmic time instead of shifting every page break after it
+    items: int = 0
+    stamps: int = 0
+    # placement of the page break each sections["title"] refers to. a placement is
+    # a page break added or moved to the end, and placements has its stamp
+    page_breaks: dict[str, int] = field(default_factory=dict)
+    placements: list[int] = field(default_factory=list)
+    # whether each placement was moved away, how many were and the last of them
+    moved: bytearray = field(default_factory=bytearray)
+    moved_count: int = 0
+    last_moved: int = -1
+    # fenwick tree over moved, indexed from 1, built when first needed
+    tree: list[int] | None = None
+    # placements moved away since the last checkpoint, with their titles, or None
+    # when not keeping track of them
+    moved_since: list[tuple[str, int]] | None = None
+    checkpoint_placements: int = 0
+    # operations done while log is set, to replay them on another layout
+    log: list[tuple] | None = None
+
+    def _count_moved(self, placements: int) -> int:
+        # how many of the first placements were moved away
+        if placements > self.last_moved:
+            return self.moved_count
+
+        tree = self.tree
+        if tree is None:
+            # each node adds its own count to the node covering it
+            tree = self.tree = [0, *self.moved]
+            for i in range(1, len(tree)):
+                parent = i + (i & -i)
+                if parent < len(tree):
+                    tree[parent] += tree[i]
+
+        count = 0
+        while placements > 0:
+            count += tree[placements]
+            placements &= placements - 1
+
+        return count
+
+    def _place(self, title: str) -> None:
+        tree = self.tree
+        if tree is not None:
+            # the new node counts the placements in its range before it
+            i = len(tree)
+            j = i - 1
+            first = i & (i - 1)
+            count = 0
+            while j > first:
+                count += tree[j]
+                j &= j - 1
+
+            tree.append(count)
+
+        self.page_breaks[title] = len(self.placements)
+        self.placements.append(self.stamps)
+        self.moved.append(0)
+        self.stamps += 1
+
+    def add_item(self) -> None:
+        self.items += 1
+        self.stamps += 1
+        if self.log is not None:
+            self.log.append(('add_item',))
+
+    def add_page_break(self, title: str) -> None:
+        self._place(title)
+        self.items += 1
+        if self.log is not None:
+            self.log.append(('add_page_break', title))
+
+    def index(self, title: str) -> int | None:
+        # index of the page break sections["title"] refers to, or None if it does not exist
+        placement = self.page_breaks.get(title)
+        if placement is None:
+            return None
+
+        return self.placements[placement] - self._count_moved(placement)
+
+    def move_to_end(self, title: str) -> int | None:
+        # returns the index the page break was at, or None if it does not exist
+        from_index = self.index(title)
+        if from_index is not None:
+            placement = self.page_breaks[title]
+            self.moved[placement] = 1
+            self.moved_count += 1
+            self.last_moved = max(self.last_moved, placement)
+            tree = self.tree
+            if tree is not None:
+                i = placement + 1
+                while i < len(tree):
+                    tree[i] += 1
+                    i += i & -i
+
+            if self.moved_since is not None:
+                self.moved_since.append((title, placement))
+
+            self._place(title)
+
+        if self.log is not None:
+            self.log.append(('move_to_end', title))
+
+        return from_index
+
+    def replay(self, log: list[tuple]) -> None:
+        for method, *args in log:
+            getattr(self, method)(*args)
+
+    def checkpoint(self) -> dict[str, int]:
+        # returns the indices the page breaks moved to the end since the last
+        # checkpoint were at when it was made, by title, and makes a new one.
+        # page breaks added since are left out
+        moved = sorted(placement for _, placement in self.moved_since)
+        positions = {}
+        for title, placement in self.moved_since:
+            if placement < self.checkpoint_placements and title not in positions:
+                # the page breaks moved away since the checkpoint were still there
+                positions[title] = (self.placements[placement] - self._count_moved(placement) +
+                                    bisect_left(moved, placement))
+
+        self.moved_since.clear()
+        self.checkpoint_placements = len(self.placements)
+        return positions
+
+
+def _split_navigation(option: str) -> tuple[str, str] | None:
+    # splits 'option [Section]' into ('option', 'Section'), splitting at the last
+    # ' [' like the greedy r'^(.*) \[(.*)\]$' would, but without its quadratic
+    # backtracking on lines with many brackets
+    if not option.endswith(']'):
+        return None
+
+    index = option.rfind(' [', 0, len(option) - 1)
+    if index == -1:
+        return None
+
+    return option[:index], option[index + 2:-1]
+
+
+def classify_line(line: str) -> tuple[str | None, tuple[str | None, ...]]:
+    # returns the kind of the line and the groups captured by its pattern, or
+    # (None, ()) for plain text lines (descriptions)
+    if _line_regex is None:
+        _compile_line_regex()
+
+    match = _line_regex.match(line)
+    if match is None:
+        return None, ()
+
+    # the named group of the matched kind encloses the groups of its pattern
+    kind = match.lastgroup
+    first = match.lastindex
+    return kind, match.groups()[first:first + _line_groups_count[kind]]
+
+
+def iter_lines(text: str) -> Iterator[str]:
+    # same as iterating over text.split('\n'), without building the list
+    start = 0
+    end = text.find('\n')
+    while end != -1:
+        yield text[start:end]
+        start = end + 1
+        end = text.find('\n', start)
+
+    yield text[start:]
+
+
+_list_item_kinds = {
+    'checkbox': ItemKind.CHECKBOX,
+    'radio_button': ItemKind.MULTIPLE_CHOICE,
+    'combobox': ItemKind.LIST,
+}
+
+_line_item_kinds = {
+    'paragraph': ItemKind.PARAGRAPH_TEXT,
+    'short_text': ItemKind.SHORT_TEXT,
+    'date_time': ItemKind.DATE_TIME,
+    'date': ItemKind.DATE,
+    'duration': ItemKind.DURATION,
+    'time': ItemKind.TIME,
+}
+
+
+# lines of included files, keyed by their path and version, and their parsed
+# nodes, keyed by the parser state they continue from. shared by every conversion
+# in the process
+_fragment_cache = None
+
+
+def include_path(line: str) -> str | None:
+    # the path of a '<!-- include: path -->' line, without compiling a regex
+    if not (line.startswith('<!--') and line.endswith('-->')):
+        return None
+
+    directive = line[4:-3].strip()
+    if not directive.startswith('include:'):
+        return None
+
+    return directive[8:].strip()
+
+
+def _file_version(path: str) -> tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def files_changed(versions: dict[str, tuple[int, int]]) -> bool:
+    # whether any of the files, by path, differs from the version recorded of it
+    try:
+        return any(_file_version(path) != version for path, version in versions.items())
+    except OSError:
+        return True
+
+
+class Parser:
+    # turns lines of markdown into form nodes. the node being read is only known
+    # to be complete when the next title or section starts, so it is kept in
+    # current (Form, Section, an ItemKind or None) until then. complete nodes are
+    # appended to nodes.
+    #
+    # included files are read relative to include_dir, and their lines are parsed
+    # as if they were in place of the include line. includes are disabled when
+    # include_dir is None, so documents of untrusted users can not read files
+    def __init__(self, include_dir: str | None = None, including: tuple[str, ...] = ()):
+        self.include_dir = include_dir
+        # files being included, from the outermost, to detect cycles
+        self.including = including
+        # version of every file included so far, nested includes included
+        self.included = {}
+        self.nodes = []
+        self.current = None
+        self.created_main_title = False
+        self.created_first_item = False
+        self.grid = False
+        self.row = False
+        self.confirmation_message = ''
+        # replaced by a timed version when collecting stats
+        self.classify = classify_line
+        self._reset()
+
+    def _reset(self) -> None:
+        self.title = ''
+        self.description = ''
+        self.required = False
+        self.choices = []
+        self.rows = []
+        self.columns = []
+        # the bounds are read by the scale line of the item, so they are not carried
+        # into the items after it
+        self.min_value = 0
+        self.max_value = 0
+        self.min_label = ''
+        self.max_label = ''
+
+    def _node(self, kind: ItemKind | type[Form] | type[Section]) -> Node:
+        if kind is Form:
+            return Form(self.title, self.description, self.confirmation_message)
+
+        if kind is Section:
+            return Section(self.title, self.description)
+
+        return Item(kind, self.title, self.description, self.required, self.choices, self.rows, self.columns,
+                    self.min_value, self.max_value, self.min_label, self.max_label)
+
+    def _finish_current(self) -> None:
+        # when reaching a new title or section, create the previous node
+        if self.current is not None:
+            if self.current is Form:
+                self.created_main_title = True
+
+            self.nodes.append(self._node(self.current))
+            self.grid = False
+            self._reset()
+            self.current = None
+
+        elif self.created_first_item:
+            self.nodes.append(self._node(ItemKind.TITLE_AND_DESCRIPTION))
+            self.grid = False
+            self._reset()
+
+        else:
+            self.created_first_item = True
+
+    def parse(self, lines: Iterable[str]) -> Iterator[Node]:
+        debug = _logger.isEnabledFor(logging.DEBUG)
+        for i, line in enumerate(lines):
+            if debug:
+                _trace('line', number=i, text=line.rstrip('\n'))
+
+            line = line.strip()
+            if len(line) == 0:
+                continue
+
+            self.parse_line(line)
+            if len(self.nodes) > 0:
+                yield from self.nodes
+                self.nodes.clear()
+
+        self.finish()
+        yield from self.nodes
+        self.nodes.clear()
+
+    def _include(self, include_path: str) -> None:
+        global _fragment_cache
+        if self.include_dir is None:
+            raise ValueError(f'Can not include "{include_path}", includes are not enabled')
+
+        path = os.path.realpath(os.path.join(self.include_dir, include_path))
+        if path in self.including:
+            raise ValueError(f'Include cycle: {" -> ".join((*self.including, path))}')
+
+        try:
+            version = _file_version(path)
+        except OSError as e:
+            raise ValueError(f'Can not include "{include_path}": {e.strerror}') from e
+
+        if _fragment_cache is None:
+            # cache imports this module, so it is imported when first needed
+            from cache import LRUCache
+
+            # entries end with the length of the text they were made from
+            _fragment_cache = LRUCache(max_entries=1024, size_of=lambda entry: entry[-1])
+
+        entry = _fragment_cache.get((path, version))
+        if entry is None:
+            with open(path) as fragment_file:
+                lines = tuple(line for line in (line.strip() for line in fragment_file) if len(line) > 0)
+
+            _fragment_cache.put((path, version), (lines, sum(map(len, lines))))
+
+        else:
+            lines, _ = entry
+
+        parser = Parser(os.path.dirname(path), (*self.including, path))
+        parser.classify = self.classify
+        parser.set_state(self.get_state())
+
+        # the first title or section of the fragment completes the node it continues,
+        # which is different in every document, so the lines up to it are always
+        # parsed. the nodes of the rest of the fragment only depend on the state of
+        # the parser after it, and on the files it includes not having changed
+        start = 0
+        while start < len(lines):
+            start += 1
+            parser.parse_line(lines[start - 1])
+            if classify_line(lines[start - 1])[0] in ('title', 'section'):
+                break
+
+        # the confirmation message does not change how the rest is parsed, it only
+        # goes to the form node if the rest has the main title. so the rest is parsed
+        # without it, marked by None, which is replaced by the message after. a form
+        # node with None was created before the rest set a message of its own, so it
+        # gets the message of the document, even if the rest sets one later
+        message = parser.confirmation_message
+        parser.confirmation_message = None
+        created_main_title = parser.created_main_title
+        key = (path, version, repr(parser.get_state()))
+        rest = _fragment_cache.get(key)
+        if rest is not None and files_changed(rest[2]):
+            rest = None
+
+        first = len(parser.nodes)
+        if rest is None:
+            for line in lines[start:]:
+                parser.parse_line(line)
+
+            # nodes are shared by every document including the fragment, and are
+            # never modified by the code generators
+            _fragment_cache.put(key, (tuple(parser.nodes[first:]), parser.get_state(), dict(parser.included),
+                                      sum(map(len, lines[start:]))))
+
+        else:
+            nodes, state, included, _ = rest
+            parser.nodes.extend(nodes)
+            parser.set_state(state)
+            parser.included.update(included)
+
+        if parser.confirmation_message is None:
+            parser.confirmation_message = message
+
+        if not created_main_title:
+            for i in range(first, len(parser.nodes)):
+                node = parser.nodes[i]
+                if isinstance(node, Form) and node.confirmation_message is None:
+                    parser.nodes[i] = replace(node, confirmation_message=message)
+
+        if _logger.isEnabledFor(logging.DEBUG):
+            _trace('include', path=path, nodes=len(parser.nodes), cached=rest is not None)
+
+        self.nodes.extend(parser.nodes)
+        self.set_state(parser.get_state())
+        self.included[path] = version
+        self.included.update(parser.included)
+
+    def parse_line(self, line: str) -> None:
+        # line must be stripped and not empty
+        if line.startswith('<!--'):
+            path = include_path(line)
+            if path is not None:
+                self._include(path)
+                return
+
+        kind, groups = self.classify(line)
+
+        if kind == 'column_row_checkbox_grid':
+            self.row = groups[0].strip().lower() == 'rows'
+            self.current = ItemKind.CHECKBOX_GRID
+            self.grid = True
+
+        elif kind == 'column_row_radio_button_grid':
+            self.row = groups[0].strip().lower() == 'rows'
+            self.current = ItemKind.GRID
+            self.grid = True
+
+        elif kind == 'title':
+            if self.current is Section:
+                # sections are moved to the end of the form only when followed by a title
+                section = self._node(Section)
+                section.move_to_end = True
+                self.current = None
+                self.nodes.append(section)
+                self.grid = False
+                self._reset()
 
-    args = {
-        'title': '',
-        'confirmation_message': '',
-        'description': '',
-        'required': False,
-        'choices': [],
-        'rows': [],
-        'columns': [],
-        'min': -1,
-        'max': -1,
-        'min_label': '',
-        'max_label': '',
-    }
+            else:
+                self._finish_current()
 
-    for i, line in enumerate(markdown_file.strip().split('\n')):
-        _logger.debug(f'Processing line {i}: {line}')
-        # the order of function calls here matters
-        line = line.strip()
-        if len(line) == 0:
-            continue
+            line = groups[0]
+            # same as matching r'^\*\*(.*)\*\*$', without compiling it at import
+            if len(line) >= 4 and line.startswith('**') and line.endswith('**'):
+                self.required = True
+                self.title = line[2:-2]
 
-        match = _column_row_checkbox_grid_regex.match(line)
-        if match is not None:
-            row = match.group(1).strip().lower() == 'rows'
-            current_function = _create_checkbox_grid_item
-            grid = True
-            continue
+            else:
+                self.title = line
 
-        match = _column_row_radio_button_grid_regex.match(line)
-        if match is not None:
-            row = match.group(1).strip().lower() == 'rows'
-            current_function = _create_grid_item
-            grid = True
-            continue
+        elif kind == 'section':
+            self._finish_current()
+            self.title = groups[0]
+            self.current = Section
 
-        # when reaching a new title or section, create the previous item
-        match = _title_regex.match(line)
-        if match is not None:
-            if current_function is not None:
-                if current_function == _create_form:
-                    created_main_title = True
+        elif kind == 'main_title':
+            if self.created_main_title:
+                raise Exception('Main title already created')
 
-                code += current_function(**args)
-                grid = False
+            self.title = groups[0]
+            self.current = Form
 
-                if current_function == edit_section:
-                    code += _move_section_to_end_of_form(args['title'])
+        elif kind == 'confirmation_message':
+            self.confirmation_message = groups[0]
 
-                _reset_args(args)
-                current_function = None
+        elif kind in _list_item_kinds:
+            # the option text is always the last group of these patterns
+            option = groups[-1]
+            if self.created_first_item:
+                if self.grid:
+                    if self.row:
+                        self.rows.append(option)
+                    else:
+                        self.columns.append(option)
 
-            elif created_first_item:
-                code += _create_title_and_description_item(**args)
-                grid = False
-                _reset_args(args)
+                else:
+                    navigation = _split_navigation(option)
+                    if navigation is not None:
+                        self.choices.append(Choice(*navigation))
 
-            else:
-                created_first_item = True
+                    else:
+                        self.choices.append(Choice(option))
 
-            line = match.group(1)
-            match = _required_regex.match(line)
-            if match is not None:
-                args['required'] = True
-                args['title'] = match.group(1)
+                    self.current = _list_item_kinds[kind]
 
             else:
-                args['title'] = line
-            continue
-
-        match = _section_regex.match(line)
-        if match is not None:
-            if current_function is not None:
-                if current_function == _create_form:
-                    created_main_title = True
-
-                code += current_function(**args)
-                grid = False
-                _reset_args(args)
-                current_function = None
+                # lists before the first item declare the sections of the form
+                if self.current is Form:
+                    self.created_main_title = True
+                    self.nodes.append(self._node(Form))
+                    self._reset()
+                    self.current = None
+                    self.grid = False
+
+                self.nodes.append(PageBreak(option))
+
+        elif kind == 'scale':
+            self.min_label = groups[0]
+            self.min_value = int(groups[1])
+            self.max_value = int(groups[2])
+            self.max_label = groups[3]
+            self.current = ItemKind.SCALE
+
+        elif kind in _line_item_kinds:
+            self.current = _line_item_kinds[kind]
+
+        else:
+            self.description = line
+
+    def get_state(self) -> tuple:
+        # everything that carries over from one line to the next, except the nodes
+        return (self.current, self.created_main_title, self.created_first_item, self.grid, self.row,
+                self.confirmation_message, self.min_value, self.max_value, self.min_label, self.max_label,
+                self.title, self.description, self.required, tuple(self.choices), tuple(self.rows),
+                tuple(self.columns))
+
+    def set_state(self, state: tuple) -> None:
+        (self.current, self.created_main_title, self.created_first_item, self.grid, self.row,
+         self.confirmation_message, self.min_value, self.max_value, self.min_label, self.max_label,
+         self.title, self.description, self.required, choices, rows, columns) = state
+        self.choices = list(choices)
+        self.rows = list(rows)
+        self.columns = list(columns)
+
+    def resume_section(self, line: str) -> None:
+        # starts at a section line whose previous node was already completed, as
+        # when the document is converted one section at a time
+        _, groups = classify_line(line)
+        self.title = groups[0]
+        self.current = Section
+
+    def finish(self) -> None:
+        # finished reading the file, create the last node
+        if self.current is not None:
+            self.nodes.append(self._node(self.current))
+            self._reset()
+            self.current = None
+
+
+def parse_nodes(lines: Iterable[str], include_dir: str | os.PathLike | None = None) -> Iterator[Node]:
+    # yields the nodes of the form as soon as each one is complete. the Form node
+    # only carries the form properties, the other nodes are yielded after it.
+    # '<!-- include: path -->' lines are replaced by the markdown of the file at
+    # path, relative to include_dir, and are an error when include_dir is None
+    return Parser(None if include_dir is None else os.fspath(include_dir)).parse(lines)
+
+
+def parse_markdown(lines: Iterable[str], include_dir: str | os.PathLike | None = None) -> Form:
+    # parses the whole markdown into a Form holding all its nodes, which can then be
+    # given to any of the code generators
+    form = Form()
+    for node in parse_nodes(lines, include_dir):
+        if isinstance(node, Form):
+            form.title = node.title
+            form.description = node.description
+            form.confirmation_message = node.confirmation_message
+
+        else:
+            form.nodes.append(node)
+
+    return form
+
+
+def form_items(form: Form) -> list[Item | Section]:
+    # the items of the form in the order they end up after running the script,
+    # with sections standing for their page breaks. a page break moved to the end
+    # leaves None in its old place, so moves do not search or shift the list
+    items = []
+    page_breaks = {}
+    # index in items of the page break of each title
+    indices = {}
+    for node in form.nodes:
+        if isinstance(node, Item):
+            items.append(node)
+
+        elif isinstance(node, PageBreak):
+            # sections["title"] refers to the last page break with that title
+            page_breaks[node.title] = Section(node.title)
+            indices[node.title] = len(items)
+            items.append(page_breaks[node.title])
+
+        else:
+            page_break = page_breaks.get(node.title)
+            if page_break is None:
+                raise ValueError(f'Section "{node.title}" is not in the list of sections of the form')
+
+            if len(node.description) > 0:
+                page_break.description = node.description
+
+            if node.move_to_end:
+                items[indices[node.title]] = None
+                indices[node.title] = len(items)
+                items.append(page_break)
+
+    return [item for item in items if item is not None]
+
+
+@dataclass(slots=True)
+class ConversionStats:
+    # what conversions given this object converted and where their time went.
+    # seconds has the time of each stage: parse (which includes classify, matching
+    # the lines against the patterns), generate (the code of each node, also split
+    # by kind of node in node_seconds) and assemble (joining the script)
+    conversions: int = 0
+    lines: int = 0
+    input_bytes: int = 0
+    output_bytes: int = 0
+    seconds: Counter[str] = field(default_factory=Counter)
+    nodes: Counter[str] = field(default_factory=Counter)
+    node_seconds: Counter[str] = field(default_factory=Counter)
+
+    def update(self, other: 'ConversionStats') -> None:
+        # adds the stats of other conversions to these
+        self.conversions += other.conversions
+        self.lines += other.lines
+        self.input_bytes += other.input_bytes
+        self.output_bytes += other.output_bytes
+        self.seconds.update(other.seconds)
+        self.nodes.update(other.nodes)
+        self.node_seconds.update(other.node_seconds)
+
+
+def timed(function: Callable, stats: ConversionStats, stage: str) -> Callable:
+    # wraps function to add the time spent in it to a stage of stats
+    def timed_function(*args):
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            stats.seconds[stage] += time.perf_counter() - start
+
+    return timed_function
+
+
+def _count_lines(lines: Iterable[str], stats: ConversionStats) -> Iterator[str]:
+    for line in lines:
+        stats.lines += 1
+        stats.input_bytes += len(line.encode())
+        yield line
+
+
+def _time_nodes(nodes: Iterable[Node], stats: ConversionStats) -> Iterator[Node]:
+    # nodes are parsed lazily, so parsing takes the time spent waiting for each one
+    nodes = iter(nodes)
+    while True:
+        start = time.perf_counter()
+        node = next(nodes, None)
+        stats.seconds['parse'] += time.perf_counter() - start
+        if node is None:
+            return
+
+        yield node
+
+
+def _count_output(fragments: Iterable[str], stats: ConversionStats) -> Iterator[str]:
+    for fragment in fragments:
+        stats.output_bytes += len(fragment.encode())
+        yield fragment
+
+
+def _parse_nodes_with_stats(lines: Iterable[str], stats: ConversionStats,
+                            include_dir: str | os.PathLike | None = None) -> Iterator[Node]:
+    stats.conversions += 1
+    parser = Parser(None if include_dir is None else os.fspath(include_dir))
+    parser.classify = timed(classify_line, stats, 'classify')
+    return _time_nodes(parser.parse(_count_lines(lines, stats)), stats)
+
+
+def generate_node(node: Node, layout: FormLayout, shared: SharedArrays | None = None,
+                  style: Style = normal_style) -> Iterator[str]:
+    # fragments of the script creating the node, placed in the form by layout
+    debug = _logger.isEnabledFor(logging.DEBUG)
+
+    if isinstance(node, Item):
+        if debug:
+            _trace('create_item', **asdict(node))
+
+        layout.add_item()
+        yield create_item(node, style, shared)
+
+    elif isinstance(node, Section):
+        if debug:
+            _trace('edit_section', **asdict(node))
+
+        yield edit_section(node, style.compact)
+        if node.move_to_end:
+            from_index = layout.move_to_end(node.title)
+            # there is nothing to move if the page break is already the last item
+            if from_index is None or from_index != layout.items - 1:
+                yield _move_section_to_end_of_form(node.title, from_index, layout.items - 1, style)
+
+    elif isinstance(node, PageBreak):
+        if debug:
+            _trace('create_page_break', **asdict(node))
+
+        layout.add_page_break(node.title)
+        yield _create_section(node, style)
 
-            elif created_first_item:
-                code += _create_title_and_description_item(**args)
-                grid = False
-                _reset_args(args)
+    else:
+        if node.title is not None:
+            if debug:
+                _trace('create_form', title=node.title, description=node.description,
+                       confirmation_message=node.confirmation_message)
 
-            else:
-                created_first_item = True
+            yield _create_form(node, style)
 
-            args['title'] = match.group(1)
-            current_function = edit_section
-            continue
+        for child in node.nodes:
+            yield from generate_node(child, layout, shared, style)
 
-        match = _main_title_regex.match(line)
-        if match is not None:
-            if created_main_title:
-                raise Exception('Main title already created')
 
-            args['title'] = match.group(1)
-            current_function = _create_form
-            continue
-
-        match = _confirmation_message_regex.match(line)
-        if match is not None:
-            confirmation_message = match.group(1)
-            args['confirmation_message'] = confirmation_message
-            continue
-
-        match = _paragraph_regex.match(line)
-        if match is not None:
-            current_function = _create_paragraph_text_item
-            continue
-
-        match = _short_text_regex.match(line)
-        if match is not None:
-            current_function = _create_short_text_item
-            continue
-
-        match = _checkbox_regex.match(line)
-        if match is not None:
-            if created_first_item:
-                if grid:
-                    if row:
-                        args['rows'].append(match.group(2))
-                    else:
-                        args['columns'].append(match.group(2))
+def generate_node_with_stats(node: Node, layout: FormLayout, shared: SharedArrays | None, style: Style,
+                             stats: ConversionStats) -> list[str]:
+    # fragments of generate_node, counting the node and its time in stats
+    if isinstance(node, Form) and len(node.nodes) > 0:
+        # the children of parsed forms are timed on their own
+        fragments = generate_node_with_stats(replace(node, nodes=[]), layout, shared, style, stats)
+        for child in node.nodes:
+            fragments.extend(generate_node_with_stats(child, layout, shared, style, stats))
 
-                else:
-                    option = match.group(2)
-                    match = _navigation_regex.match(option)
-                    if match is not None:
-                        option = match.group(1)
-                        section = match.group(2)
-                        args['choices'].append(f'item.createChoice("{option}", sections["{section}"])')
+        return fragments
 
-                    else:
-                        args['choices'].append(option)
+    start = time.perf_counter()
+    fragments = list(generate_node(node, layout, shared, style))
+    elapsed = time.perf_counter() - start
 
-                    current_function = _create_checkbox_item
+    if isinstance(node, Item):
+        kind = node.kind.value
+    else:
+        kind = {Form: 'form', Section: 'section', PageBreak: 'page_break'}[type(node)]
+
+    stats.nodes[kind] += 1
+    stats.node_seconds[kind] += elapsed
+    stats.seconds['generate'] += elapsed
+    return fragments
+
+
+def generate_code(nodes: Form | Iterable[Node], share_choices: bool = False, compact: bool = False,
+                  stats: ConversionStats | None = None) -> Iterator[str]:
+    # generates the script for a parsed form, or for the nodes yielded by parse_nodes.
+    # with share_choices, lists used by the items are defined once after createForm
+    yield begin_create_form(compact)
+
+    if isinstance(nodes, Form):
+        nodes = (nodes,)
+
+    layout = FormLayout()
+    shared = SharedArrays() if share_choices else None
+    style = compact_style if compact else normal_style
+    for node in nodes:
+        if stats is None:
+            yield from generate_node(node, layout, shared, style)
+        else:
+            yield from generate_node_with_stats(node, layout, shared, style, stats)
+
+    yield end_create_form(compact)
+    if shared is not None:
+        yield shared.code()
+
+
+# time an execution can spend creating chunks before it stops and schedules
+# another execution, leaving room for the last chunk within the 6 minutes limit
+_CHUNK_TIME_BUDGET = 4 * 60 * 1000
+
+_chunked_create_form = '''
+function createForm() {{
+  // creates the form one chunk of items at a time. when an execution runs out of
+  // time, its progress is kept in the script properties and a trigger runs this
+  // function again to continue from where it stopped. if an execution is killed
+  // in the middle of a chunk, running this function again undoes that chunk
+  var properties = PropertiesService.getScriptProperties();
+  var state = JSON.parse(properties.getProperty("createFormState") || "null");
+  var start = Date.now();
+  var chunks = [{chunks}];
+  // number of items after each chunk, and the positions the sections moved by
+  // each chunk were at before it
+  var chunkItems = [{chunk_items}];
+  var chunkSections = [{chunk_sections}];
+  var form;
+  var sections = {{}};
+
+  if (state === null) {{
+{header}
+    state = {{formId: form.getId(), chunk: 0, items: 0, sections: {{}}}};
+    properties.setProperty("createFormState", JSON.stringify(state));
+  }} else {{
+    form = FormApp.openById(state.formId);
+    for (var title in state.sections) {{
+      sections[title] = form.getItemById(state.sections[title]).asPageBreakItem();
+    }}
+
+    // undoes what the interrupted chunk did, if anything. it may have moved
+    // sections without creating any item, so this does not only happen when
+    // there are more items than when it started
+    var ids = form.getItems().map(function (item) {{ return item.getId(); }});
+    var kept = {{}};
+    for (var title in state.sections) {{
+      kept[state.sections[title]] = true;
+    }}
+
+    // removes the items it created, which are the last ones apart from the
+    // sections it moved to the end
+    for (var i = ids.length - 1; i >= 0 && ids.length > state.items; i--) {{
+      if (!kept[ids[i]]) {{
+        form.deleteItem(i);
+        ids.splice(i, 1);
+      }}
+    }}
+
+    // and puts the sections it moved back where they were
+    var positions = chunkSections[state.chunk] || {{}};
+    var titles = Object.keys(positions).sort(function (a, b) {{ return positions[a] - positions[b]; }});
+    titles.forEach(function (title) {{
+      var from = ids.indexOf(state.sections[title]);
+      if (from !== positions[title]) {{
+        form.moveItem(from, positions[title]);
+        ids.splice(positions[title], 0, ids.splice(from, 1)[0]);
+      }}
+    }});
+  }}
+
+  while (state.chunk < chunks.length) {{
+    if (Date.now() - start > {time_budget}) {{
+      ScriptApp.newTrigger("createForm").timeBased().after(1000).create();
+      return;
+    }}
+
+    chunks[state.chunk](form, sections);
+    state.items = chunkItems[state.chunk];
+    state.chunk++;
+    for (var title in sections) {{
+      state.sections[title] = sections[title].getId();
+    }}
+    properties.setProperty("createFormState", JSON.stringify(state));
+  }}
+
+  properties.deleteProperty("createFormState");
+  ScriptApp.getProjectTriggers().forEach(function (trigger) {{
+    if (trigger.getHandlerFunction() === "createForm") {{
+      ScriptApp.deleteTrigger(trigger);
+    }}
+  }});
+}}'''
+
+
+def _generate_chunked_code(nodes: Iterable[Node], chunk_size: int, share_choices: bool = False,
+                           compact: bool = False, stats: ConversionStats | None = None) -> Iterator[str]:
+    # splits the script into functions that create about chunk_size items each,
+    # followed by a createForm function that runs them across as many executions
+    # as needed. chunks are yielded as soon as they are complete. compact only
+    # applies to the chunks, since createForm is the same for every form
+    import json
+
+    layout = FormLayout(moved_since=[])
+    shared = SharedArrays() if share_choices else None
+    style = compact_style if compact else normal_style
+    header = ''
+    chunk = []
+    chunk_start = 0
+    chunk_items = []
+    chunk_sections = []
+
+    def close_chunk() -> str:
+        if style.compact:
+            code = f'function createFormChunk{len(chunk_items)}({style.form},{style.sections}){{\n{"".join(chunk)}}}\n'
+        else:
+            code = f'function createFormChunk{len(chunk_items)}(form, sections) {{\n{"".join(chunk)}}}\n\n'
+        chunk.clear()
+        chunk_items.append(layout.items)
+        chunk_sections.append(json.dumps(layout.checkpoint(), ensure_ascii=False))
+        return code
+
+    def flatten(nodes: Iterable[Node]) -> Iterator[Node]:
+        nonlocal header
+        for node in nodes:
+            if isinstance(node, Form):
+                if node.title is not None:
+                    start = time.perf_counter()
+                    header = _create_form(node)
+                    if stats is not None:
+                        stats.nodes['form'] += 1
+                        stats.node_seconds['form'] += time.perf_counter() - start
+                        stats.seconds['generate'] += time.perf_counter() - start
+
+                yield from node.nodes
 
             else:
-                if current_function == _create_form:
-                    created_main_title = True
-                    code += current_function(**args)
-                    _reset_args(args)
-                    current_function = None
-                    grid = False
-
-                code += _create_section(title=match.group(2))
-
-            continue
-
-        match = _radio_button_regex.match(line)
-        if match is not None:
-            if created_first_item:
-                if grid:
-                    if row:
-                        args['rows'].append(match.group(1))
-                    else:
-                        args['columns'].append(match.group(1))
+                yield node
+
+    for node in flatten(nodes):
+        if stats is None:
+            chunk.extend(generate_node(node, layout, shared, style))
+        else:
+            chunk.extend(generate_node_with_stats(node, layout, shared, style, stats))
+        if layout.items - chunk_start >= chunk_size:
+            chunk_start = layout.items
+            yield close_chunk()
+
+    if len(chunk) > 0:
+        yield close_chunk()
+
+    yield _chunked_create_form.format(
+        chunks=', '.join(f'createFormChunk{i}' for i in range(len(chunk_items))),
+        chunk_items=', '.join(str(items) for items in chunk_items),
+        chunk_sections=', '.join(chunk_sections),
+        header=textwrap.indent(header, '  '),
+        time_budget=_CHUNK_TIME_BUDGET,
+    )
+    if shared is not None:
+        yield shared.code()
+
+
+def generate_google_apps_script(lines: Iterable[str], chunk_size: int | None = None, share_choices: bool = False,
+                                compact: bool = False, stats: ConversionStats | None = None,
+                                include_dir: str | os.PathLike | None = None) -> Iterator[str]:
+    # lines can be any iterable of lines, like an open file or sys.stdin, and
+    # each fragment of the script is yielded as soon as its item is complete.
+    # with chunk_size, the script creates the form in chunks of that many items
+    # spread over as many executions as needed. with share_choices, identical
+    # choice, row and column lists are defined once and shared by the items.
+    # compact generates code without indentation, blank lines or long names.
+    # stats, if given, is updated with the stats of the conversion. include_dir
+    # enables include lines, see parse_nodes
+    if stats is None:
+        nodes = parse_nodes(lines, include_dir)
+    else:
+        nodes = _parse_nodes_with_stats(lines, stats, include_dir)
 
-                else:
-                    option = match.group(1)
-                    match = _navigation_regex.match(option)
-                    if match is not None:
-                        option = match.group(1)
-                        section = match.group(2)
-                        args['choices'].append(f'item.createChoice("{option}", sections["{section}"])')
+    if chunk_size is not None:
+        fragments = _generate_chunked_code(nodes, chunk_size, share_choices, compact, stats)
+    else:
+        fragments = generate_code(nodes, share_choices, compact, stats)
 
-                    else:
-                        args['choices'].append(option)
+    if stats is not None:
+        fragments = _count_output(fragments, stats)
 
-                    current_function = _create_multiple_choice_item
+    return fragments
 
-            else:
-                if current_function == _create_form:
-                    created_main_title = True
-                    code += current_function(**args)
-                    _reset_args(args)
-                    current_function = None
-                    grid = False
-
-                code += _create_section(title=match.group(1))
-
-            continue
-
-        match = _combobox_regex.match(line)
-        if match is not None:
-            if created_first_item:
-                if grid:
-                    if row:
-                        args['rows'].append(match.group(1))
-                    else:
-                        args['columns'].append(match.group(1))
 
-                else:
-                    option = match.group(1)
-                    match = _navigation_regex.match(option)
-                    if match is not None:
-                        option = match.group(1)
-                        section = match.group(2)
-                        args['choices'].append(f'item.createChoice("{option}", sections["{section}"])')
+def create_google_apps_script(markdown_file: str, output: TextIOBase | None = None, chunk_size: int | None = None,
+                              share_choices: bool = False, compact: bool = False, stats: ConversionStats | None = None,
+                              include_dir: str | os.PathLike | None = None) -> str | None:
+    # if output is given the script is written to it as it is generated and
+    # nothing is returned
+    code = _CodeEmitter(output)
+    if stats is None:
+        for fragment in generate_google_apps_script(iter_lines(markdown_file), chunk_size, share_choices, compact,
+                                                    include_dir=include_dir):
+            code.emit(fragment)
 
-                    else:
-                        args['choices'].append(option)
-                    current_function = _create_list_item
+        return code.getvalue()
 
-            else:
-                if current_function == _create_form:
-                    created_main_title = True
-                    code += current_function(**args)
-                    _reset_args(args)
-                    current_function = None
-                    grid = False
-
-                code += _create_section(title=match.group(1))
-
-            continue
-
-        match = _scale_regex.match(line)
-        if match is not None:
-            args['min_label'] = match.group(1)
-            args['min'] = match.group(2)
-            args['max'] = match.group(3)
-            args['max_label'] = match.group(4)
-            current_function = _create_scale_item
-            continue
-
-        match = _date_time_regex.match(line)
-        if match is not None:
-            current_function = _create_date_time_item
-            continue
-
-        match = _date_regex.match(line)
-        if match is not None:
-            current_function = _create_date_item
-            continue
-
-        match = _duration_regex.match(line)
-        if match is not None:
-            current_function = _create_duration_item
-            continue
-
-        match = _time_regex.match(line)
-        if match is not None:
-            current_function = _create_time_item
-            continue
-
-        args['description'] = line
-
-    # finished reading the file, create the last item
-    if current_function is not None:
-        code += current_function(**args)
-        _reset_args(args)
-        current_function = None
-
-    code += end_create_form()
-
-    return code
\ No newline at end of file
+    emit = timed(code.emit, stats, 'assemble')
+    for fragment in generate_google_apps_script(iter_lines(markdown_file), chunk_size, share_choices, compact,
+                                                stats, include_dir):
+        emit(fragment)
+
+    # the lines were split at the newlines, which were not counted
+    stats.input_bytes += markdown_file.count('\n')
+    return timed(code.getvalue, stats, 'assemble')()
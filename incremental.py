@@ -0,0 +1,157 @@
+import logging
+import os
+import time
+
+from cache import LRUCache, content_key
+from google_forms import (ConversionStats, FormLayout, Parser, Section, SharedArrays, begin_create_form, classify_line,
+                          compact_style, end_create_form, generate_node, generate_node_with_stats, include_path,
+                          iter_lines, normal_style, timed)
+
+
+_logger = logging.getLogger(__name__)
+
+# what is cached for each section, see IncrementalConverter._convert_section
+_CachedSection = tuple[str, tuple, dict[str, str] | None, list[tuple], tuple[tuple[str, int | None], ...]]
+
+
+def _split_sections(markdown_file: str) -> list[list[str]]:
+    # splits the stripped, non empty lines at every section (##) line. the first
+    # chunk holds everything before the first section
+    chunks = [[]]
+    for line in iter_lines(markdown_file):
+        line = line.strip()
+        if len(line) == 0:
+            continue
+
+        if line.startswith('##') and not line.startswith('###') and len(chunks[-1]) > 0:
+            chunks.append([])
+
+        chunks[-1].append(line)
+
+    return chunks
+
+
+class IncrementalConverter:
+    # converts markdown like create_google_apps_script, but keeps the code generated
+    # for each section in a cache keyed by its content, so converting a document
+    # again after a small change only regenerates the sections that changed.
+    #
+    # a section's code depends on its own lines, on whether it is the last one, on
+    # the parser state left by the previous sections and on the number of items
+    # before it, which are part of the cache key, and on the indices of the page
+    # breaks it moves, which are checked when it is found. so editing the text of an
+    # item only regenerates its section, while adding or removing items also
+    # regenerates the sections after it that move page breaks. the changes a
+    # section made to the layout of the form are cached too, and replayed.
+    #
+    # with share_choices, the code of a section refers to shared lists defined after
+    # createForm, so the definitions it uses are cached together with it.
+    #
+    # sections including other files are always regenerated, since the files may
+    # have changed, but the included files are only parsed again if they did
+    def __init__(self, cache: LRUCache | None = None, share_choices: bool = False, compact: bool = False,
+                 include_dir: str | os.PathLike | None = None):
+        if cache is None:
+            cache = LRUCache(max_entries=4096, max_bytes=64 * 2**20, size_of=lambda value: len(value[0]))
+
+        self.cache = cache
+        self.share_choices = share_choices
+        self.compact = compact
+        self.include_dir = None if include_dir is None else os.fspath(include_dir)
+        # number of sections of the last conversion, and how many were regenerated
+        self.sections = 0
+        self.regenerated = 0
+        # version of every file the last conversion included
+        self.included = {}
+
+    def _convert_section(self, lines: list[str], last: bool, state: tuple | None, layout: FormLayout,
+                         stats: ConversionStats | None = None) -> _CachedSection:
+        # generates the code of the section, updating layout, and returns it with the
+        # parser state after it, the shared lists it uses, the changes it made to
+        # layout and the indices of the page breaks it moved, from before it
+        start = time.perf_counter()
+        parser = Parser(self.include_dir)
+        if stats is not None:
+            parser.classify = timed(classify_line, stats, 'classify')
+
+        if state is not None:
+            # the previous section already completed everything before this line
+            parser.set_state(state)
+            parser.resume_section(lines[0])
+            lines = lines[1:]
+
+        for line in lines:
+            parser.parse_line(line)
+
+        if last:
+            parser.finish()
+        else:
+            # the next section line completes the pending node, which belongs here
+            parser.parse_line('##')
+
+        self.included.update(parser.included)
+        moved = tuple((node.title, layout.index(node.title)) for node in parser.nodes
+                      if isinstance(node, Section) and node.move_to_end)
+        layout.log = []
+        shared = SharedArrays() if self.share_choices else None
+        style = compact_style if self.compact else normal_style
+        if stats is None:
+            code = ''.join(fragment for node in parser.nodes
+                           for fragment in generate_node(node, layout, shared, style))
+        else:
+            stats.seconds['parse'] += time.perf_counter() - start
+            code = ''.join(fragment for node in parser.nodes
+                           for fragment in generate_node_with_stats(node, layout, shared, style, stats))
+
+        log = layout.log
+        layout.log = None
+        return code, parser.get_state(), None if shared is None else shared.definitions, log, moved
+
+    def convert(self, markdown_file: str, stats: ConversionStats | None = None) -> str:
+        # stats, if given, is updated with the stats of the conversion. the sections
+        # found in the cache take no time to parse or generate
+        chunks = _split_sections(markdown_file)
+        state = None
+        layout = FormLayout()
+        fragments = [begin_create_form(self.compact)]
+        shared = SharedArrays() if self.share_choices else None
+        self.sections = len(chunks)
+        self.regenerated = 0
+        self.included = {}
+
+        for i, lines in enumerate(chunks):
+            last = i == len(chunks) - 1
+            key = content_key('\n'.join(lines), last, state, layout.items, self.share_choices, self.compact)
+            includes = any(line.startswith('<!--') and include_path(line) is not None for line in lines)
+            cached = None if includes else self.cache.get(key)
+            if cached is not None and all(layout.index(title) == index for title, index in cached[4]):
+                layout.replay(cached[3])
+
+            else:
+                cached = self._convert_section(lines, last, state, layout, stats)
+                if not includes:
+                    self.cache.put(key, cached)
+
+                self.regenerated += 1
+
+            code, state, definitions, _, _ = cached
+            fragments.append(code)
+            if shared is not None:
+                shared.update(definitions)
+
+        fragments.append(end_create_form(self.compact))
+        if shared is not None:
+            fragments.append(shared.code())
+
+        start = time.perf_counter()
+        script = ''.join(fragments)
+        if stats is not None:
+            stats.seconds['assemble'] += time.perf_counter() - start
+            stats.conversions += 1
+            stats.lines += markdown_file.count('\n') + 1
+            stats.input_bytes += len(markdown_file.encode())
+            stats.output_bytes += len(script.encode())
+
+        _logger.debug('Regenerated %d of %d sections', self.regenerated, self.sections)
+
+        return script
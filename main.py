@@ -1,17 +1,305 @@
 import argparse
+import glob
 import logging
+import sys
+import time
+from contextlib import nullcontext
 from pathlib import Path
 
-from google_forms import create_google_apps_script
+from google_forms import (ConversionStats, create_google_apps_script, files_changed, generate_google_apps_script,
+                          iter_lines, parse_markdown)
+
+
+_logger = logging.getLogger(__name__)
+
+
+class _TraceFormatter(logging.Formatter):
+    # formats debug events of the converter as one json object per line, and any
+    # other record as its usual message
+    def format(self, record: logging.LogRecord) -> str:
+        if hasattr(record, 'event'):
+            import json
+
+            return json.dumps({'time': record.created, 'logger': record.name, 'event': record.event,
+                               **record.fields}, default=str)
+
+        return super().format(record)
+
+
+def _print_stats(stats: ConversionStats, elapsed: float) -> None:
+    # summary of where the time of the conversions went, written to stderr so it
+    # does not mix with the script
+    lines = [f'{stats.conversions} conversion(s) of {stats.lines} lines ({stats.input_bytes / 1024:.1f}KB) into '
+             f'{stats.output_bytes / 1024:.1f}KB in {elapsed * 1e3:.1f}ms',
+             f'{"stage":<24}{"ms":>10}']
+    for stage in ('parse', 'classify', 'generate', 'assemble'):
+        if stage not in stats.seconds:
+            # scripts written as they are generated are never assembled
+            continue
+
+        # classification is part of parsing
+        name = f'  {stage}' if stage == 'classify' else stage
+        lines.append(f'{name:<24}{stats.seconds[stage] * 1e3:>10.2f}')
+
+    lines.append(f'{"node":<24}{"count":>10}{"ms":>10}{"us/node":>10}')
+    for kind, seconds in stats.node_seconds.most_common():
+        count = stats.nodes[kind]
+        lines.append(f'{kind:<24}{count:>10}{seconds * 1e3:>10.2f}{seconds * 1e6 / count:>10.1f}')
+
+    print('\n'.join(lines), file=sys.stderr)
+
+
+def _positive_int(value: str) -> int:
+    # argparse type of counts that must be at least 1
+    if not value.isdecimal() or int(value) < 1:
+        raise argparse.ArgumentTypeError(f'must be a positive integer, not {value}')
+
+    return int(value)
+
+
+def _glob_root(pattern: str) -> Path:
+    # the directory a glob pattern searches in, made of its parts before the first
+    # one with magic
+    root = Path()
+    for part in Path(pattern).parent.parts:
+        if glob.has_magic(part):
+            break
+
+        root /= part
+
+    return root
+
+
+def _expand_inputs(markdown_files: list[str], output_dir: str | None) -> list[tuple[Path, Path]]:
+    # returns (markdown file, script file) pairs for every file, directory or glob
+    # pattern given. files found inside a directory or by a glob pattern keep their
+    # path relative to it under output_dir. files that would be converted into the
+    # same script are an error, instead of one silently overwriting the other
+    pairs = []
+    sources = {}
+    for markdown_file in markdown_files:
+        path = Path(markdown_file)
+        if path.is_dir():
+            found = [(p, p.relative_to(path)) for p in sorted(path.rglob('*.md'))]
+
+        elif glob.has_magic(markdown_file):
+            root = _glob_root(markdown_file)
+            found = [(Path(p), Path(p).relative_to(root)) for p in sorted(glob.glob(markdown_file, recursive=True))]
+
+        else:
+            found = [(path, Path(path.name))]
+
+        for markdown_path, relative_path in found:
+            if output_dir is None:
+                script_path = markdown_path.with_suffix('.gs')
+            else:
+                script_path = Path(output_dir) / relative_path.with_suffix('.gs')
+
+            # the same file given twice, as in a directory and a glob pattern, is only
+            # converted once
+            if script_path not in sources:
+                sources[script_path] = markdown_path
+                pairs.append((markdown_path, script_path))
+
+            elif sources[script_path] != markdown_path:
+                raise ValueError(f'{sources[script_path]} and {markdown_path} would both be converted into '
+                                 f'{script_path}')
+
+    return pairs
+
+
+def _check(markdown_file: str, include_dir: Path | None = None) -> None:
+    # raises an error for markdown that would not create the intended form, before
+    # its script is generated. the validator is only imported when checking
+    from validate import validate_markdown
+
+    errors = [diagnostic for diagnostic in validate_markdown(markdown_file, include_dir)
+              if diagnostic.severity == 'error']
+    if len(errors) > 0:
+        raise ValueError(f'{errors[0]}{f" (and {len(errors) - 1} more errors)" if len(errors) > 1 else ""}')
+
+
+def _convert_file(markdown_path: Path, script_path: Path, chunk_size: int | None = None,
+                  share_choices: bool = False, compact: bool = False, profile: bool = False,
+                  check: bool = False) -> tuple[float, ConversionStats | None]:
+    # converts a single file, returning how long it took, and its stats if profiling.
+    # with check, a file with errors fails without writing its script
+    start = time.perf_counter()
+    stats = ConversionStats() if profile else None
+    checked = None
+    if check:
+        markdown_file = markdown_path.read_text()
+        _check(markdown_file, markdown_path.parent)
+        # the text that was checked is converted, without reading the file again
+        checked = nullcontext(iter_lines(markdown_file))
+
+    script_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        with markdown_path.open() if checked is None else checked as lines, script_path.open('w') as script_file:
+            for fragment in generate_google_apps_script(lines, chunk_size, share_choices, compact, stats,
+                                                        markdown_path.parent):
+                script_file.write(fragment)
+
+            script_file.write('\n')
+
+    except BaseException:
+        # do not leave a partial script behind
+        script_path.unlink(missing_ok=True)
+        raise
+
+    return time.perf_counter() - start, stats
+
+
+def _convert_with_manifest(markdown_file: str, manifest_path: Path, form_id: str | None = None,
+                           chunk_size: int | None = None, share_choices: bool = False, compact: bool = False,
+                           stats: ConversionStats | None = None, include_dir: Path | None = None) -> str:
+    # converts markdown_file and saves the manifest of the resulting form. with
+    # form_id, returns a script updating that form from the version in the saved
+    # manifest, instead of one creating it from scratch
+    import json
+
+    from update import form_manifest, generate_update_script
+
+    form = parse_markdown(iter_lines(markdown_file), include_dir)
+    if form_id is None:
+        script = create_google_apps_script(markdown_file, None, chunk_size, share_choices, compact, stats,
+                                           include_dir)
+    else:
+        script = generate_update_script(form, json.loads(manifest_path.read_text()), form_id, compact)
+
+    manifest_path.write_text(json.dumps(form_manifest(form), ensure_ascii=False, indent=2) + '\n')
+    return script
+
+
+def _convert_batch(pairs: list[tuple[Path, Path]], workers: int | None, chunk_size: int | None = None,
+                   share_choices: bool = False, compact: bool = False, profile: bool = False,
+                   check: bool = False) -> int:
+    # converts all files in parallel. a file that fails is reported and does not
+    # stop the others. returns the number of failed files
+    # multiprocessing is slow to import, so single conversions do not load it
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    start = time.perf_counter()
+    failed = 0
+    total_stats = ConversionStats()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_convert_file, *pair, chunk_size, share_choices, compact, profile, check): pair
+                   for pair in pairs}
+        for future in as_completed(futures):
+            markdown_path, script_path = futures[future]
+            try:
+                elapsed, stats = future.result()
+                print(f'{elapsed * 1e3:10.1f}ms  {markdown_path} -> {script_path}')
+                if stats is not None:
+                    total_stats.update(stats)
+
+            except Exception as e:
+                failed += 1
+                print(f'{"FAILED":>12}  {markdown_path}: {e}')
+                _logger.debug('Error converting %s', markdown_path, exc_info=e)
+
+    print(f'Converted {len(pairs) - failed} of {len(pairs)} files in {time.perf_counter() - start:.2f}s'
+          f'{f", {failed} failed" if failed > 0 else ""}')
+
+    if profile:
+        # the time of each file added up, not the time of the whole batch
+        _print_stats(total_stats, sum(total_stats.seconds[stage] for stage in ('parse', 'generate', 'assemble')))
+
+    return failed
+
+
+def _watch(markdown_path: Path, script_path: Path, interval: float, share_choices: bool = False,
+           compact: bool = False, profile: bool = False, check: bool = False) -> None:
+    # converts the file again whenever it or a file it includes changes, regenerating
+    # only the sections that changed since the last conversion. with check, versions
+    # with errors are reported without converting them
+    from incremental import IncrementalConverter
+
+    converter = IncrementalConverter(share_choices=share_choices, compact=compact, include_dir=markdown_path.parent)
+    last_modified = None
+    # versions of the files included by the last conversion, as they were read
+    included = {}
+    # a failed conversion is retried until it works, since the file it could not
+    # include may be created later, but its error is only printed once
+    error = None
+
+    while True:
+        modified = markdown_path.stat().st_mtime_ns
+        if modified != last_modified or files_changed(included) or error is not None:
+            last_modified = modified
+            start = time.perf_counter()
+            stats = ConversionStats() if profile else None
+            try:
+                markdown_file = markdown_path.read_text()
+                if check:
+                    _check(markdown_file, markdown_path.parent)
+
+                script = converter.convert(markdown_file, stats)
+                script_path.write_text(script + '\n')
+                print(f'{(time.perf_counter() - start) * 1e3:10.1f}ms  {markdown_path} -> {script_path} '
+                      f'({converter.regenerated} of {converter.sections} sections regenerated)')
+                if stats is not None:
+                    _print_stats(stats, time.perf_counter() - start)
+
+                error = None
+
+            except Exception as e:
+                if str(e) != error:
+                    print(f'{"FAILED":>12}  {markdown_path}: {e}')
+
+                error = str(e)
+
+            included = converter.included
+
+        time.sleep(interval)
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
-    parser.add_argument('markdown_file', type=str,
-                        help='path to markdown file')
+    parser.add_argument('markdown_file', type=str, nargs='*',
+                        help='path to markdown file, or - to read from stdin. Giving more than one file, a directory '
+                             'or a glob pattern converts all of them, writing one .gs file for each')
     parser.add_argument('-l', '--log_level', type=str, default='warning',
                         choices=('debug', 'info', 'warning', 'error', 'critical'),
                         help='log level')
+    parser.add_argument('-o', '--output_dir', type=str,
+                        help='directory where the .gs files are written, instead of next to each markdown file. '
+                             'Always converts in batch mode')
+    parser.add_argument('-j', '--workers', type=_positive_int,
+                        help='number of processes converting files in batch mode, defaults to the number of CPUs')
+    parser.add_argument('-w', '--watch', action='store_true',
+                        help='keep converting the markdown file into a .gs file whenever it changes')
+    parser.add_argument('--interval', type=float, default=0.5,
+                        help='seconds between checks for changes in watch mode')
+    parser.add_argument('-c', '--chunk_size', type=_positive_int,
+                        help='create the form in chunks of this many items, spreading them over as many executions '
+                             'as needed to stay within the Apps Script execution time limit')
+    parser.add_argument('-s', '--share_choices', action='store_true',
+                        help='define identical choice, row and column lists once and share them between items')
+    parser.add_argument('--compact', action='store_true',
+                        help='generate the script without indentation, blank lines or long variable names')
+    parser.add_argument('--profile', action='store_true',
+                        help='print to stderr the time spent in each stage of the conversion and per kind of item')
+    parser.add_argument('--manifest', type=str,
+                        help='json file where a manifest of the generated form is saved, to later update the form '
+                             'with --form_id. Only for a single markdown file')
+    parser.add_argument('--form_id', type=str,
+                        help='id of a form created or last updated by the script whose --manifest is given. Instead '
+                             'of a script creating the form, generates one that only adds, edits, moves and deletes '
+                             'the items that changed since')
+    parser.add_argument('--serve', action='store_true',
+                        help='keep running as a daemon that converts markdown sent to --socket, for editors '
+                             'converting a form whenever it is saved. See daemon_client.py')
+    parser.add_argument('--socket', type=str,
+                        help='unix socket the daemon listens on, defaults to one in the temporary directory')
+    parser.add_argument('--check', action='store_true',
+                        help='validate the markdown before converting it, printing its problems with their line and '
+                             'column to stderr. Markdown with errors is not converted')
+    parser.add_argument('--cprofile', type=str,
+                        help='file where cProfile stats of the conversion are saved, to be read with pstats or '
+                             'snakeviz. Only for a single markdown file')
     args = parser.parse_args()
 
     int_log_level = {
@@ -22,9 +310,131 @@ if __name__ == '__main__':
         'critical': logging.CRITICAL,  # 50
     }[args.log_level]
 
-    logging.basicConfig(level=int_log_level)
+    if int_log_level == logging.DEBUG:
+        # trace the converter with one structured event per line and per item
+        handler = logging.StreamHandler()
+        handler.setFormatter(_TraceFormatter(logging.BASIC_FORMAT))
+        logging.basicConfig(level=int_log_level, handlers=[handler])
+
+    else:
+        logging.basicConfig(level=int_log_level)
+
+    if args.serve:
+        if len(args.markdown_file) > 0:
+            parser.error('the daemon converts the markdown sent to it, not markdown files')
+
+        # the daemon is slower to import, and only needed when serving
+        from daemon import DEFAULT_SOCKET, serve
+
+        try:
+            serve(args.socket or DEFAULT_SOCKET)
+        except OSError as e:
+            parser.error(str(e))
+        except KeyboardInterrupt:
+            sys.exit(0)
+
+    if len(args.markdown_file) == 0:
+        parser.error('the following arguments are required: markdown_file')
+
+    if args.form_id is not None:
+        if args.manifest is None:
+            parser.error('the manifest of the form is needed to update it')
+
+        if args.chunk_size is not None or args.share_choices:
+            parser.error('update scripts are not chunked and do not share lists')
+
+    if args.watch:
+        if args.manifest is not None:
+            parser.error('manifests are not saved in watch mode')
+
+        if len(args.markdown_file) > 1 or args.markdown_file[0] == '-':
+            parser.error('watch mode converts a single markdown file')
+
+        if args.chunk_size is not None:
+            parser.error('watch mode does not create chunked scripts')
+
+        (markdown_path, script_path), = _expand_inputs(args.markdown_file, args.output_dir)
+        try:
+            _watch(markdown_path, script_path, args.interval, args.share_choices, args.compact,
+                   args.profile, args.check)
+        except KeyboardInterrupt:
+            sys.exit(0)
+
+    batch = (len(args.markdown_file) > 1 or args.output_dir is not None or
+             Path(args.markdown_file[0]).is_dir() or glob.has_magic(args.markdown_file[0]))
+
+    if batch:
+        if '-' in args.markdown_file:
+            parser.error('stdin can not be converted in batch mode')
+
+        if args.cprofile is not None:
+            parser.error('cProfile stats are only saved when converting a single markdown file')
+
+        if args.manifest is not None:
+            parser.error('manifests are only saved when converting a single markdown file')
+
+        try:
+            pairs = _expand_inputs(args.markdown_file, args.output_dir)
+        except ValueError as e:
+            parser.error(str(e))
+
+        failed = _convert_batch(pairs, args.workers, args.chunk_size, args.share_choices, args.compact, args.profile,
+                                args.check)
+        sys.exit(1 if failed > 0 else 0)
+
+    # included files are relative to the markdown file, or to the current directory for stdin
+    include_dir = Path.cwd() if args.markdown_file[0] == '-' else Path(args.markdown_file[0]).parent
+    markdown_file = None
+    if args.check or args.manifest is not None:
+        markdown_file = sys.stdin.read() if args.markdown_file[0] == '-' else Path(args.markdown_file[0]).read_text()
+
+    if args.check:
+        from validate import validate_markdown
+
+        diagnostics = validate_markdown(markdown_file, include_dir)
+        name = 'stdin' if args.markdown_file[0] == '-' else args.markdown_file[0]
+        for diagnostic in diagnostics:
+            print(f'{name}:{diagnostic}', file=sys.stderr)
+
+        if any(diagnostic.severity == 'error' for diagnostic in diagnostics):
+            sys.exit(1)
+
+    stats = ConversionStats() if args.profile else None
+    profiler = None
+    if args.cprofile is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+
+    if args.manifest is not None:
+        sys.stdout.write(_convert_with_manifest(markdown_file, Path(args.manifest), args.form_id, args.chunk_size,
+                                                args.share_choices, args.compact, stats, include_dir))
+
+    elif markdown_file is not None:
+        for fragment in generate_google_apps_script(iter_lines(markdown_file), args.chunk_size, args.share_choices,
+                                                    args.compact, stats, include_dir):
+            sys.stdout.write(fragment)
+
+    elif args.markdown_file[0] == '-':
+        for fragment in generate_google_apps_script(sys.stdin, args.chunk_size, args.share_choices, args.compact,
+                                                    stats, include_dir):
+            sys.stdout.write(fragment)
+
+    else:
+        with Path(args.markdown_file[0]).open() as markdown_file:
+            for fragment in generate_google_apps_script(markdown_file, args.chunk_size, args.share_choices,
+                                                        args.compact, stats, include_dir):
+                sys.stdout.write(fragment)
+
+    print()
 
-    markdown_file_path = Path(args.markdown_file)
-    markdown_file = markdown_file_path.read_text()
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(args.cprofile)
 
-    print(create_google_apps_script(markdown_file))
+    if stats is not None:
+        _print_stats(stats, time.perf_counter() - start)
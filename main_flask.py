@@ -1,10 +1,19 @@
+import argparse
+import json
 import logging
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, TimeoutError
+from dataclasses import asdict
 from pathlib import Path
 
-from flask import Flask, render_template, request
+from flask import Flask, Response, render_template, request
 # from flask_minify import Minify
 
-from google_forms import create_google_apps_script
+from cache import LRUCache, content_key
+from google_forms import ConversionStats, create_google_apps_script, generate_google_apps_script, iter_lines
 
 # https://medium.com/swlh/how-to-host-your-flask-app-on-pythonanywhere-for-free-df8486eb6a42
 # If `entrypoint` is not defined in app.yaml, App Engine will look for an app
@@ -14,27 +23,275 @@ TITLE = 'Markdown to Google Forms'
 app = Flask(__name__)
 # Minify(app=app, html=True, js=True, cssless=True)
 
+# larger requests are answered with 413 before being converted
+app.config['MAX_CONTENT_LENGTH'] = 4 * 2**20
+app.config['MAX_LINES'] = 100_000
+
+# users often submit the same templates, so converted scripts are kept in memory.
+# documents that are not cached were usually edited a little since the last time
+# they were converted, so they only regenerate the sections that changed
+_conversion_cache = LRUCache(max_entries=256, max_bytes=64 * 2**20)
+# by options, created on their first conversion
+_incremental_converters = {}
+
+# api responses smaller than this are not worth compressing
+_MIN_COMPRESSED_SIZE = 1024
+# brotli is optional, and only imported when the first response is compressed. it
+# is False when it is not installed
+_brotli = None
+
+# with a worker pool (see enable_worker_pool) conversions run in other processes
+_pool = None
+
+# stats of every conversion done, and requests rejected by status, for /metrics
+_metrics = ConversionStats()
+_rejected = Counter()
+_metrics_lock = threading.Lock()
+_METRICS_PREFIX = 'markdown_to_forms'
+
+# the sample and its script, read and converted on the first reset
+_sample = None
+
+
+class _ConversionRejected(Exception):
+    # conversions the server refuses to do, answered with the given status
+    def __init__(self, message: str, status: int):
+        super().__init__(message)
+        self.status = status
+
+
+class _CPUBudgetExceeded(Exception):
+    pass
+
+
+def _convert_with_budget(code: str, options: dict, cpu_budget: float) -> tuple[str, ConversionStats]:
+    # runs in the worker processes. the cpu time is checked after each fragment of
+    # the script, which are small since every line is converted in linear time
+    start = time.process_time()
+    stats = ConversionStats()
+    fragments = []
+    for fragment in generate_google_apps_script(iter_lines(code), **options, stats=stats):
+        fragments.append(fragment)
+        if time.process_time() - start > cpu_budget:
+            raise _CPUBudgetExceeded(f'Conversion used more than {cpu_budget}s of cpu time')
+
+    return ''.join(fragments), stats
+
+
+class _ConversionPool:
+    # converts in a fixed number of worker processes, so a huge or pathological
+    # document only holds up one of them. at most workers + queue_size conversions
+    # are accepted at once, the others are rejected right away
+    def __init__(self, workers: int | None, queue_size: int, cpu_budget: float, timeout: float):
+        if workers is None:
+            workers = os.cpu_count()
+
+        # only production servers load multiprocessing
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # forking a threaded server is unsafe, so workers start from scratch
+        self._executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'))
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self.cpu_budget = cpu_budget
+        self.timeout = timeout
+
+    def convert(self, code: str, options: dict) -> tuple[str, ConversionStats]:
+        if not self._slots.acquire(blocking=False):
+            raise _ConversionRejected('Too many conversions in progress, try again later', 429)
+
+        future: Future = self._executor.submit(_convert_with_budget, code, options, self.cpu_budget)
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+
+        except TimeoutError:
+            future.cancel()
+            raise _ConversionRejected(f'Conversion did not finish in {self.timeout}s, try again later', 503)
+
+        except _CPUBudgetExceeded as e:
+            raise _ConversionRejected(str(e), 413)
+
+
+def enable_worker_pool(workers: int | None = None, queue_size: int = 16, cpu_budget: float = 5.0,
+                       timeout: float = 30.0) -> None:
+    # production mode: converts in a pool of worker processes with a cpu time budget
+    # per conversion, answering with 429 when too many conversions are waiting
+    global _pool
+    _pool = _ConversionPool(workers, queue_size, cpu_budget, timeout)
+
+
+def _check_lines(code: str) -> None:
+    if code.count('\n') >= app.config['MAX_LINES']:
+        raise _ConversionRejected(f'Documents can have at most {app.config["MAX_LINES"]} lines', 413)
+
+
+def _convert(code: str, compact: bool = False, share_choices: bool = False, chunk_size: int | None = None) -> str:
+    _check_lines(code)
+
+    def create() -> str:
+        stats = ConversionStats()
+        if _pool is not None:
+            options = {'chunk_size': chunk_size, 'share_choices': share_choices, 'compact': compact}
+            script, stats = _pool.convert(code, options)
+
+        elif chunk_size is not None:
+            # chunked scripts are not converted incrementally
+            script = create_google_apps_script(code, chunk_size=chunk_size, share_choices=share_choices,
+                                               compact=compact, stats=stats)
+
+        else:
+            converter = _incremental_converters.get((share_choices, compact))
+            if converter is None:
+                # most processes only serve a few options, and servers start faster
+                # without importing the incremental converter
+                from incremental import IncrementalConverter
+
+                converter = _incremental_converters.setdefault(
+                    (share_choices, compact), IncrementalConverter(share_choices=share_choices, compact=compact))
+
+            script = converter.convert(code, stats)
+
+        with _metrics_lock:
+            _metrics.update(stats)
+
+        return script
+
+    return _conversion_cache.get_or_create(content_key(code, compact, share_choices, chunk_size), create)
+
+
+def _api_options(values: dict, strings: bool, options: dict | None = None) -> dict:
+    # reads the options given in values over the given options. options come as
+    # strings in the query string, and must be booleans in json, apart from
+    # chunk_size, which is a positive integer or null
+    options = {'compact': False, 'share_choices': False, 'chunk_size': None} if options is None else dict(options)
+    for name in ('compact', 'share_choices'):
+        if name in values:
+            value = values[name]
+            if strings and isinstance(value, str):
+                value = value.lower() in ('1', 'true', 'yes', 'on')
+
+            elif not isinstance(value, bool):
+                raise ValueError(f'{name} must be a boolean')
+
+            options[name] = value
+
+    if 'chunk_size' in values:
+        chunk_size = values['chunk_size']
+        if strings and isinstance(chunk_size, str) and chunk_size.isdecimal():
+            chunk_size = int(chunk_size)
+
+        if chunk_size is not None and (isinstance(chunk_size, bool) or not isinstance(chunk_size, int) or
+                                       chunk_size < 1):
+            raise ValueError('chunk_size must be a positive integer')
+
+        options['chunk_size'] = chunk_size
+
+    return options
+
+
+def _api_documents() -> tuple[list[tuple[str, dict]], bool]:
+    # returns the markdown documents in the request with their options, and whether
+    # they came as a batch. a json body is either a document or a list of them, and
+    # a document is either the markdown itself or an object with the markdown and
+    # its options. options in the query string apply to every document
+    query_options = _api_options(request.args, strings=True)
+    if not request.is_json:
+        return [(request.get_data(as_text=True), query_options)], False
+
+    body = request.get_json(silent=True)
+    if body is None:
+        raise ValueError('the body is not valid json')
+
+    batch = isinstance(body, list)
+    documents = []
+    for document in body if batch else (body,):
+        if isinstance(document, str):
+            documents.append((document, query_options))
+
+        elif isinstance(document, dict) and isinstance(document.get('markdown'), str):
+            documents.append((document['markdown'], _api_options(document, False, query_options)))
+
+        else:
+            raise ValueError('documents must be markdown strings or objects with a markdown string')
+
+    return documents, batch
+
+
+def _encodings() -> tuple[str, ...]:
+    global _brotli
+    if _brotli is None:
+        try:
+            import brotli
+        except ImportError:
+            brotli = False
+
+        _brotli = brotli
+
+    return ('br', 'gzip') if _brotli else ('gzip',)
+
+
+def _sample_form() -> tuple[str, str]:
+    global _sample
+    if _sample is None:
+        code = Path(__file__).with_name('sample.md').read_text()
+        _sample = code, create_google_apps_script(code)
+
+    return _sample
+
+
+def _compress(response: Response) -> Response:
+    data = response.get_data()
+    if len(data) < _MIN_COMPRESSED_SIZE:
+        return response
+
+    encoding = request.accept_encodings.best_match(_encodings())
+    if encoding is None:
+        return response
+
+    if encoding == 'br':
+        response.set_data(_brotli.compress(data, quality=5))
+    else:
+        import gzip
+
+        response.set_data(gzip.compress(data, compresslevel=6))
+
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
 @app.route('/', methods=['GET', 'POST'])
 def _root():
     if request.method == 'POST':
+        compact = 'compact' in request.form
         if 'create' in request.form:
             code = request.form.get('markdown_code')
 
             if code is not None and len(code) > 0:
+                try:
+                    form_script = _convert(code, compact=compact)
+                    status = 200
+                except _ConversionRejected as e:
+                    _count_rejection(e.status)
+                    form_script = f'// {e}'
+                    status = e.status
+
                 values = {
                     'code': code,
-                    'form_script': create_google_apps_script(code),
+                    'form_script': form_script,
                     'title': TITLE,
+                    'compact': compact,
                 }
 
-                return render_template('index.html', **values)
+                return render_template('index.html', **values), status
 
         elif 'reset' in request.form:
-            code = Path('sample.md').read_text()
+            sample_code, sample_script = _sample_form()
             values = {
-                'code': code,
-                'form_script': create_google_apps_script(code),
+                'code': sample_code,
+                'form_script': _convert(sample_code, compact=compact) if compact else sample_script,
                 'title': TITLE,
+                'compact': compact,
             }
 
             return render_template('index.html', **values)
@@ -48,6 +305,135 @@ def _root():
     return render_template('index.html', **values)
 
 
+@app.route('/api/convert', methods=['POST'])
+def _api_convert():
+    # converts markdown sent as the raw body, or as json, possibly as a batch of
+    # documents. answers with the script as plain text, or with json objects with
+    # either the script or the error of each document
+    try:
+        documents, batch = _api_documents()
+    except (TypeError, ValueError) as e:
+        return {'error': str(e)}, 400
+
+    preferred = ['application/json', 'text/plain'] if request.is_json else ['text/plain', 'application/json']
+    as_json = batch or request.accept_mimetypes.best_match(preferred, preferred[0]) == 'application/json'
+
+    # the script only depends on the markdown, the options and the converter
+    # version, so the etag is known before converting and clients sending the same
+    # documents again get a 304 without converting anything
+    etag = content_key('\n'.join(content_key(code, *options.values()) for code, options in documents), as_json)
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+
+    results = []
+    for code, options in documents:
+        try:
+            results.append({'script': _convert(code, **options)})
+        except _ConversionRejected:
+            raise
+        except Exception as e:
+            results.append({'error': str(e)})
+
+    status = 400 if not batch and 'error' in results[0] else 200
+    if as_json:
+        response = Response(json.dumps(results if batch else results[0]), status, mimetype='application/json')
+    else:
+        response = Response(results[0].get('script', results[0].get('error')), status, mimetype='text/plain')
+
+    if status == 200:
+        response.set_etag(etag, weak=True)
+
+    response.vary.update(('Accept', 'Accept-Encoding'))
+    return _compress(response)
+
+
+@app.route('/api/check', methods=['POST'])
+def _api_check():
+    # validates markdown sent like to /api/convert without converting it, answering
+    # with the problems found in each document and whether it has no errors
+    try:
+        documents, batch = _api_documents()
+    except (TypeError, ValueError) as e:
+        return {'error': str(e)}, 400
+
+    # only imported by servers that validate documents
+    from validate import validate_markdown
+
+    results = []
+    for code, _ in documents:
+        _check_lines(code)
+        # includes are disabled, like when converting
+        diagnostics = validate_markdown(code)
+        results.append({'valid': all(diagnostic.severity != 'error' for diagnostic in diagnostics),
+                        'diagnostics': [asdict(diagnostic) for diagnostic in diagnostics]})
+
+    response = Response(json.dumps(results if batch else results[0]), mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    return _compress(response)
+
+
+def _count_rejection(status: int) -> None:
+    with _metrics_lock:
+        _rejected[status] += 1
+
+
+@app.errorhandler(_ConversionRejected)
+def _conversion_rejected(error: _ConversionRejected):
+    _count_rejection(error.status)
+    headers = {'Retry-After': '1'} if error.status in (429, 503) else {}
+    return {'error': str(error)}, error.status, headers
+
+
+def _prometheus_metric(name: str, kind: str, description: str, samples: list[tuple[str, float]]) -> str:
+    # a metric in prometheus text format. samples are pairs of labels and values
+    lines = [f'# HELP {_METRICS_PREFIX}_{name} {description}',
+             f'# TYPE {_METRICS_PREFIX}_{name} {kind}']
+    lines.extend(f'{_METRICS_PREFIX}_{name}{labels} {value}' for labels, value in samples)
+    return '\n'.join(lines) + '\n'
+
+
+@app.route('/metrics', methods=['GET'])
+def _prometheus_metrics():
+    with _metrics_lock:
+        stats = ConversionStats()
+        stats.update(_metrics)
+        rejected = sorted(_rejected.items())
+
+    cache = _conversion_cache.info()
+    metrics = [
+        _prometheus_metric('conversions_total', 'counter', 'Conversions done, not counting cache hits.',
+                           [('', stats.conversions)]),
+        _prometheus_metric('lines_total', 'counter', 'Lines of markdown converted.', [('', stats.lines)]),
+        _prometheus_metric('input_bytes_total', 'counter', 'Bytes of markdown converted.',
+                           [('', stats.input_bytes)]),
+        _prometheus_metric('output_bytes_total', 'counter', 'Bytes of scripts generated.',
+                           [('', stats.output_bytes)]),
+        _prometheus_metric('stage_seconds_total', 'counter',
+                           'Time spent in each stage of the conversions. parse includes classify.',
+                           [(f'{{stage="{stage}"}}', seconds) for stage, seconds in sorted(stats.seconds.items())]),
+        _prometheus_metric('nodes_total', 'counter', 'Nodes generated, by kind.',
+                           [(f'{{kind="{kind}"}}', count) for kind, count in sorted(stats.nodes.items())]),
+        _prometheus_metric('node_seconds_total', 'counter', 'Time spent generating the code of nodes, by kind.',
+                           [(f'{{kind="{kind}"}}', seconds) for kind, seconds in sorted(stats.node_seconds.items())]),
+        _prometheus_metric('rejected_requests_total', 'counter', 'Conversions refused, by status of the answer.',
+                           [(f'{{status="{status}"}}', count) for status, count in rejected]),
+        _prometheus_metric('cache_hits_total', 'counter', 'Scripts found in the cache.', [('', cache['hits'])]),
+        _prometheus_metric('cache_misses_total', 'counter', 'Scripts not found in the cache.',
+                           [('', cache['misses'])]),
+        _prometheus_metric('cache_entries', 'gauge', 'Scripts in the cache.', [('', cache['entries'])]),
+        _prometheus_metric('cache_bytes', 'gauge', 'Size of the scripts in the cache.', [('', cache['bytes'])]),
+    ]
+
+    return Response(''.join(metrics), mimetype='text/plain; version=0.0.4')
+
+
+@app.route('/cache', methods=['GET'])
+def _cache_info():
+    return _conversion_cache.info()
+
+
 if __name__ == '__main__':
     # create a handler to log to stderr
     stderr_handler = logging.StreamHandler()
@@ -59,7 +445,36 @@ if __name__ == '__main__':
     # add the handler to the root logger
     logging.basicConfig(level=logging.INFO, handlers=[stderr_handler])
 
-    # This is used when running locally only. When deploying to Google App
-    # Engine, a webserver process such as Gunicorn will serve the app. This
-    # can be configured by adding an `entrypoint` to app.yaml.
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--production', action='store_true',
+                        help='serve without debug mode, converting in a pool of worker processes')
+    parser.add_argument('--port', type=int, default=5000,
+                        help='port to listen on')
+    parser.add_argument('-j', '--workers', type=int,
+                        help='number of worker processes in production mode, defaults to the number of CPUs')
+    parser.add_argument('--queue_size', type=int, default=16,
+                        help='conversions that can wait for a worker before new ones are answered with 429')
+    parser.add_argument('--cpu_budget', type=float, default=5.0,
+                        help='seconds of cpu time a conversion can use in production mode')
+    parser.add_argument('--timeout', type=float, default=30.0,
+                        help='seconds a request waits for its conversion in production mode')
+    parser.add_argument('--max_bytes', type=int, default=app.config['MAX_CONTENT_LENGTH'],
+                        help='largest request accepted')
+    parser.add_argument('--max_lines', type=int, default=app.config['MAX_LINES'],
+                        help='most lines a document can have')
+    args = parser.parse_args()
+
+    app.config['MAX_CONTENT_LENGTH'] = args.max_bytes
+    app.config['MAX_LINES'] = args.max_lines
+
+    if args.production:
+        # when deploying behind a webserver such as Gunicorn, call
+        # enable_worker_pool where the app is created instead
+        enable_worker_pool(args.workers, args.queue_size, args.cpu_budget, args.timeout)
+        app.run(debug=False, threaded=True, host='0.0.0.0', port=args.port)
+
+    else:
+        # This is used when running locally only. When deploying to Google App
+        # Engine, a webserver process such as Gunicorn will serve the app. This
+        # can be configured by adding an `entrypoint` to app.yaml.
+        app.run(debug=True, host='0.0.0.0', port=args.port)
@@ -0,0 +1,348 @@
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from google_forms import create_google_apps_script
+
+
+# rough estimates, in milliseconds, of how long each call to the Apps Script
+# services takes. keys are Receiver.method, where Item matches calls on any kind
+# of item, and a trailing * matches any method starting with what comes before
+# it. the most specific key wins. "per item" keys are added once for every item
+# in the form when the call is made
+DEFAULT_LATENCIES = {
+    'FormApp.create': 2000,
+    'FormApp.openById': 1000,
+    'FormApp.*': 100,
+    'Form.add*': 300,
+    'Form.getItems': 200,
+    'Form.getItems per item': 5,
+    'Form.getItemById': 150,
+    'Form.moveItem': 300,
+    'Form.deleteItem': 300,
+    'Form.get*': 50,
+    'Form.*': 100,
+    'Item.getId': 1,
+    'Item.as*': 1,
+    'Item.createChoice': 5,
+    'Item.*': 100,
+    'PropertiesService.*': 20,
+    'Properties.*': 50,
+    'ScriptApp.*': 200,
+    'TriggerBuilder.*': 10,
+    '*': 50,
+}
+
+# maximum time of a single execution of a script, after which Apps Script stops it
+EXECUTION_LIMIT = 6 * 60 * 1000
+
+# stand-in for the subset of FormApp, PropertiesService and ScriptApp used by the
+# generated scripts. it runs the script in a node vm, records every call with its
+# estimated latency on a virtual clock that Date also uses, and runs the time
+# based triggers the script creates as new executions
+_FORM_APP_MOCK = r'''
+const vm = require('vm');
+const input = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const latencies = input.latencies;
+
+const calls = [];
+const executions = [];
+const forms = {};
+const properties = {};
+let triggers = [];
+let clock = 0;
+let executionStart = 0;
+let nextId = 1;
+
+function latency(keys, size) {
+  let best = null;
+  for (const pattern in latencies) {
+    if (pattern.endsWith(' per item')) continue;
+    for (const key of keys) {
+      const match = pattern.endsWith('*') ? key.startsWith(pattern.slice(0, -1)) : key === pattern;
+      if (match && (best === null || pattern.length > best.length)) best = pattern;
+    }
+  }
+  const ms = best === null ? (latencies['*'] || 0) : latencies[best];
+  return ms + (latencies[best + ' per item'] || 0) * size;
+}
+
+function record(receiver, method, item, size = 0) {
+  const keys = [receiver + '.' + method];
+  if (item !== null && receiver !== 'Form') keys.push('Item.' + method);
+  const ms = latency(keys, size);
+  clock += ms;
+  calls.push({receiver, method, item, ms});
+  if (clock - executionStart > input.executionLimit) {
+    throw new Error('Exceeded maximum execution time');
+  }
+}
+
+function chain(receiver, target, special) {
+  // object whose unknown methods are recorded and return the object itself
+  const proxy = new Proxy(target, {
+    get(t, prop) {
+      if (typeof prop === 'symbol' || prop === 'then' || prop === 'toJSON') return undefined;
+      if (prop in special) return special[prop];
+      return (...args) => {
+        record(receiver(), prop, t.type || null);
+        return proxy;
+      };
+    },
+  });
+  return proxy;
+}
+
+function makeItem(form, type) {
+  const item = {id: nextId++, type, title: '', choices: 0};
+  const special = {
+    getId() { record(item.type, 'getId', item.type); return item.id; },
+    getType() { return item.type; },
+    getTitle() { return item.title; },
+    setTitle(title) { record(item.type, 'setTitle', item.type); item.title = title; return proxy; },
+    setChoiceValues(values) {
+      record(item.type, 'setChoiceValues', item.type); item.choices = values.length; return proxy;
+    },
+    setChoices(choices) {
+      record(item.type, 'setChoices', item.type); item.choices = choices.length; return proxy;
+    },
+    createChoice(value, navigation) {
+      record(item.type, 'createChoice', item.type);
+      return {value, navigation: navigation === undefined ? null : navigation};
+    },
+  };
+  const proxy = new Proxy(item, {
+    get(t, prop) {
+      if (typeof prop === 'symbol' || prop === 'then' || prop === 'toJSON') return undefined;
+      if (prop in special) return special[prop];
+      if (prop.startsWith('as') && prop.endsWith('Item')) {
+        return () => { record(item.type, prop, item.type); return proxy; };
+      }
+      return (...args) => { record(item.type, prop, item.type); return proxy; };
+    },
+  });
+  item.proxy = proxy;
+  return proxy;
+}
+
+function makeForm(title) {
+  const form = {id: 'form' + nextId++, title, items: []};
+  const index = (item) => typeof item === 'number' ? item : form.items.findIndex((i) => i.getId() === item.getId());
+  const special = {
+    getId() { record('Form', 'getId', null); return form.id; },
+    getItems() {
+      record('Form', 'getItems', null, form.items.length);
+      return form.items.slice();
+    },
+    getItemById(id) {
+      record('Form', 'getItemById', null, form.items.length);
+      return form.items.find((i) => i.getId() === id) || null;
+    },
+    moveItem(item, to) {
+      record('Form', 'moveItem', null, form.items.length);
+      const from = index(item);
+      if (from < 0 || from >= form.items.length || to < 0 || to >= form.items.length) {
+        throw new Error(`Index out of bounds moving item from ${from} to ${to}`);
+      }
+      const [moved] = form.items.splice(from, 1);
+      form.items.splice(to, 0, moved);
+      return moved;
+    },
+    deleteItem(item) {
+      record('Form', 'deleteItem', null, form.items.length);
+      const at = index(item);
+      if (at < 0 || at >= form.items.length) throw new Error(`Index out of bounds deleting item ${at}`);
+      form.items.splice(at, 1);
+    },
+  };
+  const proxy = new Proxy(form, {
+    get(t, prop) {
+      if (typeof prop === 'symbol' || prop === 'then' || prop === 'toJSON') return undefined;
+      if (prop in special) return special[prop];
+      if (prop.startsWith('add') && prop.endsWith('Item')) {
+        return () => {
+          const type = prop.slice(3);
+          record('Form', prop, type, form.items.length);
+          const item = makeItem(form, type);
+          form.items.push(item);
+          return item;
+        };
+      }
+      return (...args) => { record('Form', prop, null); return proxy; };
+    },
+  });
+  forms[form.id] = {form, proxy};
+  return proxy;
+}
+
+const FormApp = {
+  create(title) { record('FormApp', 'create', null); return makeForm(title); },
+  openById(id) {
+    record('FormApp', 'openById', null);
+    if (!(id in forms)) throw new Error(`No form with id ${id}`);
+    return forms[id].proxy;
+  },
+};
+
+const scriptProperties = {
+  getProperty(key) { record('Properties', 'getProperty', null); return key in properties ? properties[key] : null; },
+  setProperty(key, value) { record('Properties', 'setProperty', null); properties[key] = String(value); return this; },
+  deleteProperty(key) { record('Properties', 'deleteProperty', null); delete properties[key]; return this; },
+};
+
+const PropertiesService = {
+  getScriptProperties() { record('PropertiesService', 'getScriptProperties', null); return scriptProperties; },
+};
+
+const ScriptApp = {
+  newTrigger(handler) {
+    record('ScriptApp', 'newTrigger', null);
+    const trigger = {handler, after: 0, fired: false, getHandlerFunction() { return handler; }};
+    const builder = {
+      timeBased() { record('TriggerBuilder', 'timeBased', null); return builder; },
+      after(ms) { record('TriggerBuilder', 'after', null); trigger.after = ms; return builder; },
+      create() { record('TriggerBuilder', 'create', null); triggers.push(trigger); return trigger; },
+    };
+    return builder;
+  },
+  getProjectTriggers() { record('ScriptApp', 'getProjectTriggers', null); return triggers.slice(); },
+  deleteTrigger(trigger) { record('ScriptApp', 'deleteTrigger', null); triggers = triggers.filter((t) => t !== trigger); },
+};
+
+class VirtualDate extends Date {
+  constructor(...args) { if (args.length === 0) super(clock); else super(...args); }
+  static now() { return clock; }
+}
+
+function execute(handler) {
+  const context = vm.createContext({
+    FormApp, PropertiesService, ScriptApp, Date: VirtualDate, JSON, Math, Object, Array, String, Number,
+    Logger: {log() {}}, console: {log() {}},
+  });
+  executionStart = clock;
+  let error = null;
+  try {
+    vm.runInContext(input.code, context);
+    context[handler]();
+  } catch (e) {
+    error = String(e && e.message ? e.message : e);
+  }
+  executions.push({handler, ms: clock - executionStart, error});
+}
+
+execute(input.entryPoint);
+for (let trigger = triggers.find((t) => !t.fired); trigger !== undefined && executions.length < input.maxExecutions;
+     trigger = triggers.find((t) => !t.fired)) {
+  trigger.fired = true;
+  clock += trigger.after;
+  execute(trigger.handler);
+}
+
+const result = Object.values(forms).map(({form}) => ({
+  id: form.id,
+  title: form.title,
+  items: form.items.map((i) => ({type: i.getType(), title: i.getTitle()})),
+}));
+process.stdout.write(JSON.stringify({calls, executions, forms: result, properties, triggers: triggers.length}));
+'''
+
+
+def run_script(code: str, latencies: dict[str, float] | None = None, entry_point: str = 'createForm',
+               execution_limit: float = EXECUTION_LIMIT, max_executions: int = 100) -> dict:
+    # runs a generated script against the FormApp stand-in under node, returning
+    # the calls made, the executions (the first one and those started by triggers)
+    # and the resulting forms
+    node = shutil.which('node')
+    if node is None:
+        raise RuntimeError('node is needed to run generated scripts, see https://nodejs.org')
+
+    if latencies is None:
+        latencies = DEFAULT_LATENCIES
+
+    request = json.dumps({
+        'code': code,
+        'latencies': latencies,
+        'entryPoint': entry_point,
+        'executionLimit': execution_limit,
+        'maxExecutions': max_executions,
+    })
+    process = subprocess.run([node, '-e', _FORM_APP_MOCK], input=request, capture_output=True, text=True)
+    if process.returncode != 0:
+        raise RuntimeError(f'Error running the script under node:\n{process.stderr}')
+
+    return json.loads(process.stdout)
+
+
+def profile_script(code: str, latencies: dict[str, float] | None = None, **kwargs) -> dict:
+    # summarizes the service calls of a script by the kind of item they were made
+    # for. calls on the form that are not about an item, like moving items, are
+    # counted under Form
+    run = run_script(code, latencies, **kwargs)
+
+    kinds = defaultdict(lambda: {'items': 0, 'calls': 0, 'ms': 0.0, 'methods': Counter()})
+    for call in run['calls']:
+        kind = call['item'] or call['receiver']
+        stats = kinds[kind]
+        stats['calls'] += 1
+        stats['ms'] += call['ms']
+        stats['methods'][call['method']] += 1
+        if call['receiver'] == 'Form' and call['method'].startswith('add'):
+            stats['items'] += 1
+
+    return {
+        'calls': len(run['calls']),
+        'ms': sum(call['ms'] for call in run['calls']),
+        'kinds': {kind: {**stats, 'methods': dict(stats['methods'])} for kind, stats in kinds.items()},
+        'executions': run['executions'],
+        'forms': run['forms'],
+    }
+
+
+def _print_report(name: str, report: dict) -> None:
+    print(f'{name}: {report["calls"]} calls, {report["ms"] / 1000:.1f}s estimated, '
+          f'{len(report["executions"])} execution(s)')
+
+    for execution in report['executions']:
+        status = f'  FAILED: {execution["error"]}' if execution['error'] is not None else ''
+        print(f'  {execution["handler"]}: {execution["ms"] / 1000:.1f}s{status}')
+
+    print(f'  {"kind":<24}{"items":>7}{"calls":>8}{"calls/item":>12}{"seconds":>10}')
+    for kind, stats in sorted(report['kinds'].items(), key=lambda k: -k[1]['ms']):
+        per_item = f'{stats["calls"] / stats["items"]:.1f}' if stats['items'] > 0 else ''
+        print(f'  {kind:<24}{stats["items"]:>7}{stats["calls"]:>8}{per_item:>12}{stats["ms"] / 1000:>10.1f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Estimate the service calls and run time of generated scripts by '
+                                                 'running them against a local stand-in of FormApp')
+    parser.add_argument('files', type=str, nargs='+',
+                        help='markdown files, which are converted first, or generated scripts (.gs or .js)')
+    parser.add_argument('--latencies', type=str,
+                        help='json file with latencies in milliseconds that replace the default ones')
+    parser.add_argument('--json', action='store_true',
+                        help='print the reports as json')
+    args = parser.parse_args()
+
+    latencies = dict(DEFAULT_LATENCIES)
+    if args.latencies is not None:
+        latencies.update(json.loads(Path(args.latencies).read_text()))
+
+    reports = {}
+    for file in args.files:
+        code = Path(file).read_text()
+        if Path(file).suffix not in ('.gs', '.js'):
+            code = create_google_apps_script(code, include_dir=Path(file).parent)
+
+        reports[file] = profile_script(code, latencies)
+
+    if args.json:
+        json.dump(reports, sys.stdout, indent=2)
+        print()
+
+    else:
+        for file, report in reports.items():
+            _print_report(file, report)
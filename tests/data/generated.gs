@@ -0,0 +1,3628 @@
+function createForm() {
+  var form = FormApp.create("Generated form")
+    .setDescription("A form with every kind of item.")
+    .setConfirmationMessage("Thanks for answering!");
+
+  var sections = {};
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 0");
+
+  sections["Section 0"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 1");
+
+  sections["Section 1"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 2");
+
+  sections["Section 2"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 3");
+
+  sections["Section 3"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 4");
+
+  sections["Section 4"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 5");
+
+  sections["Section 5"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 6");
+
+  sections["Section 6"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 7");
+
+  sections["Section 7"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 8");
+
+  sections["Section 8"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 9");
+
+  sections["Section 9"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 10");
+
+  sections["Section 10"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 11");
+
+  sections["Section 11"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 12");
+
+  sections["Section 12"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 13");
+
+  sections["Section 13"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 14");
+
+  sections["Section 14"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 15");
+
+  sections["Section 15"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 16");
+
+  sections["Section 16"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 17");
+
+  sections["Section 17"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 18");
+
+  sections["Section 18"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 19");
+
+  sections["Section 19"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 20");
+
+  sections["Section 20"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 21");
+
+  sections["Section 21"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 22");
+
+  sections["Section 22"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 23");
+
+  sections["Section 23"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 24");
+
+  sections["Section 24"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 25");
+
+  sections["Section 25"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 26");
+
+  sections["Section 26"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 27");
+
+  sections["Section 27"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 28");
+
+  sections["Section 28"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 29");
+
+  sections["Section 29"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 30");
+
+  sections["Section 30"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 31");
+
+  sections["Section 31"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 32");
+
+  sections["Section 32"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 33");
+
+  sections["Section 33"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 34");
+
+  sections["Section 34"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 35");
+
+  sections["Section 35"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 36");
+
+  sections["Section 36"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 37");
+
+  sections["Section 37"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 38");
+
+  sections["Section 38"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 39");
+
+  sections["Section 39"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 40");
+
+  sections["Section 40"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 41");
+
+  sections["Section 41"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 42");
+
+  sections["Section 42"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 43");
+
+  sections["Section 43"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 44");
+
+  sections["Section 44"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 45");
+
+  sections["Section 45"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 46");
+
+  sections["Section 46"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 47");
+
+  sections["Section 47"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 48");
+
+  sections["Section 48"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 49");
+
+  sections["Section 49"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 50");
+
+  sections["Section 50"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 51");
+
+  sections["Section 51"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 52");
+
+  sections["Section 52"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 53");
+
+  sections["Section 53"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 54");
+
+  sections["Section 54"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 55");
+
+  sections["Section 55"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 56");
+
+  sections["Section 56"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 57");
+
+  sections["Section 57"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 58");
+
+  sections["Section 58"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 59");
+
+  sections["Section 59"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 60");
+
+  sections["Section 60"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 61");
+
+  sections["Section 61"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 62");
+
+  sections["Section 62"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 63");
+
+  sections["Section 63"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 64");
+
+  sections["Section 64"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 65");
+
+  sections["Section 65"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 66");
+
+  sections["Section 66"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 67");
+
+  sections["Section 67"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 68");
+
+  sections["Section 68"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 69");
+
+  sections["Section 69"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 70");
+
+  sections["Section 70"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 71");
+
+  sections["Section 71"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 72");
+
+  sections["Section 72"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 73");
+
+  sections["Section 73"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 74");
+
+  sections["Section 74"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 75");
+
+  sections["Section 75"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 76");
+
+  sections["Section 76"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 77");
+
+  sections["Section 77"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 78");
+
+  sections["Section 78"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 79");
+
+  sections["Section 79"] = section;
+
+  var section = form.addPageBreakItem()
+    .setTitle("Section 0");
+
+  sections["Section 0"] = section;
+
+  sections["Section 56"]
+    .setTitle("Section 56")
+    .setHelpText("About section 56");
+
+  form.moveItem(form.getItemById(sections["Section 56"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 1")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 1");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 2");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 23"]),
+      item.createChoice("Go 1", sections["Section 24"]),
+      item.createChoice("Go 2", sections["Section 23"])
+    ])
+    .setHelpText("Description of question 2");
+
+  form.addGridItem()
+    .setTitle("Question 3")
+    .setRows(['Row 0'])
+    .setColumns(['Column 0', 'Column 1'])
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 4")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5']);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 5");
+
+  form.addDurationItem()
+    .setTitle("Question 6");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 7");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 8")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2']);
+
+  form.addDateTimeItem()
+    .setTitle("Question 9")
+    .setHelpText("Description of question 9");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 10")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5'])
+    .setRequired(true);
+
+  form.addTextItem()
+    .setTitle("Question 11")
+    .setRequired(true);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 12")
+    .setHelpText("Description of question 12");
+
+  sections["Section 44"]
+    .setTitle("Section 44")
+    .setHelpText("About section 44");
+
+  form.moveItem(form.getItemById(sections["Section 44"].getId()), form.getItems().length - 1);
+
+  form.addDateTimeItem()
+    .setTitle("Question 13")
+    .setRequired(true);
+
+  form.addDurationItem()
+    .setTitle("Question 14")
+    .setHelpText("Description of question 14")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 15")
+    .setChoiceValues(['Option 0'])
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 16")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5'])
+    .setHelpText("Description of question 16");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 17")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5'])
+    .setHelpText("Description of question 17")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 18")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2'])
+    .setHelpText("Description of question 18")
+    .setRequired(true);
+
+  sections["Section 42"]
+    .setTitle("Section 42")
+    .setHelpText("About section 42");
+
+  form.moveItem(form.getItemById(sections["Section 42"].getId()), form.getItems().length - 1);
+
+  form.addTextItem()
+    .setTitle("Question 19")
+    .setRequired(true);
+
+  form.addDurationItem()
+    .setTitle("Question 20")
+    .setHelpText("Description of question 20")
+    .setRequired(true);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 21")
+    .setHelpText("Description of question 21");
+
+  form.addDurationItem()
+    .setTitle("Question 22");
+
+  sections["Section 50"]
+    .setTitle("Section 50")
+    .setHelpText("About section 50");
+
+  form.moveItem(form.getItemById(sections["Section 50"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 23")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2'])
+    .setHelpText("Description of question 23");
+
+  form.addScaleItem()
+    .setTitle("Question 24")
+    .setBounds(0, 2)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 24");
+
+  form.addDurationItem()
+    .setTitle("Question 25")
+    .setHelpText("Description of question 25");
+
+  sections["Section 24"]
+    .setTitle("Section 24")
+    .setHelpText("About section 24");
+
+  form.moveItem(form.getItemById(sections["Section 24"].getId()), form.getItems().length - 1);
+
+  form.addDateTimeItem()
+    .setTitle("Question 26")
+    .setHelpText("Description of question 26");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 27")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 27");
+
+  form.addScaleItem()
+    .setTitle("Question 28")
+    .setBounds(1, 6)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 28")
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 29");
+
+  form.addDateTimeItem()
+    .setTitle("Question 30")
+    .setHelpText("Description of question 30");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 31")
+    .setChoiceValues(['Option 0', 'Option 1']);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 32")
+    .setHelpText("Description of question 32");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 33");
+
+  form.addDateTimeItem()
+    .setTitle("Question 34");
+
+  sections["Section 31"]
+    .setTitle("Section 31")
+    .setHelpText("About section 31");
+
+  form.moveItem(form.getItemById(sections["Section 31"].getId()), form.getItems().length - 1);
+
+  form.addScaleItem()
+    .setTitle("Question 35")
+    .setBounds(1, 2)
+    .setLabels("Low", "High")
+    .setRequired(true);
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 36")
+    .setRows(['Row 0'])
+    .setColumns(['Column 0', 'Column 1'])
+    .setHelpText("Description of question 36");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 37")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5']);
+
+  form.addDateTimeItem()
+    .setTitle("Question 38")
+    .setHelpText("Description of question 38")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 39")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5'])
+    .setHelpText("Description of question 39")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 40")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 40");
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 41")
+    .setRows(['Row 0'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2', 'Column 3']);
+
+  form.addScaleItem()
+    .setTitle("Question 42")
+    .setBounds(0, 6)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 42");
+
+  form.addDateTimeItem()
+    .setTitle("Question 43")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 44")
+    .setChoiceValues(['Option 0'])
+    .setHelpText("Description of question 44");
+
+  sections["Section 68"]
+    .setTitle("Section 68")
+    .setHelpText("About section 68");
+
+  form.moveItem(form.getItemById(sections["Section 68"].getId()), form.getItems().length - 1);
+
+  form.addTextItem()
+    .setTitle("Question 45")
+    .setRequired(true)
+    .setHelpText("Description of question 45");
+
+  form.addDurationItem()
+    .setTitle("Question 46");
+
+  form.addDateTimeItem()
+    .setTitle("Question 47")
+    .setHelpText("Description of question 47");
+
+  sections["Section 11"]
+    .setTitle("Section 11")
+    .setHelpText("About section 11");
+
+  form.moveItem(form.getItemById(sections["Section 11"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 48")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2'])
+    .setHelpText("Description of question 48");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 49");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 50")
+    .setChoiceValues(['Option 0'])
+    .setRequired(true);
+
+  form.addDurationItem()
+    .setTitle("Question 51")
+    .setHelpText("Description of question 51")
+    .setRequired(true);
+
+  form.addGridItem()
+    .setTitle("Question 52")
+    .setRows(['Row 0', 'Row 1', 'Row 2', 'Row 3'])
+    .setColumns(['Column 0']);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 53");
+
+  form.addTextItem()
+    .setTitle("Question 54")
+    .setRequired(true)
+    .setHelpText("Description of question 54");
+
+  form.addScaleItem()
+    .setTitle("Question 55")
+    .setBounds(1, 7)
+    .setLabels("Low", "High")
+    .setRequired(true);
+
+  form.addTextItem()
+    .setTitle("Question 56");
+
+  sections["Section 66"]
+    .setTitle("Section 66")
+    .setHelpText("About section 66");
+
+  form.moveItem(form.getItemById(sections["Section 66"].getId()), form.getItems().length - 1);
+
+  form.addGridItem()
+    .setTitle("Question 57")
+    .setRows(['Row 0', 'Row 1'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2', 'Column 3'])
+    .setHelpText("Description of question 57");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 58")
+    .setChoiceValues(['Option 0']);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 59");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 49"])
+    ])
+    .setHelpText("Description of question 59");
+
+  form.addDateTimeItem()
+    .setTitle("Question 60")
+    .setHelpText("Description of question 60")
+    .setRequired(true);
+
+  sections["Section 41"]
+    .setTitle("Section 41")
+    .setHelpText("About section 41");
+
+  form.moveItem(form.getItemById(sections["Section 41"].getId()), form.getItems().length - 1);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 61");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 10"]),
+      item.createChoice("Go 1", sections["Section 47"]),
+      item.createChoice("Go 2", sections["Section 28"]),
+      item.createChoice("Go 3", sections["Section 33"])
+    ]);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 62");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 14"]),
+      item.createChoice("Go 1", sections["Section 8"]),
+      item.createChoice("Go 2", sections["Section 3"])
+    ])
+    .setHelpText("Description of question 62");
+
+  form.addDateTimeItem()
+    .setTitle("Question 63")
+    .setHelpText("Description of question 63");
+
+  form.addDateTimeItem()
+    .setTitle("Question 64")
+    .setHelpText("Description of question 64");
+
+  form.addScaleItem()
+    .setTitle("Question 65")
+    .setBounds(1, 7)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 65");
+
+  form.addDurationItem()
+    .setTitle("Question 66")
+    .setHelpText("Description of question 66");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 67");
+
+  form.addDateTimeItem()
+    .setTitle("Question 68");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 69");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 70")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4']);
+
+  sections["Section 75"]
+    .setTitle("Section 75")
+    .setHelpText("About section 75");
+
+  form.moveItem(form.getItemById(sections["Section 75"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 71")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3']);
+
+  form.addScaleItem()
+    .setTitle("Question 72")
+    .setBounds(0, 3)
+    .setLabels("Low", "High");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 73")
+    .setChoiceValues(['Option 0', 'Option 1']);
+
+  form.addScaleItem()
+    .setTitle("Question 74")
+    .setBounds(1, 4)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 74")
+    .setRequired(true);
+
+  form.addScaleItem()
+    .setTitle("Question 75")
+    .setBounds(1, 8)
+    .setLabels("Low", "High");
+
+  sections["Section 8"]
+    .setTitle("Section 8")
+    .setHelpText("About section 8");
+
+  form.moveItem(form.getItemById(sections["Section 8"].getId()), form.getItems().length - 1);
+
+  form.addDateTimeItem()
+    .setTitle("Question 76");
+
+  form.addDateTimeItem()
+    .setTitle("Question 77")
+    .setHelpText("Description of question 77");
+
+  form.addDurationItem()
+    .setTitle("Question 78");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 79")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2'])
+    .setHelpText("Description of question 79");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 80")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3'])
+    .setHelpText("Description of question 80");
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 81")
+    .setRows(['Row 0', 'Row 1', 'Row 2', 'Row 3'])
+    .setColumns(['Column 0']);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 82");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 42"]),
+      item.createChoice("Go 1", sections["Section 7"]),
+      item.createChoice("Go 2", sections["Section 4"])
+    ])
+    .setRequired(true);
+
+  form.addDurationItem()
+    .setTitle("Question 83")
+    .setHelpText("Description of question 83");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 84")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 84");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 85")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3'])
+    .setHelpText("Description of question 85");
+
+  form.addDurationItem()
+    .setTitle("Question 86")
+    .setHelpText("Description of question 86");
+
+  sections["Section 37"]
+    .setTitle("Section 37")
+    .setHelpText("About section 37");
+
+  form.moveItem(form.getItemById(sections["Section 37"].getId()), form.getItems().length - 1);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 87");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 62"]),
+      item.createChoice("Go 1", sections["Section 14"]),
+      item.createChoice("Go 2", sections["Section 7"]),
+      item.createChoice("Go 3", sections["Section 78"])
+    ]);
+
+  form.addTextItem()
+    .setTitle("Question 88");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 89")
+    .setHelpText("Description of question 89");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 90");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 50"])
+    ]);
+
+  sections["Section 29"]
+    .setTitle("Section 29")
+    .setHelpText("About section 29");
+
+  form.moveItem(form.getItemById(sections["Section 29"].getId()), form.getItems().length - 1);
+
+  form.addTextItem()
+    .setTitle("Question 91")
+    .setHelpText("Description of question 91");
+
+  form.addGridItem()
+    .setTitle("Question 92")
+    .setRows(['Row 0', 'Row 1'])
+    .setColumns(['Column 0'])
+    .setHelpText("Description of question 92");
+
+  form.addDateTimeItem()
+    .setTitle("Question 93");
+
+  form.addDurationItem()
+    .setTitle("Question 94")
+    .setHelpText("Description of question 94");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 95")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3'])
+    .setHelpText("Description of question 95");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 96")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3']);
+
+  form.addScaleItem()
+    .setTitle("Question 97")
+    .setBounds(1, 6)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 97");
+
+  form.addTextItem()
+    .setTitle("Question 98")
+    .setRequired(true)
+    .setHelpText("Description of question 98");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 99");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 9"]),
+      item.createChoice("Go 1", sections["Section 76"]),
+      item.createChoice("Go 2", sections["Section 18"])
+    ])
+    .setHelpText("Description of question 99");
+
+  form.addDateTimeItem()
+    .setTitle("Question 100")
+    .setHelpText("Description of question 100")
+    .setRequired(true);
+
+  sections["Section 1"]
+    .setTitle("Section 1")
+    .setHelpText("About section 1");
+
+  form.moveItem(form.getItemById(sections["Section 1"].getId()), form.getItems().length - 1);
+
+  form.addDurationItem()
+    .setTitle("Question 101")
+    .setHelpText("Description of question 101");
+
+  form.addTextItem()
+    .setTitle("Question 102")
+    .setRequired(true)
+    .setHelpText("Description of question 102");
+
+  form.addTextItem()
+    .setTitle("Question 103")
+    .setRequired(true)
+    .setHelpText("Description of question 103");
+
+  form.addDateTimeItem()
+    .setTitle("Question 104")
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 105")
+    .setHelpText("Description of question 105");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 106")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setHelpText("Description of question 106");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 107")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2'])
+    .setHelpText("Description of question 107");
+
+  sections["Section 14"]
+    .setTitle("Section 14")
+    .setHelpText("About section 14");
+
+  form.moveItem(form.getItemById(sections["Section 14"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 108")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 108");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 109")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setHelpText("Description of question 109")
+    .setRequired(true);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 110");
+
+  form.addGridItem()
+    .setTitle("Question 111")
+    .setRows(['Row 0'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2', 'Column 3']);
+
+  form.addDateTimeItem()
+    .setTitle("Question 112");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 113")
+    .setHelpText("Description of question 113");
+
+  form.addTextItem()
+    .setTitle("Question 114")
+    .setHelpText("Description of question 114");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 115")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2'])
+    .setHelpText("Description of question 115")
+    .setRequired(true);
+
+  sections["Section 52"]
+    .setTitle("Section 52")
+    .setHelpText("About section 52");
+
+  form.moveItem(form.getItemById(sections["Section 52"].getId()), form.getItems().length - 1);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 116");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 117")
+    .setHelpText("Description of question 117");
+
+  form.addDateTimeItem()
+    .setTitle("Question 118")
+    .setHelpText("Description of question 118")
+    .setRequired(true);
+
+  form.addScaleItem()
+    .setTitle("Question 119")
+    .setBounds(0, 6)
+    .setLabels("Low", "High");
+
+  sections["Section 59"]
+    .setTitle("Section 59")
+    .setHelpText("About section 59");
+
+  form.moveItem(form.getItemById(sections["Section 59"].getId()), form.getItems().length - 1);
+
+  form.addScaleItem()
+    .setTitle("Question 120")
+    .setBounds(0, 5)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 120");
+
+  form.addDateTimeItem()
+    .setTitle("Question 121")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 122")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5']);
+
+  sections["Section 63"]
+    .setTitle("Section 63")
+    .setHelpText("About section 63");
+
+  form.moveItem(form.getItemById(sections["Section 63"].getId()), form.getItems().length - 1);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 123")
+    .setHelpText("Description of question 123");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 124")
+    .setChoiceValues(['Option 0'])
+    .setRequired(true);
+
+  form.addDurationItem()
+    .setTitle("Question 125")
+    .setRequired(true);
+
+  form.addGridItem()
+    .setTitle("Question 126")
+    .setRows(['Row 0'])
+    .setColumns(['Column 0'])
+    .setHelpText("Description of question 126")
+    .setRequired(true);
+
+  form.addTextItem()
+    .setTitle("Question 127")
+    .setHelpText("Description of question 127");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 128")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3']);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 129")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 129");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 130")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3'])
+    .setHelpText("Description of question 130");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 131");
+
+  form.addGridItem()
+    .setTitle("Question 132")
+    .setRows(['Row 0', 'Row 1', 'Row 2'])
+    .setColumns(['Column 0', 'Column 1']);
+
+  sections["Section 18"]
+    .setTitle("Section 18")
+    .setHelpText("About section 18");
+
+  form.moveItem(form.getItemById(sections["Section 18"].getId()), form.getItems().length - 1);
+
+  form.addDurationItem()
+    .setTitle("Question 133")
+    .setHelpText("Description of question 133");
+
+  form.addDateTimeItem()
+    .setTitle("Question 134")
+    .setHelpText("Description of question 134");
+
+  form.addDateTimeItem()
+    .setTitle("Question 135")
+    .setHelpText("Description of question 135")
+    .setRequired(true);
+
+  form.addGridItem()
+    .setTitle("Question 136")
+    .setRows(['Row 0', 'Row 1', 'Row 2', 'Row 3'])
+    .setColumns(['Column 0', 'Column 1'])
+    .setHelpText("Description of question 136");
+
+  sections["Section 47"]
+    .setTitle("Section 47")
+    .setHelpText("About section 47");
+
+  form.moveItem(form.getItemById(sections["Section 47"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 137")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 137");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 138")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5']);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 139");
+
+  sections["Section 2"]
+    .setTitle("Section 2")
+    .setHelpText("About section 2");
+
+  form.moveItem(form.getItemById(sections["Section 2"].getId()), form.getItems().length - 1);
+
+  form.addGridItem()
+    .setTitle("Question 140")
+    .setRows(['Row 0', 'Row 1'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2'])
+    .setHelpText("Description of question 140")
+    .setRequired(true);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 141")
+    .setHelpText("Description of question 141");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 142")
+    .setHelpText("Description of question 142");
+
+  sections["Section 78"]
+    .setTitle("Section 78")
+    .setHelpText("About section 78");
+
+  form.moveItem(form.getItemById(sections["Section 78"].getId()), form.getItems().length - 1);
+
+  form.addTextItem()
+    .setTitle("Question 143")
+    .setHelpText("Description of question 143");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 144")
+    .setHelpText("Description of question 144");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 145");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 26"]),
+      item.createChoice("Go 1", sections["Section 75"]),
+      item.createChoice("Go 2", sections["Section 6"]),
+      item.createChoice("Go 3", sections["Section 49"])
+    ])
+    .setHelpText("Description of question 145");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 146")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2'])
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 147")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setRequired(true);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 148");
+
+  form.addTextItem()
+    .setTitle("Question 149");
+
+  form.addDateTimeItem()
+    .setTitle("Question 150")
+    .setRequired(true);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 151");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 34"]),
+      item.createChoice("Go 1", sections["Section 5"]),
+      item.createChoice("Go 2", sections["Section 5"])
+    ]);
+
+  form.addGridItem()
+    .setTitle("Question 152")
+    .setRows(['Row 0', 'Row 1'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2', 'Column 3'])
+    .setHelpText("Description of question 152")
+    .setRequired(true);
+
+  sections["Section 74"]
+    .setTitle("Section 74")
+    .setHelpText("About section 74");
+
+  form.moveItem(form.getItemById(sections["Section 74"].getId()), form.getItems().length - 1);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 153");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 24"]),
+      item.createChoice("Go 1", sections["Section 43"]),
+      item.createChoice("Go 2", sections["Section 77"]),
+      item.createChoice("Go 3", sections["Section 13"])
+    ])
+    .setHelpText("Description of question 153");
+
+  form.addTextItem()
+    .setTitle("Question 154")
+    .setHelpText("Description of question 154");
+
+  form.addDateTimeItem()
+    .setTitle("Question 155")
+    .setHelpText("Description of question 155");
+
+  form.addDateTimeItem()
+    .setTitle("Question 156")
+    .setHelpText("Description of question 156");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 157")
+    .setHelpText("Description of question 157");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 158")
+    .setHelpText("Description of question 158");
+
+  sections["Section 23"]
+    .setTitle("Section 23")
+    .setHelpText("About section 23");
+
+  form.moveItem(form.getItemById(sections["Section 23"].getId()), form.getItems().length - 1);
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 159")
+    .setRows(['Row 0'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2', 'Column 3'])
+    .setHelpText("Description of question 159");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 160")
+    .setHelpText("Description of question 160");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 161");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 19"])
+    ])
+    .setHelpText("Description of question 161");
+
+  form.addScaleItem()
+    .setTitle("Question 162")
+    .setBounds(0, 8)
+    .setLabels("Low", "High");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 163");
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 164")
+    .setRows(['Row 0', 'Row 1', 'Row 2'])
+    .setColumns(['Column 0'])
+    .setHelpText("Description of question 164")
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 165")
+    .setHelpText("Description of question 165");
+
+  form.addScaleItem()
+    .setTitle("Question 166")
+    .setBounds(1, 6)
+    .setLabels("Low", "High");
+
+  sections["Section 7"]
+    .setTitle("Section 7")
+    .setHelpText("About section 7");
+
+  form.moveItem(form.getItemById(sections["Section 7"].getId()), form.getItems().length - 1);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 167");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 168");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 36"]),
+      item.createChoice("Go 1", sections["Section 0"])
+    ])
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 169")
+    .setChoiceValues(['Option 0']);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 170")
+    .setHelpText("Description of question 170");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 171")
+    .setHelpText("Description of question 171");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 172");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 8"]),
+      item.createChoice("Go 1", sections["Section 66"])
+    ]);
+
+  sections["Section 10"]
+    .setTitle("Section 10")
+    .setHelpText("About section 10");
+
+  form.moveItem(form.getItemById(sections["Section 10"].getId()), form.getItems().length - 1);
+
+  form.addDateTimeItem()
+    .setTitle("Question 173")
+    .setHelpText("Description of question 173");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 174")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 174");
+
+  form.addDateTimeItem()
+    .setTitle("Question 175")
+    .setHelpText("Description of question 175");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 176")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 176");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 177");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 72"]),
+      item.createChoice("Go 1", sections["Section 27"]),
+      item.createChoice("Go 2", sections["Section 30"]),
+      item.createChoice("Go 3", sections["Section 16"])
+    ])
+    .setHelpText("Description of question 177");
+
+  form.addTextItem()
+    .setTitle("Question 178");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 179")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 179");
+
+  sections["Section 60"]
+    .setTitle("Section 60")
+    .setHelpText("About section 60");
+
+  form.moveItem(form.getItemById(sections["Section 60"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 180")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setHelpText("Description of question 180");
+
+  form.addScaleItem()
+    .setTitle("Question 181")
+    .setBounds(1, 7)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 181");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 182")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 182");
+
+  form.addTextItem()
+    .setTitle("Question 183")
+    .setHelpText("Description of question 183");
+
+  form.addTextItem()
+    .setTitle("Question 184")
+    .setHelpText("Description of question 184");
+
+  form.addDateTimeItem()
+    .setTitle("Question 185");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 186")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2'])
+    .setHelpText("Description of question 186");
+
+  form.addDateTimeItem()
+    .setTitle("Question 187")
+    .setHelpText("Description of question 187");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 188")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 189")
+    .setHelpText("Description of question 189")
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 190")
+    .setHelpText("Description of question 190");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 191")
+    .setHelpText("Description of question 191");
+
+  sections["Section 26"]
+    .setTitle("Section 26")
+    .setHelpText("About section 26");
+
+  form.moveItem(form.getItemById(sections["Section 26"].getId()), form.getItems().length - 1);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 192")
+    .setHelpText("Description of question 192");
+
+  form.addGridItem()
+    .setTitle("Question 193")
+    .setRows(['Row 0'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2', 'Column 3'])
+    .setHelpText("Description of question 193");
+
+  form.addDateTimeItem()
+    .setTitle("Question 194")
+    .setHelpText("Description of question 194");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 195")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setHelpText("Description of question 195")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 196")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5']);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 197")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5']);
+
+  form.addDurationItem()
+    .setTitle("Question 198")
+    .setRequired(true);
+
+  sections["Section 15"]
+    .setTitle("Section 15")
+    .setHelpText("About section 15");
+
+  form.moveItem(form.getItemById(sections["Section 15"].getId()), form.getItems().length - 1);
+
+  form.addTextItem()
+    .setTitle("Question 199")
+    .setHelpText("Description of question 199");
+
+  form.addScaleItem()
+    .setTitle("Question 200")
+    .setBounds(0, 7)
+    .setLabels("Low", "High");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 201");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 20"]),
+      item.createChoice("Go 1", sections["Section 51"]),
+      item.createChoice("Go 2", sections["Section 43"])
+    ])
+    .setHelpText("Description of question 201")
+    .setRequired(true);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 202")
+    .setRequired(true)
+    .setHelpText("Description of question 202");
+
+  form.addScaleItem()
+    .setTitle("Question 203")
+    .setBounds(0, 6)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 203");
+
+  sections["Section 55"]
+    .setTitle("Section 55")
+    .setHelpText("About section 55");
+
+  form.moveItem(form.getItemById(sections["Section 55"].getId()), form.getItems().length - 1);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 204");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 205")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2'])
+    .setHelpText("Description of question 205")
+    .setRequired(true);
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 206")
+    .setRows(['Row 0', 'Row 1', 'Row 2'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2']);
+
+  sections["Section 71"]
+    .setTitle("Section 71")
+    .setHelpText("About section 71");
+
+  form.moveItem(form.getItemById(sections["Section 71"].getId()), form.getItems().length - 1);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 207");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 20"]),
+      item.createChoice("Go 1", sections["Section 19"]),
+      item.createChoice("Go 2", sections["Section 42"])
+    ])
+    .setRequired(true);
+
+  form.addDurationItem()
+    .setTitle("Question 208");
+
+  form.addDateTimeItem()
+    .setTitle("Question 209")
+    .setHelpText("Description of question 209");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 210")
+    .setHelpText("Description of question 210");
+
+  form.addScaleItem()
+    .setTitle("Question 211")
+    .setBounds(0, 7)
+    .setLabels("Low", "High");
+
+  form.addScaleItem()
+    .setTitle("Question 212")
+    .setBounds(1, 5)
+    .setLabels("Low", "High");
+
+  sections["Section 25"]
+    .setTitle("Section 25")
+    .setHelpText("About section 25");
+
+  form.moveItem(form.getItemById(sections["Section 25"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 213")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 213");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 214")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 215")
+    .setRequired(true);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 216")
+    .setRequired(true)
+    .setHelpText("Description of question 216");
+
+  sections["Section 77"]
+    .setTitle("Section 77")
+    .setHelpText("About section 77");
+
+  form.moveItem(form.getItemById(sections["Section 77"].getId()), form.getItems().length - 1);
+
+  form.addTextItem()
+    .setTitle("Question 217")
+    .setHelpText("Description of question 217");
+
+  form.addDateTimeItem()
+    .setTitle("Question 218");
+
+  form.addDateTimeItem()
+    .setTitle("Question 219");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 220")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5'])
+    .setHelpText("Description of question 220");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 221")
+    .setHelpText("Description of question 221");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 222");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 35"]),
+      item.createChoice("Go 1", sections["Section 23"])
+    ]);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 223")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4']);
+
+  form.addScaleItem()
+    .setTitle("Question 224")
+    .setBounds(0, 5)
+    .setLabels("Low", "High");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 225")
+    .setRequired(true);
+
+  form.addTextItem()
+    .setTitle("Question 226")
+    .setRequired(true);
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 227")
+    .setRows(['Row 0', 'Row 1', 'Row 2', 'Row 3'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2', 'Column 3'])
+    .setHelpText("Description of question 227");
+
+  sections["Section 0"]
+    .setTitle("Section 0")
+    .setHelpText("About section 0");
+
+  form.moveItem(form.getItemById(sections["Section 0"].getId()), form.getItems().length - 1);
+
+  form.addDurationItem()
+    .setTitle("Question 228");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 229")
+    .setHelpText("Description of question 229");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 230")
+    .setRequired(true);
+
+  form.addTextItem()
+    .setTitle("Question 231")
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 232")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 233")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2']);
+
+  form.addDateTimeItem()
+    .setTitle("Question 234")
+    .setHelpText("Description of question 234");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 235");
+
+  form.addScaleItem()
+    .setTitle("Question 236")
+    .setBounds(0, 2)
+    .setLabels("Low", "High")
+    .setRequired(true);
+
+  sections["Section 3"]
+    .setTitle("Section 3")
+    .setHelpText("About section 3");
+
+  form.moveItem(form.getItemById(sections["Section 3"].getId()), form.getItems().length - 1);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 237");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 238")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4']);
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 239")
+    .setRows(['Row 0', 'Row 1', 'Row 2'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2', 'Column 3'])
+    .setHelpText("Description of question 239")
+    .setRequired(true);
+
+  form.addScaleItem()
+    .setTitle("Question 240")
+    .setBounds(0, 2)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 240");
+
+  form.addDateTimeItem()
+    .setTitle("Question 241")
+    .setHelpText("Description of question 241");
+
+  form.addDateTimeItem()
+    .setTitle("Question 242")
+    .setHelpText("Description of question 242");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 243");
+
+  form.addScaleItem()
+    .setTitle("Question 244")
+    .setBounds(0, 3)
+    .setLabels("Low", "High");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 245")
+    .setChoiceValues(['Option 0'])
+    .setHelpText("Description of question 245");
+
+  form.addScaleItem()
+    .setTitle("Question 246")
+    .setBounds(1, 8)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 246");
+
+  form.addDateTimeItem()
+    .setTitle("Question 247");
+
+  sections["Section 16"]
+    .setTitle("Section 16")
+    .setHelpText("About section 16");
+
+  form.moveItem(form.getItemById(sections["Section 16"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 248")
+    .setChoiceValues(['Option 0'])
+    .setHelpText("Description of question 248");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 249")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3']);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 250");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 251")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3']);
+
+  form.addDurationItem()
+    .setTitle("Question 252")
+    .setHelpText("Description of question 252")
+    .setRequired(true);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 253");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 254")
+    .setHelpText("Description of question 254");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 255")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setHelpText("Description of question 255")
+    .setRequired(true);
+
+  sections["Section 76"]
+    .setTitle("Section 76")
+    .setHelpText("About section 76");
+
+  form.moveItem(form.getItemById(sections["Section 76"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 256")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2']);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 257");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 258")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 258");
+
+  form.addGridItem()
+    .setTitle("Question 259")
+    .setRows(['Row 0'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2']);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 260")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setHelpText("Description of question 260");
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 261")
+    .setRows(['Row 0'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2']);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 262")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 263")
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 264")
+    .setHelpText("Description of question 264");
+
+  sections["Section 28"]
+    .setTitle("Section 28")
+    .setHelpText("About section 28");
+
+  form.moveItem(form.getItemById(sections["Section 28"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 265")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setHelpText("Description of question 265")
+    .setRequired(true);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 266")
+    .setHelpText("Description of question 266");
+
+  form.addDurationItem()
+    .setTitle("Question 267")
+    .setHelpText("Description of question 267");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 268")
+    .setHelpText("Description of question 268");
+
+  form.addDateTimeItem()
+    .setTitle("Question 269")
+    .setRequired(true);
+
+  form.addDurationItem()
+    .setTitle("Question 270")
+    .setRequired(true);
+
+  sections["Section 79"]
+    .setTitle("Section 79")
+    .setHelpText("About section 79");
+
+  form.moveItem(form.getItemById(sections["Section 79"].getId()), form.getItems().length - 1);
+
+  form.addDurationItem()
+    .setTitle("Question 271")
+    .setHelpText("Description of question 271");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 272");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 9"]),
+      item.createChoice("Go 1", sections["Section 16"]),
+      item.createChoice("Go 2", sections["Section 52"]),
+      item.createChoice("Go 3", sections["Section 72"])
+    ])
+    .setHelpText("Description of question 272");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 273");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 274")
+    .setHelpText("Description of question 274");
+
+  form.addGridItem()
+    .setTitle("Question 275")
+    .setRows(['Row 0', 'Row 1', 'Row 2'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2', 'Column 3']);
+
+  form.addDurationItem()
+    .setTitle("Question 276")
+    .setHelpText("Description of question 276");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 277")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setHelpText("Description of question 277");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 278")
+    .setHelpText("Description of question 278");
+
+  form.addDurationItem()
+    .setTitle("Question 279");
+
+  sections["Section 48"]
+    .setTitle("Section 48")
+    .setHelpText("About section 48");
+
+  form.moveItem(form.getItemById(sections["Section 48"].getId()), form.getItems().length - 1);
+
+  form.addDurationItem()
+    .setTitle("Question 280")
+    .setHelpText("Description of question 280");
+
+  form.addDateTimeItem()
+    .setTitle("Question 281")
+    .setHelpText("Description of question 281");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 282");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 22"]),
+      item.createChoice("Go 1", sections["Section 74"]),
+      item.createChoice("Go 2", sections["Section 41"])
+    ]);
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 283")
+    .setRows(['Row 0'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2'])
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 284")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setHelpText("Description of question 284");
+
+  sections["Section 13"]
+    .setTitle("Section 13")
+    .setHelpText("About section 13");
+
+  form.moveItem(form.getItemById(sections["Section 13"].getId()), form.getItems().length - 1);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 285")
+    .setHelpText("Description of question 285");
+
+  form.addDateTimeItem()
+    .setTitle("Question 286")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 287")
+    .setChoiceValues(['Option 0', 'Option 1']);
+
+  form.addDateTimeItem()
+    .setTitle("Question 288")
+    .setHelpText("Description of question 288")
+    .setRequired(true);
+
+  sections["Section 40"]
+    .setTitle("Section 40")
+    .setHelpText("About section 40");
+
+  form.moveItem(form.getItemById(sections["Section 40"].getId()), form.getItems().length - 1);
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 289")
+    .setRows(['Row 0'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2']);
+
+  form.addDateTimeItem()
+    .setTitle("Question 290")
+    .setHelpText("Description of question 290");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 291");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 292")
+    .setHelpText("Description of question 292");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 293");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 294")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 294");
+
+  form.addDateTimeItem()
+    .setTitle("Question 295");
+
+  form.addDateTimeItem()
+    .setTitle("Question 296");
+
+  sections["Section 39"]
+    .setTitle("Section 39")
+    .setHelpText("About section 39");
+
+  form.moveItem(form.getItemById(sections["Section 39"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 297")
+    .setChoiceValues(['Option 0'])
+    .setHelpText("Description of question 297")
+    .setRequired(true);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 298")
+    .setHelpText("Description of question 298");
+
+  form.addScaleItem()
+    .setTitle("Question 299")
+    .setBounds(1, 6)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 299");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 300");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 71"]),
+      item.createChoice("Go 1", sections["Section 70"])
+    ]);
+
+  form.addDateTimeItem()
+    .setTitle("Question 301")
+    .setHelpText("Description of question 301");
+
+  form.addDateTimeItem()
+    .setTitle("Question 302");
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 303")
+    .setRows(['Row 0', 'Row 1'])
+    .setColumns(['Column 0', 'Column 1']);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 304");
+
+  form.addScaleItem()
+    .setTitle("Question 305")
+    .setBounds(0, 9)
+    .setLabels("Low", "High");
+
+  form.addDateTimeItem()
+    .setTitle("Question 306")
+    .setHelpText("Description of question 306");
+
+  form.addDateTimeItem()
+    .setTitle("Question 307")
+    .setHelpText("Description of question 307");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 308")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3']);
+
+  sections["Section 20"]
+    .setTitle("Section 20")
+    .setHelpText("About section 20");
+
+  form.moveItem(form.getItemById(sections["Section 20"].getId()), form.getItems().length - 1);
+
+  form.addDurationItem()
+    .setTitle("Question 309")
+    .setHelpText("Description of question 309");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 310")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2'])
+    .setHelpText("Description of question 310")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 311")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5'])
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 312")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4']);
+
+  sections["Section 69"]
+    .setTitle("Section 69")
+    .setHelpText("About section 69");
+
+  form.moveItem(form.getItemById(sections["Section 69"].getId()), form.getItems().length - 1);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 313")
+    .setRequired(true)
+    .setHelpText("Description of question 313");
+
+  form.addTextItem()
+    .setTitle("Question 314");
+
+  form.addGridItem()
+    .setTitle("Question 315")
+    .setRows(['Row 0', 'Row 1'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2', 'Column 3'])
+    .setHelpText("Description of question 315")
+    .setRequired(true);
+
+  form.addTextItem()
+    .setTitle("Question 316");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 317")
+    .setHelpText("Description of question 317");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 318")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setHelpText("Description of question 318");
+
+  form.addScaleItem()
+    .setTitle("Question 319")
+    .setBounds(1, 6)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 319")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 320")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3'])
+    .setHelpText("Description of question 320");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 321");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 45"]),
+      item.createChoice("Go 1", sections["Section 55"]),
+      item.createChoice("Go 2", sections["Section 35"])
+    ]);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 322")
+    .setHelpText("Description of question 322");
+
+  form.addScaleItem()
+    .setTitle("Question 323")
+    .setBounds(1, 3)
+    .setLabels("Low", "High");
+
+  sections["Section 22"]
+    .setTitle("Section 22")
+    .setHelpText("About section 22");
+
+  form.moveItem(form.getItemById(sections["Section 22"].getId()), form.getItems().length - 1);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 324");
+
+  form.addScaleItem()
+    .setTitle("Question 325")
+    .setBounds(0, 3)
+    .setLabels("Low", "High")
+    .setRequired(true);
+
+  form.addScaleItem()
+    .setTitle("Question 326")
+    .setBounds(1, 5)
+    .setLabels("Low", "High");
+
+  form.addScaleItem()
+    .setTitle("Question 327")
+    .setBounds(0, 7)
+    .setLabels("Low", "High");
+
+  form.addScaleItem()
+    .setTitle("Question 328")
+    .setBounds(1, 8)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 328");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 329")
+    .setHelpText("Description of question 329");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 330")
+    .setHelpText("Description of question 330");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 331")
+    .setHelpText("Description of question 331");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 332")
+    .setChoiceValues(['Option 0'])
+    .setHelpText("Description of question 332");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 333")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 333");
+
+  sections["Section 54"]
+    .setTitle("Section 54")
+    .setHelpText("About section 54");
+
+  form.moveItem(form.getItemById(sections["Section 54"].getId()), form.getItems().length - 1);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 334")
+    .setHelpText("Description of question 334");
+
+  form.addDateTimeItem()
+    .setTitle("Question 335");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 336");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 48"]),
+      item.createChoice("Go 1", sections["Section 60"]),
+      item.createChoice("Go 2", sections["Section 0"]),
+      item.createChoice("Go 3", sections["Section 55"])
+    ]);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 337")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setRequired(true);
+
+  form.addTextItem()
+    .setTitle("Question 338")
+    .setHelpText("Description of question 338");
+
+  form.addDurationItem()
+    .setTitle("Question 339");
+
+  form.addGridItem()
+    .setTitle("Question 340")
+    .setRows(['Row 0', 'Row 1'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2', 'Column 3']);
+
+  form.addTextItem()
+    .setTitle("Question 341")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 342")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5'])
+    .setHelpText("Description of question 342");
+
+  form.addScaleItem()
+    .setTitle("Question 343")
+    .setBounds(1, 4)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 343");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 344")
+    .setHelpText("Description of question 344");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 345");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 31"]),
+      item.createChoice("Go 1", sections["Section 44"]),
+      item.createChoice("Go 2", sections["Section 61"]),
+      item.createChoice("Go 3", sections["Section 52"])
+    ])
+    .setRequired(true);
+
+  sections["Section 35"]
+    .setTitle("Section 35")
+    .setHelpText("About section 35");
+
+  form.moveItem(form.getItemById(sections["Section 35"].getId()), form.getItems().length - 1);
+
+  form.addDateTimeItem()
+    .setTitle("Question 346");
+
+  form.addScaleItem()
+    .setTitle("Question 347")
+    .setBounds(1, 4)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 347")
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 348")
+    .setHelpText("Description of question 348")
+    .setRequired(true);
+
+  sections["Section 30"]
+    .setTitle("Section 30")
+    .setHelpText("About section 30");
+
+  form.moveItem(form.getItemById(sections["Section 30"].getId()), form.getItems().length - 1);
+
+  form.addDateTimeItem()
+    .setTitle("Question 349")
+    .setHelpText("Description of question 349");
+
+  form.addDurationItem()
+    .setTitle("Question 350")
+    .setHelpText("Description of question 350")
+    .setRequired(true);
+
+  form.addScaleItem()
+    .setTitle("Question 351")
+    .setBounds(0, 4)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 351");
+
+  form.addTextItem()
+    .setTitle("Question 352");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 353");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 354")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5']);
+
+  form.addDateTimeItem()
+    .setTitle("Question 355")
+    .setHelpText("Description of question 355");
+
+  form.addDurationItem()
+    .setTitle("Question 356")
+    .setHelpText("Description of question 356")
+    .setRequired(true);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 357");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 78"]),
+      item.createChoice("Go 1", sections["Section 28"]),
+      item.createChoice("Go 2", sections["Section 13"]),
+      item.createChoice("Go 3", sections["Section 66"])
+    ])
+    .setHelpText("Description of question 357")
+    .setRequired(true);
+
+  form.addGridItem()
+    .setTitle("Question 358")
+    .setRows(['Row 0', 'Row 1', 'Row 2', 'Row 3'])
+    .setColumns(['Column 0', 'Column 1']);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 359");
+
+  sections["Section 21"]
+    .setTitle("Section 21")
+    .setHelpText("About section 21");
+
+  form.moveItem(form.getItemById(sections["Section 21"].getId()), form.getItems().length - 1);
+
+  form.addTextItem()
+    .setTitle("Question 360");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 361")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3'])
+    .setRequired(true);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 362");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 5"]),
+      item.createChoice("Go 1", sections["Section 2"]),
+      item.createChoice("Go 2", sections["Section 51"])
+    ]);
+
+  form.addDurationItem()
+    .setTitle("Question 363")
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 364");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 365")
+    .setChoiceValues(['Option 0']);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 366")
+    .setChoiceValues(['Option 0', 'Option 1']);
+
+  form.addGridItem()
+    .setTitle("Question 367")
+    .setRows(['Row 0'])
+    .setColumns(['Column 0']);
+
+  form.addTextItem()
+    .setTitle("Question 368");
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 369")
+    .setRows(['Row 0', 'Row 1', 'Row 2', 'Row 3'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2'])
+    .setRequired(true);
+
+  sections["Section 43"]
+    .setTitle("Section 43")
+    .setHelpText("About section 43");
+
+  form.moveItem(form.getItemById(sections["Section 43"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 370")
+    .setChoiceValues(['Option 0'])
+    .setHelpText("Description of question 370");
+
+  form.addDurationItem()
+    .setTitle("Question 371")
+    .setRequired(true);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 372");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 373")
+    .setHelpText("Description of question 373");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 374")
+    .setHelpText("Description of question 374");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 375")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2'])
+    .setHelpText("Description of question 375");
+
+  sections["Section 4"]
+    .setTitle("Section 4")
+    .setHelpText("About section 4");
+
+  form.moveItem(form.getItemById(sections["Section 4"].getId()), form.getItems().length - 1);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 376");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 43"])
+    ]);
+
+  form.addScaleItem()
+    .setTitle("Question 377")
+    .setBounds(0, 6)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 377");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 378")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 378");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 379")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2']);
+
+  form.addDurationItem()
+    .setTitle("Question 380");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 381");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 12"]),
+      item.createChoice("Go 1", sections["Section 71"]),
+      item.createChoice("Go 2", sections["Section 27"])
+    ])
+    .setRequired(true);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 382");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 25"]),
+      item.createChoice("Go 1", sections["Section 77"]),
+      item.createChoice("Go 2", sections["Section 56"]),
+      item.createChoice("Go 3", sections["Section 44"])
+    ]);
+
+  sections["Section 46"]
+    .setTitle("Section 46")
+    .setHelpText("About section 46");
+
+  form.moveItem(form.getItemById(sections["Section 46"].getId()), form.getItems().length - 1);
+
+  form.addTextItem()
+    .setTitle("Question 383")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 384")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2'])
+    .setHelpText("Description of question 384");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 385")
+    .setChoiceValues(['Option 0']);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 386")
+    .setHelpText("Description of question 386");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 387")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 387");
+
+  sections["Section 6"]
+    .setTitle("Section 6")
+    .setHelpText("About section 6");
+
+  form.moveItem(form.getItemById(sections["Section 6"].getId()), form.getItems().length - 1);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 388")
+    .setHelpText("Description of question 388");
+
+  form.addDateTimeItem()
+    .setTitle("Question 389")
+    .setHelpText("Description of question 389")
+    .setRequired(true);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 390")
+    .setRequired(true);
+
+  sections["Section 19"]
+    .setTitle("Section 19")
+    .setHelpText("About section 19");
+
+  form.moveItem(form.getItemById(sections["Section 19"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 391")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2']);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 392")
+    .setHelpText("Description of question 392");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 393")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5'])
+    .setHelpText("Description of question 393")
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 394")
+    .setHelpText("Description of question 394");
+
+  form.addGridItem()
+    .setTitle("Question 395")
+    .setRows(['Row 0', 'Row 1'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2']);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 396");
+
+  form.addDateTimeItem()
+    .setTitle("Question 397")
+    .setHelpText("Description of question 397")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 398")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 398");
+
+  form.addScaleItem()
+    .setTitle("Question 399")
+    .setBounds(1, 2)
+    .setLabels("Low", "High")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 400")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setHelpText("Description of question 400")
+    .setRequired(true);
+
+  form.addTextItem()
+    .setTitle("Question 401")
+    .setHelpText("Description of question 401");
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 402")
+    .setRows(['Row 0', 'Row 1', 'Row 2', 'Row 3'])
+    .setColumns(['Column 0'])
+    .setHelpText("Description of question 402");
+
+  sections["Section 9"]
+    .setTitle("Section 9")
+    .setHelpText("About section 9");
+
+  form.moveItem(form.getItemById(sections["Section 9"].getId()), form.getItems().length - 1);
+
+  form.addTextItem()
+    .setTitle("Question 403");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 404")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 405")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setHelpText("Description of question 405");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 406")
+    .setRequired(true);
+
+  form.addDurationItem()
+    .setTitle("Question 407")
+    .setHelpText("Description of question 407");
+
+  sections["Section 57"]
+    .setTitle("Section 57")
+    .setHelpText("About section 57");
+
+  form.moveItem(form.getItemById(sections["Section 57"].getId()), form.getItems().length - 1);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 408")
+    .setHelpText("Description of question 408");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 409");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 52"])
+    ]);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 410");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 68"]),
+      item.createChoice("Go 1", sections["Section 67"]),
+      item.createChoice("Go 2", sections["Section 63"]),
+      item.createChoice("Go 3", sections["Section 13"])
+    ])
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 411")
+    .setChoiceValues(['Option 0'])
+    .setHelpText("Description of question 411")
+    .setRequired(true);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 412");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 57"]),
+      item.createChoice("Go 1", sections["Section 35"]),
+      item.createChoice("Go 2", sections["Section 52"]),
+      item.createChoice("Go 3", sections["Section 44"])
+    ])
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 413")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setHelpText("Description of question 413");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 414")
+    .setChoiceValues(['Option 0']);
+
+  form.addScaleItem()
+    .setTitle("Question 415")
+    .setBounds(0, 9)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 415");
+
+  form.addDateTimeItem()
+    .setTitle("Question 416");
+
+  form.addDateTimeItem()
+    .setTitle("Question 417")
+    .setHelpText("Description of question 417")
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 418")
+    .setHelpText("Description of question 418");
+
+  sections["Section 72"]
+    .setTitle("Section 72")
+    .setHelpText("About section 72");
+
+  form.moveItem(form.getItemById(sections["Section 72"].getId()), form.getItems().length - 1);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 419");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 43"]),
+      item.createChoice("Go 1", sections["Section 60"]),
+      item.createChoice("Go 2", sections["Section 38"]),
+      item.createChoice("Go 3", sections["Section 56"])
+    ]);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 420");
+
+  form.addDateTimeItem()
+    .setTitle("Question 421")
+    .setHelpText("Description of question 421");
+
+  sections["Section 73"]
+    .setTitle("Section 73")
+    .setHelpText("About section 73");
+
+  form.moveItem(form.getItemById(sections["Section 73"].getId()), form.getItems().length - 1);
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 422")
+    .setRows(['Row 0', 'Row 1'])
+    .setColumns(['Column 0', 'Column 1']);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 423")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 423")
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 424");
+
+  form.addDateTimeItem()
+    .setTitle("Question 425")
+    .setHelpText("Description of question 425")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 426")
+    .setChoiceValues(['Option 0'])
+    .setHelpText("Description of question 426");
+
+  form.addGridItem()
+    .setTitle("Question 427")
+    .setRows(['Row 0', 'Row 1'])
+    .setColumns(['Column 0', 'Column 1'])
+    .setHelpText("Description of question 427")
+    .setRequired(true);
+
+  form.addDurationItem()
+    .setTitle("Question 428");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 429")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4']);
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 430")
+    .setRows(['Row 0', 'Row 1', 'Row 2', 'Row 3'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2'])
+    .setHelpText("Description of question 430");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 431")
+    .setHelpText("Description of question 431");
+
+  form.addDateTimeItem()
+    .setTitle("Question 432")
+    .setHelpText("Description of question 432");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 433");
+
+  sections["Section 70"]
+    .setTitle("Section 70")
+    .setHelpText("About section 70");
+
+  form.moveItem(form.getItemById(sections["Section 70"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 434")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 434");
+
+  form.addDateTimeItem()
+    .setTitle("Question 435")
+    .setHelpText("Description of question 435");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 436")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5'])
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 437");
+
+  form.addDateTimeItem()
+    .setTitle("Question 438");
+
+  sections["Section 34"]
+    .setTitle("Section 34")
+    .setHelpText("About section 34");
+
+  form.moveItem(form.getItemById(sections["Section 34"].getId()), form.getItems().length - 1);
+
+  form.addDateTimeItem()
+    .setTitle("Question 439")
+    .setHelpText("Description of question 439");
+
+  form.addTextItem()
+    .setTitle("Question 440");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 441")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4']);
+
+  form.addDurationItem()
+    .setTitle("Question 442")
+    .setRequired(true);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 443");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 444")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5'])
+    .setHelpText("Description of question 444");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 445")
+    .setHelpText("Description of question 445");
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 446")
+    .setRows(['Row 0'])
+    .setColumns(['Column 0'])
+    .setRequired(true);
+
+  sections["Section 58"]
+    .setTitle("Section 58")
+    .setHelpText("About section 58");
+
+  form.moveItem(form.getItemById(sections["Section 58"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 447")
+    .setChoiceValues(['Option 0'])
+    .setHelpText("Description of question 447")
+    .setRequired(true);
+
+  form.addScaleItem()
+    .setTitle("Question 448")
+    .setBounds(0, 7)
+    .setLabels("Low", "High");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 449")
+    .setHelpText("Description of question 449");
+
+  sections["Section 32"]
+    .setTitle("Section 32")
+    .setHelpText("About section 32");
+
+  form.moveItem(form.getItemById(sections["Section 32"].getId()), form.getItems().length - 1);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 450");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 26"])
+    ]);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 451")
+    .setChoiceValues(['Option 0']);
+
+  form.addDateTimeItem()
+    .setTitle("Question 452")
+    .setHelpText("Description of question 452");
+
+  form.addDateTimeItem()
+    .setTitle("Question 453");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 454")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5'])
+    .setHelpText("Description of question 454");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 455")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setRequired(true);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 456");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 1"]),
+      item.createChoice("Go 1", sections["Section 6"]),
+      item.createChoice("Go 2", sections["Section 67"]),
+      item.createChoice("Go 3", sections["Section 8"])
+    ])
+    .setHelpText("Description of question 456");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 457")
+    .setChoiceValues(['Option 0', 'Option 1']);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 458")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2']);
+
+  sections["Section 12"]
+    .setTitle("Section 12")
+    .setHelpText("About section 12");
+
+  form.moveItem(form.getItemById(sections["Section 12"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 459")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2'])
+    .setHelpText("Description of question 459");
+
+  form.addTextItem()
+    .setTitle("Question 460")
+    .setHelpText("Description of question 460");
+
+  form.addScaleItem()
+    .setTitle("Question 461")
+    .setBounds(0, 3)
+    .setLabels("Low", "High");
+
+  sections["Section 67"]
+    .setTitle("Section 67")
+    .setHelpText("About section 67");
+
+  form.moveItem(form.getItemById(sections["Section 67"].getId()), form.getItems().length - 1);
+
+  form.addDateTimeItem()
+    .setTitle("Question 462");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 463")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5']);
+
+  form.addTextItem()
+    .setTitle("Question 464");
+
+  form.addDateTimeItem()
+    .setTitle("Question 465")
+    .setHelpText("Description of question 465")
+    .setRequired(true);
+
+  form.addTextItem()
+    .setTitle("Question 466");
+
+  form.addDateTimeItem()
+    .setTitle("Question 467")
+    .setHelpText("Description of question 467");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 468");
+
+  form.addTextItem()
+    .setTitle("Question 469");
+
+  sections["Section 36"]
+    .setTitle("Section 36")
+    .setHelpText("About section 36");
+
+  form.moveItem(form.getItemById(sections["Section 36"].getId()), form.getItems().length - 1);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 470")
+    .setRequired(true)
+    .setHelpText("Description of question 470");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 471")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 471");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 472")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2']);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 473")
+    .setRequired(true)
+    .setHelpText("Description of question 473");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 474")
+    .setHelpText("Description of question 474");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 475");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 476")
+    .setHelpText("Description of question 476");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 477")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3']);
+
+  form.addDurationItem()
+    .setTitle("Question 478");
+
+  form.addDurationItem()
+    .setTitle("Question 479");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 480")
+    .setHelpText("Description of question 480");
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 481")
+    .setRows(['Row 0', 'Row 1'])
+    .setColumns(['Column 0', 'Column 1'])
+    .setHelpText("Description of question 481");
+
+  sections["Section 17"]
+    .setTitle("Section 17")
+    .setHelpText("About section 17");
+
+  form.moveItem(form.getItemById(sections["Section 17"].getId()), form.getItems().length - 1);
+
+  form.addTextItem()
+    .setTitle("Question 482");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 483")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2']);
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 484")
+    .setRows(['Row 0'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2', 'Column 3'])
+    .setRequired(true);
+
+  form.addTextItem()
+    .setTitle("Question 485")
+    .setRequired(true)
+    .setHelpText("Description of question 485");
+
+  form.addGridItem()
+    .setTitle("Question 486")
+    .setRows(['Row 0', 'Row 1', 'Row 2'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2']);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 487")
+    .setChoiceValues(['Option 0'])
+    .setHelpText("Description of question 487");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 488")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setHelpText("Description of question 488")
+    .setRequired(true);
+
+  form.addCheckboxGridItem()
+    .setTitle("Question 489")
+    .setRows(['Row 0', 'Row 1', 'Row 2', 'Row 3'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2', 'Column 3'])
+    .setHelpText("Description of question 489");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 490")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2'])
+    .setRequired(true);
+
+  form.addDurationItem()
+    .setTitle("Question 491");
+
+  form.addScaleItem()
+    .setTitle("Question 492")
+    .setBounds(1, 5)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 492");
+
+  sections["Section 64"]
+    .setTitle("Section 64")
+    .setHelpText("About section 64");
+
+  form.moveItem(form.getItemById(sections["Section 64"].getId()), form.getItems().length - 1);
+
+  form.addDateTimeItem()
+    .setTitle("Question 493");
+
+  form.addTextItem()
+    .setTitle("Question 494");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 495");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 496");
+
+  sections["Section 27"]
+    .setTitle("Section 27")
+    .setHelpText("About section 27");
+
+  form.moveItem(form.getItemById(sections["Section 27"].getId()), form.getItems().length - 1);
+
+  form.addDurationItem()
+    .setTitle("Question 497")
+    .setRequired(true);
+
+  form.addScaleItem()
+    .setTitle("Question 498")
+    .setBounds(1, 4)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 498")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 499")
+    .setChoiceValues(['Option 0', 'Option 1'])
+    .setHelpText("Description of question 499");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 500")
+    .setChoiceValues(['Option 0', 'Option 1']);
+
+  form.addDateTimeItem()
+    .setTitle("Question 501")
+    .setHelpText("Description of question 501");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 502")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5']);
+
+  form.addGridItem()
+    .setTitle("Question 503")
+    .setRows(['Row 0'])
+    .setColumns(['Column 0', 'Column 1']);
+
+  sections["Section 45"]
+    .setTitle("Section 45")
+    .setHelpText("About section 45");
+
+  form.moveItem(form.getItemById(sections["Section 45"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 504")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3'])
+    .setHelpText("Description of question 504");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 505");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 58"]),
+      item.createChoice("Go 1", sections["Section 40"])
+    ]);
+
+  form.addDateTimeItem()
+    .setTitle("Question 506")
+    .setHelpText("Description of question 506");
+
+  form.addTextItem()
+    .setTitle("Question 507")
+    .setRequired(true)
+    .setHelpText("Description of question 507");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 508")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3'])
+    .setHelpText("Description of question 508")
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 509")
+    .setRequired(true);
+
+  form.addScaleItem()
+    .setTitle("Question 510")
+    .setBounds(0, 8)
+    .setLabels("Low", "High");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 511");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 8"]),
+      item.createChoice("Go 1", sections["Section 33"])
+    ])
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 512")
+    .setHelpText("Description of question 512");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 513")
+    .setHelpText("Description of question 513");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 514")
+    .setHelpText("Description of question 514");
+
+  form.addDateTimeItem()
+    .setTitle("Question 515");
+
+  sections["Section 61"]
+    .setTitle("Section 61")
+    .setHelpText("About section 61");
+
+  form.moveItem(form.getItemById(sections["Section 61"].getId()), form.getItems().length - 1);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 516");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 517")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setRequired(true);
+
+  form.addScaleItem()
+    .setTitle("Question 518")
+    .setBounds(0, 2)
+    .setLabels("Low", "High");
+
+  form.addDurationItem()
+    .setTitle("Question 519")
+    .setHelpText("Description of question 519")
+    .setRequired(true);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 520");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 27"]),
+      item.createChoice("Go 1", sections["Section 62"])
+    ])
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 521")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4'])
+    .setRequired(true);
+
+  form.addDurationItem()
+    .setTitle("Question 522")
+    .setHelpText("Description of question 522")
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 523");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 524");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 25"])
+    ]);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 525");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 18"])
+    ]);
+
+  form.addDurationItem()
+    .setTitle("Question 526")
+    .setHelpText("Description of question 526")
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 527");
+
+  sections["Section 38"]
+    .setTitle("Section 38")
+    .setHelpText("About section 38");
+
+  form.moveItem(form.getItemById(sections["Section 38"].getId()), form.getItems().length - 1);
+
+  form.addDurationItem()
+    .setTitle("Question 528")
+    .setHelpText("Description of question 528")
+    .setRequired(true);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 529");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 62"])
+    ])
+    .setHelpText("Description of question 529");
+
+  form.addDateTimeItem()
+    .setTitle("Question 530")
+    .setRequired(true);
+
+  form.addDateTimeItem()
+    .setTitle("Question 531")
+    .setHelpText("Description of question 531")
+    .setRequired(true);
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 532");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 66"]),
+      item.createChoice("Go 1", sections["Section 54"]),
+      item.createChoice("Go 2", sections["Section 48"])
+    ]);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 533")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2'])
+    .setHelpText("Description of question 533");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 534");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 44"]),
+      item.createChoice("Go 1", sections["Section 19"]),
+      item.createChoice("Go 2", sections["Section 74"]),
+      item.createChoice("Go 3", sections["Section 19"])
+    ])
+    .setHelpText("Description of question 534");
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 535")
+    .setHelpText("Description of question 535");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 536")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3'])
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 537")
+    .setChoiceValues(['Option 0']);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 538")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5'])
+    .setHelpText("Description of question 538")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 539")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3']);
+
+  sections["Section 51"]
+    .setTitle("Section 51")
+    .setHelpText("About section 51");
+
+  form.moveItem(form.getItemById(sections["Section 51"].getId()), form.getItems().length - 1);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 540")
+    .setHelpText("Description of question 540");
+
+  form.addScaleItem()
+    .setTitle("Question 541")
+    .setBounds(1, 6)
+    .setLabels("Low", "High");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 542")
+    .setChoiceValues(['Option 0', 'Option 1']);
+
+  form.addDurationItem()
+    .setTitle("Question 543");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 544")
+    .setChoiceValues(['Option 0', 'Option 1']);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 545")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5'])
+    .setRequired(true);
+
+  sections["Section 62"]
+    .setTitle("Section 62")
+    .setHelpText("About section 62");
+
+  form.moveItem(form.getItemById(sections["Section 62"].getId()), form.getItems().length - 1);
+
+  form.addDurationItem()
+    .setTitle("Question 546");
+
+  form.addDurationItem()
+    .setTitle("Question 547")
+    .setHelpText("Description of question 547")
+    .setRequired(true);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 548");
+
+  form.addScaleItem()
+    .setTitle("Question 549")
+    .setBounds(0, 7)
+    .setLabels("Low", "High")
+    .setRequired(true);
+
+  form.addParagraphTextItem()
+    .setTitle("Question 550");
+
+  sections["Section 65"]
+    .setTitle("Section 65")
+    .setHelpText("About section 65");
+
+  form.moveItem(form.getItemById(sections["Section 65"].getId()), form.getItems().length - 1);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 551")
+    .setHelpText("Description of question 551");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 552");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 40"]),
+      item.createChoice("Go 1", sections["Section 1"]),
+      item.createChoice("Go 2", sections["Section 32"]),
+      item.createChoice("Go 3", sections["Section 53"])
+    ])
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 553")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5']);
+
+  form.addDateTimeItem()
+    .setTitle("Question 554");
+
+  form.addDateTimeItem()
+    .setTitle("Question 555")
+    .setHelpText("Description of question 555")
+    .setRequired(true);
+
+  form.addGridItem()
+    .setTitle("Question 556")
+    .setRows(['Row 0', 'Row 1', 'Row 2'])
+    .setColumns(['Column 0', 'Column 1', 'Column 2', 'Column 3'])
+    .setHelpText("Description of question 556");
+
+  sections["Section 33"]
+    .setTitle("Section 33")
+    .setHelpText("About section 33");
+
+  form.moveItem(form.getItemById(sections["Section 33"].getId()), form.getItems().length - 1);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 557")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5']);
+
+  form.addDurationItem()
+    .setTitle("Question 558")
+    .setHelpText("Description of question 558");
+
+  form.addDateTimeItem()
+    .setTitle("Question 559");
+
+  sections["Section 5"]
+    .setTitle("Section 5")
+    .setHelpText("About section 5");
+
+  form.moveItem(form.getItemById(sections["Section 5"].getId()), form.getItems().length - 1);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 560");
+
+  form.addScaleItem()
+    .setTitle("Question 561")
+    .setBounds(1, 8)
+    .setLabels("Low", "High")
+    .setHelpText("Description of question 561")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 562")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5'])
+    .setHelpText("Description of question 562")
+    .setRequired(true);
+
+  sections["Section 53"]
+    .setTitle("Section 53")
+    .setHelpText("About section 53");
+
+  form.moveItem(form.getItemById(sections["Section 53"].getId()), form.getItems().length - 1);
+
+  form.addSectionHeaderItem()
+    .setTitle("Question 563")
+    .setHelpText("Description of question 563");
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 564")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3'])
+    .setHelpText("Description of question 564");
+
+  var item = form.addMultipleChoiceItem()
+    .setTitle("Question 565");
+
+  item.setChoices([
+      item.createChoice("Go 0", sections["Section 52"]),
+      item.createChoice("Go 1", sections["Section 16"]),
+      item.createChoice("Go 2", sections["Section 15"])
+    ]);
+
+  sections["Section 49"]
+    .setTitle("Section 49")
+    .setHelpText("About section 49");
+
+  form.moveItem(form.getItemById(sections["Section 49"].getId()), form.getItems().length - 1);
+
+  form.addScaleItem()
+    .setTitle("Question 566")
+    .setBounds(1, 4)
+    .setLabels("Low", "High");
+
+  form.addParagraphTextItem()
+    .setTitle("Question 567")
+    .setHelpText("Description of question 567");
+
+  form.addDateTimeItem()
+    .setTitle("Question 568");
+
+  form.addDateTimeItem()
+    .setTitle("Question 569")
+    .setRequired(true);
+
+  form.addMultipleChoiceItem()
+    .setTitle("Question 570")
+    .setChoiceValues(['Option 0', 'Option 1', 'Option 2', 'Option 3'])
+    .setRequired(true);
+
+  form.addDurationItem()
+    .setTitle("Question 571")
+    .setRequired(true);
+}
\ No newline at end of file
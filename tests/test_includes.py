@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import pytest
+
+from google_forms import create_google_apps_script, parse_markdown
+
+# included fragments must convert as if their lines were in place of the include
+# line, both the first time and when their parsed nodes come from the cache
+
+
+def _inline(document: str, include_dir: Path) -> str:
+    lines = []
+    for line in document.split('\n'):
+        if line.startswith('<!-- include:'):
+            lines.extend((include_dir / line[13:-3].strip()).read_text().split('\n'))
+        else:
+            lines.append(line)
+
+    return '\n'.join(lines)
+
+
+@pytest.mark.parametrize('fragment, document', [
+    # the fragment has the main title and sets the message after its form node
+    ('### Q0\n`x`\n# Form\n### Q1\n`y`\n_thanks_', '<!-- include: fragment.md -->'),
+    ('### Q0\n`x`\n# Form\n### Q1\n`y`\n_thanks_', '_host_\n<!-- include: fragment.md -->'),
+    # before its form node
+    ('### Q0\n`x`\n# Form\n_thanks_\n### Q1\n`y`', '_host_\n<!-- include: fragment.md -->'),
+    # the form node is created by the document, after the fragment
+    ('### Q0\n`x`\n# Form', '_host_\n<!-- include: fragment.md -->\n### Q1\n`y`'),
+    ('### Q0\n`x`\n# Form\n_thanks_', '_host_\n<!-- include: fragment.md -->\n### Q1\n`y`'),
+    # the document has the main title and the fragment does not
+    ('### Q0\n`x`\n### Q1\n_thanks_', '# Form\n_host_\n### Q\n<!-- include: fragment.md -->'),
+])
+def test_confirmation_message_of_included_form(tmp_path: Path, fragment: str, document: str):
+    (tmp_path / 'fragment.md').write_text(fragment)
+    inline = _inline(document, tmp_path)
+
+    expected = create_google_apps_script(inline)
+    # the second conversion finds the rest of the fragment in the cache
+    for _ in range(2):
+        assert create_google_apps_script(document, include_dir=tmp_path) == expected
+        assert parse_markdown(document.split('\n'), tmp_path) == parse_markdown(inline.split('\n'))
+
+
+def test_cached_fragment_is_shared_by_different_messages(tmp_path: Path):
+    (tmp_path / 'fragment.md').write_text('### Q0\n`x`\n### Q1\n* a\n* b\n')
+    for message in ('one', 'two', 'three'):
+        document = f'# Form\n_{message}_\n### Q\n<!-- include: fragment.md -->'
+        assert (create_google_apps_script(document, include_dir=tmp_path) ==
+                create_google_apps_script(_inline(document, tmp_path)))
@@ -0,0 +1,155 @@
+import itertools
+import random
+import shutil
+from functools import cache
+
+import pytest
+
+from google_forms import Item, PageBreak, create_google_apps_script, parse_markdown
+from script_profiler import run_script
+from update import form_manifest, generate_update_script
+
+# the positions the scripts move sections from and to are computed without
+# searching the form (a fenwick tree in FormLayout for created forms, and in
+# _moves for updates). these run the scripts against the FormApp stand-in and
+# compare the forms they leave with a naive simulation of the markdown
+
+pytestmark = pytest.mark.skipif(shutil.which('node') is None, reason='node is needed to run the scripts')
+
+# runs createForm until it finishes. the trigger is created first, so that it runs
+# again when an execution is killed before it ends. createForm keeps its state in
+# the script properties until the form is done, so a finished form is told apart
+# from one that was never started by a property set before it starts
+_resume = '''
+function entry() {
+  var properties = PropertiesService.getScriptProperties();
+  if (properties.getProperty("started") && !properties.getProperty("createFormState")) return;
+  ScriptApp.newTrigger("entry").timeBased().after(1).create();
+  properties.setProperty("started", "1");
+  createForm();
+}'''
+
+
+def _document(rng: random.Random) -> str:
+    # sections are declared in one order and written in another, some titles of
+    # sections and items are repeated and some sections are written several times
+    titles = [f'S{i}' for i in range(rng.randint(1, 7))]
+    declared = titles + [rng.choice(titles) for _ in range(rng.randint(0, 2))]
+    rng.shuffle(declared)
+
+    def items() -> list[str]:
+        lines = []
+        for _ in range(rng.randint(0, 3)):
+            kind = rng.random()
+            if kind < 0.4:
+                lines.extend([f'### Q{rng.randint(0, 20)}', '`x`'])
+            elif kind < 0.7:
+                lines.extend([f'### N{rng.randint(0, 20)}', *[f'* o{c} [{rng.choice(titles)}]' for c in range(2)]])
+            else:
+                lines.extend([f'### C{rng.randint(0, 20)}', '- [ ] a', '- [ ] b'])
+
+        return lines
+
+    lines = ['# Form', '', *[f'- {title}' for title in declared], '', *items()]
+    written = titles + [rng.choice(titles) for _ in range(rng.randint(0, len(titles)))]
+    rng.shuffle(written)
+    for title in written:
+        lines.extend(['', f'## {title}', f'about {title}', *items()])
+
+    return '\n'.join(lines)
+
+
+def _moves_document(sections: int, written: tuple[int, ...]) -> str:
+    # a form whose sections are written in the given order, with one item each
+    titles = [f'S{i}' for i in range(sections)]
+    return '\n'.join(['# Form', *[f'- {title}' for title in titles],
+                      *[f'## {titles[i]}\n### Q{i}\n`x`' for i in written]])
+
+
+def _simulated_items(markdown: str) -> list[tuple[str, str]]:
+    # (kind, title) of the items of the form, moving each section to the end by
+    # searching the list as the scripts did before
+    items = []
+    page_breaks = {}
+    for node in parse_markdown(markdown.split('\n')).nodes:
+        if isinstance(node, Item):
+            items.append(['item', node.title])
+        elif isinstance(node, PageBreak):
+            page_breaks[node.title] = ['section', node.title]
+            items.append(page_breaks[node.title])
+        elif node.move_to_end:
+            # sections with the same title are told apart by identity
+            page_break = page_breaks[node.title]
+            items.append(items.pop(next(i for i, item in enumerate(items) if item is page_break)))
+
+    return [tuple(item) for item in items]
+
+
+def _items(form: dict) -> list[tuple[str, str]]:
+    return [('section' if item['type'] == 'PageBreakItem' else 'item', item['title']) for item in form['items']]
+
+
+def _created_items(markdowns: list[str], **options) -> list[list[tuple[str, str]]]:
+    # runs the scripts of all the markdowns in a single execution, each in its own
+    # scope so their names do not clash, and returns the items of their forms
+    code = [f'var createForm{i} = (function () {{\n{create_google_apps_script(markdown, **options)}\n'
+            f'return createForm;\n}})();\n' for i, markdown in enumerate(markdowns)]
+    code.append('function createForms() {\n' + ''.join(f'  createForm{i}();\n' for i in range(len(markdowns))) + '}')
+    run = run_script(''.join(code), entry_point='createForms', execution_limit=1e12)
+    assert run['executions'][0]['error'] is None
+    return [_items(form) for form in run['forms']]
+
+
+@pytest.mark.parametrize('options', [{}, {'compact': True}, {'share_choices': True}])
+def test_created_forms_have_the_simulated_order(options: dict):
+    markdowns = [_document(random.Random(seed)) for seed in range(200)]
+    for markdown, items in zip(markdowns, _created_items(markdowns, **options)):
+        assert items == _simulated_items(markdown), markdown
+
+
+def test_every_order_of_moves_is_simulated():
+    # every way of writing three sections up to seven times, so sections are moved
+    # out of order, moved again right after they were moved and moved again later
+    markdowns = [_moves_document(3, written) for length in range(1, 8)
+                 for written in itertools.product(range(3), repeat=length)]
+    for markdown, items in zip(markdowns, _created_items(markdowns)):
+        assert items == _simulated_items(markdown), markdown
+
+
+@cache
+def _resumed_run(seed: int) -> tuple[str, dict]:
+    rng = random.Random(seed)
+    markdown = _document(rng)
+    script = create_google_apps_script(markdown, chunk_size=rng.randint(1, 3))
+    # executions short enough to be killed at any call of a chunk, but long enough
+    # to undo the chunk that was killed and then finish one
+    run = run_script(script + _resume, entry_point='entry', execution_limit=rng.choice((8000, 9000, 10000)),
+                     max_executions=300)
+    return markdown, run
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_killed_executions_resume_to_the_simulated_order(seed: int):
+    markdown, run = _resumed_run(seed)
+    assert run['executions'][-1]['error'] is None
+    assert _items(run['forms'][-1]) == _simulated_items(markdown), markdown
+
+
+def test_killed_executions_are_resumed():
+    # the documents above must really be killed in the middle of chunks
+    killed = [any(execution['error'] is not None for execution in _resumed_run(seed)[1]['executions'])
+              for seed in range(40)]
+    assert sum(killed) >= 20
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_updated_form_has_the_simulated_order(seed: int):
+    rng = random.Random(seed)
+    old, new = _document(rng), _document(rng)
+    manifest = form_manifest(parse_markdown(old.split('\n')))
+    # the stand-in gives the first form it creates this id
+    update = generate_update_script(parse_markdown(new.split('\n')), manifest, 'form1')
+    entry = 'function entry() {\n  createForm();\n  updateForm();\n}'
+    run = run_script(f'{create_google_apps_script(old)}\n{update}\n{entry}', entry_point='entry')
+    assert run['executions'][0]['error'] is None
+    assert _items(run['forms'][0]) == _simulated_items(new), (old, new)
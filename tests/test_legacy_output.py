@@ -0,0 +1,67 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from google_forms import create_google_apps_script
+
+# scripts frozen from the converter before it was optimized (the chain of line
+# regexes at the baseline commit). generated.md is a form of about 3000 lines
+# with every kind of item, sections written out of the order they are declared
+# in and a section declared twice. the scripts must stay the same except for the
+# intended changes listed below, which the documents either avoid or which are
+# undone before comparing:
+# - sections are moved by index instead of looking each one up by id (user-011),
+#   rewritten by _index_moves
+# - scale bounds keep every digit instead of the last one (user-004), so the
+#   documents only use one digit bounds
+# - lists where only some of the choices navigate create plain choices with
+#   createChoice (user-012), so no list of the documents mixes them
+
+_data = Path(__file__).parent / 'data'
+_root = Path(__file__).parent.parent
+
+_added_item = re.compile(r'(?:var (?:item|section) = )?form\.add\w+Item\(\)')
+_named_section = re.compile(r'sections\[("(?:[^"\\]|\\.)*")\] = section;')
+_legacy_move = re.compile(r'form\.moveItem\(form\.getItemById\(sections\[("(?:[^"\\]|\\.)*")\]\.getId\(\)\), '
+                          r'form\.getItems\(\)\.length - 1\);')
+
+
+def _index_moves(script: str) -> str:
+    # follows the items the legacy script adds to rewrite each move of a section
+    # to the end of the form into a move from its index
+    items = []
+    sections = {}
+    lines = []
+    for line in script.split('\n'):
+        statement = line.strip()
+        if _added_item.fullmatch(statement):
+            items.append(object())
+        elif match := _named_section.fullmatch(statement):
+            sections[match[1]] = items[-1]
+        elif match := _legacy_move.fullmatch(statement):
+            index = items.index(sections[match[1]])
+            items.append(items.pop(index))
+            line = f'{line[:len(line) - len(statement)]}form.moveItem({index}, {len(items) - 1});'
+
+        lines.append(line)
+
+    return '\n'.join(lines)
+
+
+@pytest.mark.parametrize('markdown, script', [
+    (_root / 'sample.md', _data / 'sample.gs'),
+    (_data / 'generated.md', _data / 'generated.gs'),
+])
+def test_script_is_the_same_as_before_the_optimizations(markdown: Path, script: Path):
+    expected = _index_moves(script.read_text())
+    assert create_google_apps_script(markdown.read_text()) == expected
+
+
+def test_sections_are_moved_out_of_order():
+    # the rewrite must not hide that the frozen document moves sections from
+    # every part of the form
+    script = _index_moves((_data / 'generated.gs').read_text())
+    moves = re.findall(r'form\.moveItem\((\d+), (\d+)\);', script)
+    assert len(moves) == 80
+    assert len({source for source, _ in moves}) > 10
@@ -0,0 +1,100 @@
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+import google_forms
+from google_forms import classify_line, _line_patterns, create_google_apps_script
+
+# equivalence corpus for the combined line regex. it replaced a chain of matches,
+# one regex per kind tried in order, and must classify every line and produce
+# every script exactly as that chain did
+
+_sample = (Path(__file__).parent.parent / 'sample.md').read_text()
+
+# lines near the edges of the patterns, where the precedence order decides
+_edge_lines = [
+    '# Title', '#Title two', '#', '##', '###', '####', '#####', '##  ', '# # #', '#\ttab',
+    '## Section A', '## Section B', '### Q', '### **Req Q**', '### **', '### ****', '### **a** b',
+    '#### Rows', '#### Columns', '#### [] Rows', '#### [ ] columns', '####[ ] rows', '#### [] ', '####[]x',
+    '_thanks_', '_', '__', '_a_b_', '_ spaced _', '_not closed',
+    '`short`', '`', '``', '`a`b`', '```', '``````', '```long```', '``` a ` b ```', '```\t```', '````x````',
+    '- opt', '* opt', '-', '*', '-opt', '*opt', '- - x', '* * x', '**bold**', '*italic*', '  * indented',
+    '- [ ] chk', '[] chk', '[ ] chk', '* [ ] c', '-[] c', '*\t[ ]\tc', '[]chk', '[ ]', '[] ', '- []',
+    '- go [Section A]', '* go [Section B]', '[ ] go [Section A]', '- go []', '- [Section A]', 'a [b] [c]',
+    'Low 1 --- 5 High', 'Low 10 --- 5 High', 'Low 0 --- 10 High', '1 --- 5', 'a 1 --- 5 b c', 'a 1 ---  5 b',
+    'x 1 --- 2 y 3 --- 4 z', 'Low a --- 5 High',
+    'dd/mm/yyyy', 'hh:mm', 'dd/mm/yyyy hh:mm', 'hh:mm:ss', 'dd', 'hh', '12/mm', '12/yyyy', '2024', '12',
+    '12:mm', '12:ss', '12:mm:ss', '1234 hh', 'ddd', 'hhh', 'x12/mm', 'x12', '2024 text', 'some 12:mm',
+    'some description', "it's here", 'ação 😀', '"quoted"', 'back\\slash',
+]
+
+# pieces the generated lines are made of, so they hit several patterns at once
+_tokens = ['#', '##', '-', '*', '[', ']', '[ ]', ' ', '\t', '_', '`', '```', '**', 'dd', 'hh', '/mm', '/yyyy',
+           ':mm', ':ss', '12', '2024', '7', ' --- ', ' 1 --- 5 ', ' 10 --- 2 ', 'Low', 'High', 'text', 'ç']
+
+
+# the patterns compiled on their own, as the chain had them
+_legacy_patterns = [(kind, re.compile(pattern)) for kind, pattern in _line_patterns]
+
+
+def _legacy_classify_line(line: str) -> tuple[str | None, tuple[str | None, ...]]:
+    # the chain the combined regex replaced: the first pattern that matches on its
+    # own gives the kind of the line, and its groups
+    for kind, pattern in _legacy_patterns:
+        match = pattern.match(line)
+        if match is not None:
+            return kind, match.groups()
+
+    return None, ()
+
+
+def _generated_lines(rng: random.Random, count: int) -> list[str]:
+    lines = []
+    while len(lines) < count:
+        # lines are stripped before being classified
+        line = ''.join(rng.choice(_tokens) for _ in range(rng.randint(1, 8))).strip()
+        if len(line) > 0:
+            lines.append(line)
+
+    return lines
+
+
+def _generated_documents(seed: int, count: int) -> list[str]:
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        pool = _edge_lines + _generated_lines(rng, 10) + ['', '   ']
+        documents.append('\n'.join(rng.choice(pool) for _ in range(rng.randint(1, 60))))
+
+    return documents
+
+
+def _script(markdown: str, options: dict) -> str:
+    try:
+        return create_google_apps_script(markdown, **options)
+    except Exception as e:
+        return f'{type(e).__name__}: {e}'
+
+
+@pytest.mark.parametrize('line', [*_sample.split('\n'), *_edge_lines])
+def test_edge_lines_are_classified_as_by_the_chain(line: str):
+    line = line.strip()
+    if len(line) > 0:
+        assert classify_line(line) == _legacy_classify_line(line)
+
+
+def test_generated_lines_are_classified_as_by_the_chain():
+    for line in _generated_lines(random.Random(0), 20000):
+        assert classify_line(line) == _legacy_classify_line(line), line
+
+
+@pytest.mark.parametrize('options', [{}, {'compact': True}, {'share_choices': True}, {'chunk_size': 2}])
+def test_scripts_are_the_same_as_with_the_chain(monkeypatch: pytest.MonkeyPatch, options: dict):
+    documents = [_sample, *_generated_documents(1, 300)]
+    scripts = [_script(document, options) for document in documents]
+
+    monkeypatch.setattr(google_forms, 'classify_line', _legacy_classify_line)
+    for document, script in zip(documents, scripts):
+        assert _script(document, options) == script, document
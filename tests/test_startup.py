@@ -0,0 +1,25 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from benchmark import _import_times, _startup_budget_ms
+
+# importing the converter is most of the cold start of short lived processes
+# converting a single file, so it must stay within the budget of benchmark.py
+# startup. the best of a few runs is kept, since a single one is noisy
+
+
+@pytest.mark.parametrize('module', ['google_forms', 'main'])
+def test_import_is_within_the_startup_budget(module: str):
+    elapsed = min(_import_times(module)[module][1] for _ in range(5)) / 1e3
+    assert elapsed <= _startup_budget_ms, f'importing {module} took {elapsed:.1f}ms'
+
+
+def test_web_app_imports_optional_modules_on_first_use():
+    pytest.importorskip('flask')
+    result = subprocess.run([sys.executable, '-c', 'import sys, main_flask; '
+                             'print(*sorted({"brotli", "incremental", "validate"} & sys.modules.keys()))'],
+                            capture_output=True, text=True, check=True, cwd=Path(__file__).parent.parent)
+    assert result.stdout.split() == []
@@ -0,0 +1,330 @@
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import asdict
+
+from google_forms import (Choice, Form, Item, ItemKind, Section, Style, compact_style, create_choice, create_item,
+                          form_items, item_templates, join_lines, normal_style)
+
+
+# version of the manifest format, stored in the manifests to detect old ones
+MANIFEST_VERSION = 1
+
+# a page break of the form together with the description its section sets
+_PAGE_BREAK = 'page_break'
+
+
+def form_manifest(form: Form) -> dict:
+    # snapshot of the form created by the script of form, which generate_update_script
+    # compares with a newer version of the markdown. the ids of the items are only
+    # known once the script runs, so they are identified by their position
+    items = []
+    for item in form_items(form):
+        if isinstance(item, Section):
+            items.append({'kind': _PAGE_BREAK, 'title': item.title, 'description': item.description})
+        else:
+            items.append(asdict(item))
+
+    return {
+        'version': MANIFEST_VERSION,
+        'form': {'title': form.title, 'description': form.description,
+                 'confirmation_message': form.confirmation_message},
+        'items': items,
+    }
+
+
+def _manifest_items(manifest: dict) -> list[Item | Section]:
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f'Unsupported manifest version {manifest.get("version")}, expected {MANIFEST_VERSION}')
+
+    items = []
+    for item in manifest['items']:
+        if item['kind'] == _PAGE_BREAK:
+            items.append(Section(item['title'], item['description']))
+        else:
+            items.append(Item(**{**item, 'kind': ItemKind(item['kind']),
+                                 'choices': [Choice(**choice) for choice in item['choices']]}))
+
+    return items
+
+
+def _kind(item: Item | Section) -> str:
+    return _PAGE_BREAK if isinstance(item, Section) else item.kind.value
+
+
+def _match(old_items: list[Item | Section], new_items: list[Item | Section]) -> dict[int, int]:
+    # index of each new item that is an old item, to the index of the old item.
+    # items are the same when they have the same kind and title, and the same order
+    # among the items with that kind and title. an item whose title changed is the
+    # one of the same kind right after the old item matched by the one before it
+    occurrences = Counter()
+    old_indices = {}
+    for i, item in enumerate(old_items):
+        occurrences[_kind(item), item.title] += 1
+        old_indices[_kind(item), item.title, occurrences[_kind(item), item.title]] = i
+
+    occurrences = Counter()
+    matches = {}
+    for i, item in enumerate(new_items):
+        occurrences[_kind(item), item.title] += 1
+        old_index = old_indices.get((_kind(item), item.title, occurrences[_kind(item), item.title]))
+        if old_index is not None:
+            matches[i] = old_index
+
+    matched = set(matches.values())
+    for i, item in enumerate(new_items):
+        if i in matches or (i > 0 and i - 1 not in matches):
+            continue
+
+        old_index = matches[i - 1] + 1 if i > 0 else 0
+        if old_index < len(old_items) and old_index not in matched and _kind(old_items[old_index]) == _kind(item):
+            matches[i] = old_index
+            matched.add(old_index)
+
+    return matches
+
+
+def _item_calls(item: Item) -> dict[str, str]:
+    # the calls setting every property of an item, except navigating choices
+    template = item_templates[item.kind]
+    calls = {'setTitle': f'setTitle("{item.title}")'}
+    for call in template.calls:
+        calls[call[:call.index('(')]] = call.format(choices=[c.value for c in item.choices], rows=item.rows,
+                                                    columns=item.columns, min_value=item.min_value,
+                                                    max_value=item.max_value, min_label=item.min_label,
+                                                    max_label=item.max_label)
+
+    calls['setHelpText'] = f'setHelpText("{item.description}")'
+    if template.can_be_required:
+        calls['setRequired'] = f'setRequired({"true" if item.required else "false"})'
+
+    return calls
+
+
+def _navigates(item: Item) -> bool:
+    return any(c.section is not None for c in item.choices)
+
+
+def _edit_item(old: Item, new: Item, index: int, style: Style) -> str:
+    # the calls changing what differs between the old and new versions of an item
+    target = f'items[{index}].as{item_templates[new.kind].method.removeprefix("add")}()'
+    old_calls = _item_calls(old)
+    new_calls = _item_calls(new)
+    # choices navigating to sections are created by the item, not set as values
+    navigation = old.choices != new.choices and _navigates(new)
+
+    calls = []
+    for name, call in new_calls.items():
+        if name == 'setChoiceValues':
+            # the values may be the same while the sections they navigate to are not
+            if old.choices != new.choices and not navigation:
+                calls.append(call)
+
+        elif call != old_calls[name]:
+            calls.append(call)
+
+    if not navigation and len(calls) == 0:
+        return ''
+
+    if navigation:
+        lines = [f'var {style.item}{style.equals}{target};\n', f'{style.item}.setChoices([']
+        for choice in new.choices:
+            lines.append(f'    {create_choice(choice, style)},')
+
+        lines[-1] = lines[-1][:-1]
+        lines.append('  ])')
+
+    else:
+        lines = [target]
+
+    lines.extend(f'  .{call}' for call in calls)
+    lines[-1] += ';\n'
+
+    return join_lines(lines, style)
+
+
+def _moves(current: list, target: list) -> list[tuple[int, int]]:
+    # the fewest (from, to) moves turning current into target, which have the same
+    # elements. the longest run of elements already in the right order stays, and
+    # every other element is moved right after the one preceding it in target
+    positions = {key: i for i, key in enumerate(target)}
+    order = [positions[key] for key in current]
+
+    # longest increasing subsequence of order, in n log n
+    tails = []
+    tail_indices = []
+    previous = [-1] * len(order)
+    for i, position in enumerate(order):
+        low = bisect_left(tails, position)
+        previous[i] = tail_indices[low - 1] if low > 0 else -1
+        if low == len(tails):
+            tails.append(position)
+            tail_indices.append(i)
+        else:
+            tails[low] = position
+            tail_indices[low] = i
+
+    staying = set()
+    i = tail_indices[-1] if len(tail_indices) > 0 else -1
+    while i != -1:
+        staying.add(current[i])
+        i = previous[i]
+
+    # the elements are sorted by keys that follow the moves: every element starts
+    # at (its index in current, -1), and one moved right after target[i - 1] goes
+    # to (index in current of the last staying element before it in target, i), or
+    # (-1, i) if there is none. so the index of an element is the number of keys
+    # before its own, counted with a fenwick tree over all the keys
+    keys = {key: (i, -1) for i, key in enumerate(current)}
+    moved_keys = {}
+    anchor = -1
+    for i, key in enumerate(target):
+        if key in staying:
+            anchor = keys[key][0]
+        else:
+            moved_keys[key] = (anchor, i)
+
+    ranks = {key: rank for rank, key in enumerate(sorted([*keys.values(), *moved_keys.values()]), 1)}
+    tree = [0] * (len(ranks) + 1)
+
+    def add(rank: int, delta: int) -> None:
+        while rank < len(tree):
+            tree[rank] += delta
+            rank += rank & -rank
+
+    def count_before(rank: int) -> int:
+        count = 0
+        rank -= 1
+        while rank > 0:
+            count += tree[rank]
+            rank &= rank - 1
+
+        return count
+
+    for key in keys.values():
+        add(ranks[key], 1)
+
+    moves = []
+    for key in target:
+        if key in staying:
+            continue
+
+        from_rank = ranks[keys[key]]
+        from_index = count_before(from_rank)
+        add(from_rank, -1)
+        to_rank = ranks[moved_keys[key]]
+        moves.append((from_index, count_before(to_rank)))
+        add(to_rank, 1)
+
+    return moves
+
+
+def generate_update_script(form: Form, manifest: dict, form_id: str, compact: bool = False) -> str:
+    # generates an updateForm function that turns the form with id form_id, created
+    # or last updated by a script whose manifest is given, into the one described by
+    # form. only the items that changed are added, edited, moved or deleted, so the
+    # responses already collected are kept. the form must not have been changed by
+    # hand since, as the items are found by their positions
+    style = compact_style if compact else normal_style
+    old_items = _manifest_items(manifest)
+    new_items = form_items(form)
+    matches = _match(old_items, new_items)
+
+    old_form = manifest['form']
+    calls = []
+    if form.title is not None and form.title != old_form['title']:
+        calls.append(f'  .setTitle("{form.title}")')
+
+    if form.description != old_form['description']:
+        calls.append(f'  .setDescription("{form.description}")')
+
+    if form.confirmation_message != old_form['confirmation_message']:
+        calls.append(f'  .setConfirmationMessage("{form.confirmation_message}")')
+
+    fragments = []
+    if len(calls) > 0:
+        calls[-1] += ';\n'
+        fragments.append(join_lines([style.form, *calls], style))
+
+    # the items are fetched once, so deleting some does not change which item each
+    # index refers to
+    matched = set(matches.values())
+    deleted = [i for i in range(len(old_items)) if i not in matched]
+    for i in deleted:
+        fragments.append(join_lines([f'{style.form}.deleteItem(items[{i}]);\n'], style))
+
+    # sections are created and edited before any item can navigate to them
+    created = []
+    created_sections = set()
+    section_edits = []
+    for i, item in enumerate(new_items):
+        if not isinstance(item, Section):
+            continue
+
+        if i in matches:
+            old = old_items[matches[i]]
+            calls = [f'  .setTitle("{item.title}")'] if item.title != old.title else []
+            if item.description != old.description:
+                calls.append(f'  .setHelpText("{item.description}")')
+
+            if len(calls) > 0:
+                calls[-1] += ';\n'
+                section_edits.append(join_lines([f'items[{matches[i]}].asPageBreakItem()', *calls], style))
+
+        else:
+            lines = [f'var {style.section}{style.equals}{style.form}.addPageBreakItem()',
+                     f'  .setTitle("{item.title}")']
+            if len(item.description) > 0:
+                lines.append(f'  .setHelpText("{item.description}")')
+
+            lines[-1] += ';\n'
+            lines.append(f'{style.sections}["{item.title}"]{style.equals}{style.section};\n')
+            fragments.append(join_lines(lines, style))
+            created.append(i)
+            created_sections.add(item.title)
+
+    fragments.extend(section_edits)
+
+    item_edits = []
+    navigated = set()
+    for i, item in enumerate(new_items):
+        if isinstance(item, Item) and i in matches:
+            old = old_items[matches[i]]
+            edit = _edit_item(old, item, matches[i], style)
+            if len(edit) > 0:
+                item_edits.append(edit)
+                if old.choices != item.choices:
+                    navigated.update(c.section for c in item.choices if c.section is not None)
+
+    additions = []
+    for i, item in enumerate(new_items):
+        if isinstance(item, Item) and i not in matches:
+            additions.append(create_item(item, style))
+            created.append(i)
+            navigated.update(c.section for c in item.choices if c.section is not None)
+
+    # the page breaks that were already in the form and new choices navigate to
+    old_page_breaks = {item.title: matches[i] for i, item in enumerate(new_items)
+                       if isinstance(item, Section) and i in matches}
+    assigned = sorted(title for title in navigated if title in old_page_breaks and title not in created_sections)
+    for title in assigned:
+        fragments.append(join_lines([f'{style.sections}["{title}"]{style.equals}'
+                                     f'items[{old_page_breaks[title]}].asPageBreakItem();\n'], style))
+
+    fragments.extend(item_edits)
+    fragments.extend(additions)
+
+    # new items are added at the end, so they are moved into place like any other
+    # item that changed its position
+    kept = sorted(matches, key=matches.get)
+    for from_index, to_index in _moves(kept + created, list(range(len(new_items)))):
+        fragments.append(join_lines([f'{style.form}.moveItem({from_index}, {to_index});\n'], style))
+
+    lines = [f'var {style.form}{style.equals}FormApp.openById("{form_id}");\n']
+    if len(deleted) > 0 or len(assigned) > 0 or len(section_edits) > 0 or len(item_edits) > 0:
+        lines.append(f'var items{style.equals}{style.form}.getItems();\n')
+
+    if len(created_sections) > 0 or len(navigated) > 0:
+        lines.append(f'var {style.sections}{style.equals}{{}};\n')
+
+    header = 'function updateForm(){\n' if compact else 'function updateForm() {\n'
+    return header + join_lines(lines, style, blank_line=False) + ''.join(fragments) + '}'
@@ -0,0 +1,190 @@
+import os
+from dataclasses import dataclass
+
+from google_forms import Form, Item, ItemKind, PageBreak, Parser, Section, classify_line, include_path, iter_lines
+
+
+@dataclass(slots=True)
+class Diagnostic:
+    # lines and columns start at 1, and point to the stripped text of the line
+    line: int
+    column: int
+    message: str
+    # errors make the script fail or create a different form than intended
+    severity: str = 'error'
+
+    def __str__(self) -> str:
+        return f'{self.line}:{self.column}: {self.severity}: {self.message}'
+
+
+class _Validator:
+    # runs the parser over the lines, keeping an index of the sections and the
+    # position of every node, so each problem is found in the same single pass and
+    # reported where it is. nodes from included files are reported at the include
+    # line
+    def __init__(self, include_dir: str | os.PathLike | None = None):
+        self.parser = Parser(None if include_dir is None else os.fspath(include_dir))
+        self.parser.classify = self._classify
+        self.kind = None
+        self.diagnostics = []
+        self.has_form = False
+        self.main_title_line = None
+        # positions of the sections in the list of sections, and of their ## lines
+        self.page_breaks = {}
+        self.sections = {}
+        # position of the node being read, of its choices and of the last scale
+        self.position = (1, 1)
+        self.choice_positions = []
+        self.scale_position = (1, 1)
+
+    def _classify(self, line: str) -> tuple[str | None, tuple[str | None, ...]]:
+        self.kind, groups = classify_line(line)
+        return self.kind, groups
+
+    def _report(self, position: tuple[int, int], message: str, severity: str = 'error') -> None:
+        self.diagnostics.append(Diagnostic(position[0], position[1], message, severity))
+
+    def _check_item(self, item: Item, position: tuple[int, int], choice_positions: list[tuple[int, int, str]]) -> None:
+        values = {}
+        for choice, (number, column, line) in zip(item.choices, choice_positions):
+            if choice.value in values:
+                self._report((number, column), f'Choice "{choice.value}" of "{item.title}" is repeated from line '
+                                               f'{values[choice.value]}', 'warning')
+
+            values.setdefault(choice.value, number)
+            if choice.section is not None and choice.section not in self.page_breaks:
+                # at the opening bracket of the section
+                if line is not None:
+                    column += line.rfind(' [') + 1
+
+                self._report((number, column), f'Choice "{choice.value}" of "{item.title}" navigates to section '
+                                               f'"{choice.section}", which is not in the list of sections')
+
+        if item.kind in (ItemKind.GRID, ItemKind.CHECKBOX_GRID):
+            if len(item.rows) == 0:
+                self._report(position, f'Grid "{item.title}" has no rows')
+
+            if len(item.columns) == 0:
+                self._report(position, f'Grid "{item.title}" has no columns')
+
+        elif item.kind == ItemKind.SCALE:
+            if item.min_value not in (0, 1):
+                self._report(self.scale_position, f'Scale "{item.title}" must start at 0 or 1, not {item.min_value}')
+
+            if not 2 <= item.max_value <= 10:
+                self._report(self.scale_position,
+                             f'Scale "{item.title}" must end between 2 and 10, not {item.max_value}')
+
+    def _check_node(self, node: Form | PageBreak | Section | Item, position: tuple[int, int],
+                    choice_positions: list[tuple[int, int, str]]) -> None:
+        if isinstance(node, Form):
+            self.has_form = True
+
+        elif isinstance(node, PageBreak):
+            if node.title in self.page_breaks:
+                # sections["title"] is overwritten, so choices go to the last one
+                self._report(position, f'Section "{node.title}" is already in the list of sections, in line '
+                                       f'{self.page_breaks[node.title][0]}')
+
+            else:
+                self.page_breaks[node.title] = position
+
+        elif isinstance(node, Section):
+            if node.title not in self.page_breaks:
+                self._report(position, f'Section "{node.title}" is not in the list of sections of the form')
+
+            elif node.title in self.sections:
+                self._report(position, f'Section "{node.title}" was already defined in line '
+                                       f'{self.sections[node.title][0]}', 'warning')
+
+            self.sections.setdefault(node.title, position)
+
+        else:
+            self._check_item(node, position, choice_positions)
+
+    def check_line(self, line: str, number: int, column: int) -> None:
+        # line must be stripped and not empty, and start at column
+        parser = self.parser
+        include = line.startswith('<!--') and include_path(line) is not None
+        choices = len(parser.choices)
+        position = self.position
+        choice_positions = self.choice_positions
+        self.kind = None
+
+        try:
+            parser.parse_line(line)
+
+        except Exception as e:
+            # the line is skipped, as it changed nothing before failing
+            if self.kind == 'main_title':
+                self._report((number, column), f'The main title was already given in line {self.main_title_line}')
+            else:
+                self._report((number, column), str(e))
+
+            return
+
+        for node in parser.nodes:
+            if include:
+                self._check_node(node, (number, column), [(number, column, None)] * len(node.choices)
+                                 if isinstance(node, Item) else [])
+            elif isinstance(node, PageBreak):
+                self._check_node(node, (number, column), [])
+            else:
+                self._check_node(node, position, choice_positions)
+
+        if len(parser.nodes) > 0 or len(parser.choices) < choices:
+            # the node that was being read is complete, and a new one starts
+            self.choice_positions = []
+            choices = 0
+            if include:
+                self.position = (number, column)
+
+        parser.nodes.clear()
+        self.choice_positions.extend([(number, column, None if include else line)] * (len(parser.choices) - choices))
+
+        if include:
+            # the kind of line is the one of the last line of the included file
+            return
+
+        if self.kind == 'main_title':
+            if self.main_title_line is not None:
+                # the parser only fails when the form was complete, else the title is replaced
+                self._report((number, column), f'The main title was already given in line {self.main_title_line}')
+            else:
+                self.main_title_line = number
+
+        if self.kind in ('title', 'section', 'main_title'):
+            self.position = (number, column)
+
+        elif self.kind == 'scale':
+            self.scale_position = (number, column)
+
+    def finish(self) -> list[Diagnostic]:
+        self.parser.finish()
+        for node in self.parser.nodes:
+            self._check_node(node, self.position, self.choice_positions)
+
+        if not self.has_form:
+            self._report((1, 1), 'The markdown has no main title (#), so there is no form to create')
+
+        for title, position in self.page_breaks.items():
+            if title not in self.sections:
+                self._report(position, f'Section "{title}" is in the list of sections, but never defined with ##',
+                             'warning')
+
+        self.diagnostics.sort(key=lambda diagnostic: (diagnostic.line, diagnostic.column))
+        return self.diagnostics
+
+
+def validate_markdown(markdown_file: str, include_dir: str | os.PathLike | None = None) -> list[Diagnostic]:
+    # finds the problems of the markdown before converting it, which would otherwise
+    # only show when its script runs, sorted by position. runs in a single pass, in
+    # linear time on the length of the markdown. include_dir enables includes, see
+    # parse_nodes
+    validator = _Validator(include_dir)
+    for number, line in enumerate(iter_lines(markdown_file), 1):
+        stripped = line.strip()
+        if len(stripped) > 0:
+            validator.check_line(stripped, number, len(line) - len(line.lstrip()) + 1)
+
+    return validator.finish()